@@ -1,9 +1,3 @@
-from .church import (
-    Address, Personal, Text,
-    Network, Datetime, File, Science,
-    Development, Food, Hardware
-)
-
 __version__ = '0.2.0'
 
 __all__ = [
@@ -21,3 +15,51 @@ __all__ = [
 
 __author__ = 'Lk Geimfari'
 __email__ = 'likid.geimfari@gmail.com'
+
+
+def instrument(enabled=True):
+    """
+    Enable or disable instrumentation of providers: call counts
+    and latencies of methods, see stats(). Also CHURCH_STATS=1.
+    :param enabled: False restores original methods.
+    """
+    from . import metrics
+    if enabled:
+        metrics.enable()
+    else:
+        metrics.disable()
+
+
+def stats():
+    """
+    Get a snapshot of calls of methods and of pull() since
+    the last reset_stats(). Misses and loads of pull() are collected
+    always, hits while instrumentation is enabled.
+    :return: church.metrics.Stats.
+    """
+    from . import metrics
+    return metrics.snapshot()
+
+
+def reset_stats():
+    """
+    Reset statistics of stats().
+    """
+    from . import metrics
+    metrics.reset()
+
+
+def __getattr__(name):
+    # Providers are imported on first access,
+    # so "import church" doesn't load data modules.
+    if name in __all__:
+        from . import church
+        value = getattr(church, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        'module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
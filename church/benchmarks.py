@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import inspect
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from time import perf_counter
+
+from . import __version__, church
+from .cache import CACHE
+from .utils import PATH
+
+__all__ = ['PROVIDERS', 'LOCALES', 'Result', 'Regression', 'discover',
+           'measure', 'run', 'save', 'load', 'compare', 'main']
+
+PROVIDERS = ('Address', 'Personal', 'Text', 'Network', 'Datetime', 'File',
+             'Science', 'Development', 'Food', 'Hardware')
+
+# Providers without locales.
+_NO_LANG = ('Network', 'File', 'Development', 'Hardware')
+
+LOCALES = tuple(sorted(
+    name for name in os.listdir(PATH)
+    if os.path.isdir(os.path.join(PATH, name)) and name != 'other'))
+
+# Batch methods get n, methods with other required parameters
+# get arguments from here.
+BATCH = 100
+_START = 1704067200
+ARGUMENTS = {
+    'events': (_START, _START + 3600),
+    'event_stream': (_START,),
+}
+
+# Metrics of results: ops_per_sec, latencies of warm calls
+# in microseconds, latency of the first call with an empty cache,
+# misses, load time and bytes of pull() in the first call and peak
+# memory of the first call (tracemalloc).
+Result = namedtuple('Result', [
+    'provider', 'lang', 'method', 'args', 'calls', 'ops_per_sec',
+    'p50_us', 'p99_us', 'cold_us', 'pull_misses', 'pull_us', 'pull_bytes',
+    'peak_bytes', 'error'])
+
+# Metric of a method which became worse than in a baseline,
+# ratio is new / old.
+Regression = namedtuple('Regression', 'key metric old new ratio')
+
+# Metrics compared by compare(): True if higher is better.
+_METRICS = (('ops_per_sec', True), ('p50_us', False), ('peak_bytes', False))
+
+
+def _provider(name, lang, seed=0):
+    cls = getattr(church, name)
+    if name in _NO_LANG:
+        return cls(seed=seed)
+    return cls(lang, seed=seed)
+
+
+def _arguments(method):
+    name = method.__name__
+    if name in ARGUMENTS:
+        return ARGUMENTS[name]
+    args = []
+    params = list(inspect.signature(method).parameters.values())
+    for param in params[1:]:
+        if param.default is param.empty and param.kind in (
+                param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            if param.name != 'n':
+                return None
+            args.append(BATCH)
+    return tuple(args)
+
+
+def discover(providers=PROVIDERS, locales=LOCALES, methods=None):
+    """
+    Find public methods of providers.
+    :param providers: Names of providers.
+    :param locales: Locales, providers without locales are used once.
+    :param methods: Regular expression of 'Provider.method' to select.
+    :return: Iterator of tuples (provider, lang, method, args),
+    lang is None for providers without locales.
+    """
+    pattern = re.compile(methods) if methods else None
+    for name in providers:
+        cls = getattr(church, name)
+        for lang in ((None,) if name in _NO_LANG else locales):
+            for method, func in inspect.getmembers(cls, inspect.isfunction):
+                if method.startswith('_') or method == 'bulk':
+                    continue
+                key = '{0}.{1}'.format(name, method)
+                if pattern is not None and not pattern.search(key):
+                    continue
+                args = _arguments(func)
+                if args is not None:
+                    yield name, lang, method, args
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def measure(provider, lang, method, args=(), duration=0.1, min_calls=5):
+    """
+    Measure a method: the first call with an empty cache of data,
+    then warm calls for a duration.
+    :param provider: Name of provider.
+    :param lang: Locale or None.
+    :param method: Name of method.
+    :param args: Positional arguments.
+    :param duration: Time of warm calls in seconds.
+    :param min_calls: Minimal quantity of warm calls.
+    :return: Result.
+    """
+    func = getattr(_provider(provider, lang), method)
+
+    def call():
+        value = func(*args)
+        if inspect.isgenerator(value):
+            value = next(value)
+        return value
+
+    try:
+        CACHE.clear()
+        tracemalloc.start()
+        start = perf_counter()
+        call()
+        cold = perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        stats = CACHE.stats().values()
+
+        latencies = []
+        append = latencies.append
+        stop = perf_counter() + duration
+        while len(latencies) < min_calls or perf_counter() < stop:
+            start = perf_counter()
+            call()
+            append(perf_counter() - start)
+    except Exception as error:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return Result(provider, lang, method, list(args), 0, 0.0, 0.0, 0.0,
+                      0.0, 0, 0.0, 0, 0, repr(error))
+
+    latencies.sort()
+    return Result(
+        provider, lang, method, list(args), len(latencies),
+        len(latencies) / sum(latencies),
+        _percentile(latencies, 0.5) * 1e6, _percentile(latencies, 0.99) * 1e6,
+        cold * 1e6, sum(s.misses for s in stats),
+        sum(s.load_time for s in stats) * 1e6,
+        sum(s.size for s in stats), peak, None)
+
+
+def run(providers=PROVIDERS, locales=LOCALES, methods=None, duration=0.1,
+        progress=None):
+    """
+    Measure all methods found by discover().
+    :param duration: Time of warm calls of a method in seconds.
+    :param progress: Function called with each Result, i.e print.
+    :return: Dict with environment and list of results (as dicts),
+    ready for JSON.
+    """
+    results = []
+    for provider, lang, method, args in discover(providers, locales,
+                                                 methods):
+        result = measure(provider, lang, method, args, duration)
+        if progress is not None:
+            progress(result)
+        results.append(result._asdict())
+    CACHE.clear()
+    return {
+        'church': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'created': int(time.time()),
+        'duration': duration,
+        'results': results,
+    }
+
+
+def save(report, filename):
+    """
+    Write a report of run() to a JSON file.
+    """
+    with open(filename, 'w') as file:
+        json.dump(report, file, indent=1)
+
+
+def load(filename):
+    """
+    Read a report from a JSON file.
+    :return: Dict.
+    """
+    with open(filename) as file:
+        return json.load(file)
+
+
+def _key(result):
+    return '{0}.{1}[{2}]'.format(result['provider'], result['method'],
+                                 result['lang'] or '-')
+
+
+def compare(baseline, report, threshold=0.25):
+    """
+    Find metrics which became worse than in a baseline.
+    Methods which are not in both reports or failed are skipped.
+    :param baseline: Report of run().
+    :param report: Report of run().
+    :param threshold: Tolerated relative change, i.e 0.25 flags
+    methods which are 25% slower.
+    :return: List of Regression, the worst first.
+    """
+    old = {_key(r): r for r in baseline['results'] if not r['error']}
+    regressions = []
+    for result in report['results']:
+        key = _key(result)
+        if result['error'] or key not in old:
+            continue
+        for metric, higher in _METRICS:
+            before, after = old[key][metric], result[metric]
+            if not before or not after:
+                continue
+            ratio = after / before
+            worse = ratio < 1 / (1 + threshold) if higher else \
+                ratio > 1 + threshold
+            if worse:
+                regressions.append(
+                    Regression(key, metric, before, after, ratio))
+    regressions.sort(key=lambda r: max(r.ratio, 1 / r.ratio), reverse=True)
+    return regressions
+
+
+def _print_result(result):
+    key = _key(result._asdict())
+    if result.error:
+        print('{0:<44} error: {1}'.format(key, result.error))
+        return
+    print('{0:<44} {1:>11.0f} ops/s  p50 {2:>9.1f} us  p99 {3:>9.1f} us  '
+          'cold {4:>10.1f} us  peak {5:>9} B'.format(
+              key, result.ops_per_sec, result.p50_us, result.p99_us,
+              result.cold_us, result.peak_bytes))
+
+
+def main(argv=None):
+    """
+    Command line: python -m church.benchmarks run -o results.json,
+    python -m church.benchmarks compare baseline.json results.json.
+    :return: Exit status, 1 if there are regressions.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m church.benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    runner = commands.add_parser('run', help='measure methods')
+    runner.add_argument('-o', '--output', help='JSON file of results')
+    runner.add_argument('-p', '--provider', action='append',
+                        choices=PROVIDERS, help='default is all')
+    runner.add_argument('-l', '--locale', action='append',
+                        choices=LOCALES, help='default is all')
+    runner.add_argument('-m', '--methods',
+                        help='regular expression of Provider.method')
+    runner.add_argument('-d', '--duration', type=float, default=0.1,
+                        help='seconds of warm calls per method')
+    runner.add_argument('-b', '--baseline',
+                        help='JSON file of results to compare with')
+    runner.add_argument('-t', '--threshold', type=float, default=0.25)
+
+    comparer = commands.add_parser('compare',
+                                   help='compare results with a baseline')
+    comparer.add_argument('baseline')
+    comparer.add_argument('results')
+    comparer.add_argument('-t', '--threshold', type=float, default=0.25)
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        report = run(args.provider or PROVIDERS, args.locale or LOCALES,
+                     args.methods, args.duration, _print_result)
+        if args.output:
+            save(report, args.output)
+        if not args.baseline:
+            return 0
+        baseline = load(args.baseline)
+    else:
+        baseline, report = load(args.baseline), load(args.results)
+
+    regressions = compare(baseline, report, args.threshold)
+    for r in regressions:
+        print('{0:<44} {1:<12} {2:>12.1f} -> {3:>12.1f} ({4:.2f}x)'.format(
+            r.key, r.metric, r.old, r.new, r.ratio))
+    print('{0} regressions of {1} methods'.format(
+        len(regressions), len(report['results'])))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+__all__ = ['BlobWriter', 'CHUNK_SIZE']
+
+# Default size of chunks written to a file, in bytes.
+CHUNK_SIZE = 1 << 16
+
+
+class BlobWriter(object):
+    """
+    Writer of documents of an exact size in bytes of UTF-8 text.
+    Text is taken from an endless stream of strings and written in chunks,
+    a document is never kept in memory as a whole. The buffer and text
+    left after a document are reused by the next one.
+    """
+
+    __slots__ = ('_stream', '_buffer', 'chunk_size', 'separator')
+
+    def __init__(self, stream, chunk_size=CHUNK_SIZE, separator='\n\n'):
+        """
+        :param stream: Iterator of strings, i.e paragraphs.
+        :param chunk_size: Max size of written chunks in bytes.
+        :param separator: String written after each string of stream.
+        """
+        if chunk_size < 4:
+            raise ValueError('chunk_size must be at least 4 bytes')
+        self._stream = stream
+        self._buffer = bytearray()
+        self.chunk_size = chunk_size
+        self.separator = separator
+
+    def write(self, file, size):
+        """
+        Write a document to a file.
+        If a character doesn't fit into the end of document,
+        the document is padded with spaces, so it's valid UTF-8.
+        :param file: Binary file-like object.
+        :param size: Size of document in bytes.
+        :return: Size.
+        """
+        if size < 0:
+            raise ValueError('size must be non-negative')
+        buffer = self._buffer
+        stream, separator = self._stream, self.separator
+        remaining = size
+        while remaining:
+            limit = min(self.chunk_size, remaining)
+            while len(buffer) < limit:
+                buffer += (next(stream) + separator).encode('utf-8')
+
+            cut = limit
+            if cut < len(buffer):
+                # Don't split a character, continuation bytes are 10xxxxxx.
+                while cut and buffer[cut] & 0xc0 == 0x80:
+                    cut -= 1
+            # The last chunk is padded up to the size.
+            pad = remaining - cut if limit == remaining else 0
+            with memoryview(buffer) as view, view[:cut] as chunk:
+                file.write(chunk)
+            if pad:
+                file.write(b' ' * pad)
+            del buffer[:cut]
+            remaining -= cut + pad
+        return size
+
+    def __repr__(self):
+        return '<BlobWriter {0} bytes buffered>'.format(len(self._buffer))
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from os.path import join, isdir
+
+# Bundle layout (all integers are little-endian):
+#   MAGIC
+#   number of files                         <I
+#   for every file:
+#     length of name, name                  <H, utf-8
+#     size of the text source               <Q
+#     position of the offset index, count   <I, <I
+#   for every file:
+#     offset index                          (count + 1) * <I
+#     strings                               utf-8, each ends with \n
+MAGIC = b'CHURCH\x00\x03'
+SUFFIX = '.bundle'
+
+# Directories whose lines are kept as they are (only the newline is
+# removed), because whitespace is a part of the data.
+RAW = ('other',)
+
+_COUNT = struct.Struct('<I')
+_ENTRY = struct.Struct('<QII')
+
+
+def read_lines(filename, raw=False):
+    """
+    Read a text data file.
+    :param filename: Path to the file.
+    :param raw: if True then only newlines will be removed,
+    else lines will be stripped and blank lines skipped.
+    :return: List of strings.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        lines = f.read().split('\n')
+
+    if not lines[-1]:
+        lines.pop()
+
+    if raw:
+        return lines
+    return [line.strip() for line in lines if line.strip()]
+
+
+def bundle_path(path, lang):
+    """
+    Get the path of the compiled bundle for a locale directory.
+    :param path: Data directory.
+    :param lang: Locale (directory) name.
+    :return: Path to bundle.
+    """
+    return join(path, lang + SUFFIX)
+
+
+def _sources(path, lang):
+    with os.scandir(join(path, lang)) as entries:
+        sources = [(e.name, e.stat()) for e in entries if e.is_file()]
+    return sorted(sources)
+
+
+def compile_bundle(path, lang, target=None):
+    """
+    Compile all text files of a locale directory into one bundle.
+    :param path: Data directory.
+    :param lang: Locale (directory) name.
+    :param target: Path of the bundle. Default is data/<lang>.bundle.
+    :return: Path to bundle.
+    """
+    target = target or bundle_path(path, lang)
+    raw = lang in RAW
+
+    entries = []
+    for name, st in _sources(path, lang):
+        lines = read_lines(join(path, lang, name), raw=raw)
+        entries.append((name.encode('utf-8'), st,
+                        [(line + '\n').encode('utf-8') for line in lines]))
+
+    position = len(MAGIC) + _COUNT.size + sum(
+        2 + len(name) + _ENTRY.size for name, _, _ in entries)
+
+    table = [MAGIC, _COUNT.pack(len(entries))]
+    data = []
+    for name, st, strings in entries:
+        index = array('I', [0] * (len(strings) + 1))
+        offset = position + index.itemsize * len(index)
+        for i, s in enumerate(strings):
+            index[i] = offset
+            offset += len(s)
+        index[-1] = offset
+        if sys.byteorder != 'little':
+            index.byteswap()
+
+        table.append(struct.pack('<H', len(name)) + name)
+        table.append(_ENTRY.pack(st.st_size, position, len(strings)))
+        data.append(index.tobytes())
+        data.extend(strings)
+        position = offset
+
+    # Write to a temporary file first, so concurrent readers never
+    # see a half-written bundle.
+    tmp = '{0}.{1}.tmp'.format(target, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(b''.join(table))
+        f.write(b''.join(data))
+    os.replace(tmp, target)
+    return target
+
+
+def compile_all(path, target_dir=None):
+    """
+    Compile every directory in data/ into bundles.
+    :param path: Data directory.
+    :param target_dir: Directory for bundles. Default is path.
+    :return: List of paths to bundles.
+    """
+    target_dir = target_dir or path
+    return [compile_bundle(path, lang, bundle_path(target_dir, lang))
+            for lang in sorted(os.listdir(path))
+            if isdir(join(path, lang))]
+
+
+class Dataset(Sequence):
+    """
+    Read-only sequence of strings stored in a bundle.
+    Strings are decoded on access, so picking a random element
+    is one offset lookup and nothing is loaded up front.
+    """
+
+    __slots__ = ('_buffer', '_index')
+
+    def __init__(self, buffer, index):
+        self._buffer = buffer
+        self._index = index
+
+    def __len__(self):
+        return len(self._index) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if i < 0:
+            raise IndexError('dataset index out of range')
+        index = self._index
+        return self._buffer[index[i]:index[i + 1] - 1].decode('utf-8')
+
+    def __repr__(self):
+        return '<Dataset of {0} strings>'.format(len(self))
+
+
+class Bundle(object):
+    """
+    Memory-mapped bundle of one locale directory.
+    """
+
+    def __init__(self, filename):
+        with open(filename, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buf = self._mmap
+        if buf[:len(MAGIC)] != MAGIC:
+            raise ValueError('{0} is not a church bundle'.format(filename))
+
+        pos = len(MAGIC)
+        count, = _COUNT.unpack_from(buf, pos)
+        pos += _COUNT.size
+
+        self.sources = {}
+        self._entries = {}
+        for _ in range(count):
+            size, = struct.unpack_from('<H', buf, pos)
+            name = buf[pos + 2:pos + 2 + size].decode('utf-8')
+            pos += 2 + size
+            src_size, index, length = _ENTRY.unpack_from(buf, pos)
+            pos += _ENTRY.size
+            self.sources[name] = src_size
+            self._entries[name] = (index, length)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __getitem__(self, name):
+        """
+        Decode all strings of a file at once.
+        :param name: File name.
+        :return: List of strings.
+        """
+        position, length = self._entries[name]
+        if not length:
+            return []
+        start, = _COUNT.unpack_from(self._mmap, position)
+        end, = _COUNT.unpack_from(self._mmap, position + _COUNT.size * length)
+        return self._mmap[start:end - 1].decode('utf-8').split('\n')
+
+    def dataset(self, name):
+        """
+        Get strings of a file without decoding them.
+        :param name: File name.
+        :return: Dataset.
+        """
+        position, length = self._entries[name]
+        index = array('I')
+        index.frombytes(
+            self._mmap[position:position + index.itemsize * (length + 1)])
+        if sys.byteorder != 'little':
+            index.byteswap()
+        return Dataset(self._mmap, index)
+
+    def is_stale(self, path, lang, name=None):
+        """
+        Check the bundle against its text sources by names and sizes.
+        Times of files are not compared, installers and copies don't
+        keep them. Run python -m church.bundle after edits which keep
+        the size of a file.
+        :param path: Data directory.
+        :param lang: Locale (directory) name.
+        :param name: if given then only this file will be checked.
+        :return: True if any source was added, removed or changed.
+        """
+        if name is not None:
+            try:
+                st = os.stat(join(path, lang, name))
+            except OSError:
+                return True
+            return self.sources.get(name) != st.st_size
+
+        sources = _sources(path, lang)
+        if len(sources) != len(self.sources):
+            return True
+        for name, st in sources:
+            if self.sources.get(name) != st.st_size:
+                return True
+        return False
+
+
+def open_bundle(filename):
+    """
+    Open a bundle.
+    :param filename: Path to bundle.
+    :return: Bundle or None if it's missing or corrupted.
+    """
+    try:
+        return Bundle(filename)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def is_stale(path, lang):
+    """
+    Check whether the bundle of a locale has to be rebuilt.
+    :param path: Data directory.
+    :param lang: Locale (directory) name.
+    :return: True if bundle is missing or doesn't match its text sources.
+    """
+    bundle = open_bundle(bundle_path(path, lang))
+    return bundle is None or bundle.is_stale(path, lang)
+
+
+def load_bundle(path, lang, build=False):
+    """
+    Open the bundle of a locale.
+    :param path: Data directory.
+    :param lang: Locale (directory) name.
+    :param build: if True then a missing or stale bundle is rebuilt.
+    Default is False: data is read from text files then, so nothing
+    is written into an installed package.
+    :return: Bundle or None if there is no usable bundle.
+    """
+    if not isdir(join(path, lang)):
+        return None
+
+    filename = bundle_path(path, lang)
+    bundle = open_bundle(filename)
+    if bundle is not None and not bundle.is_stale(path, lang):
+        return bundle
+
+    if not build:
+        return None
+    try:
+        compile_bundle(path, lang, filename)
+    except OSError:
+        # Read-only installation, text files will be used.
+        return None
+    return open_bundle(filename)
+
+
+if __name__ == '__main__':
+    from .utils import PATH
+
+    for _bundle in compile_all(PATH):
+        print(_bundle)
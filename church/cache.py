@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import os
+import sys
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+__all__ = ['DataCache', 'CacheStats', 'CACHE', 'sizeof']
+
+# Default budget in bytes, e.g. CHURCH_CACHE_BYTES=4000000.
+# Without it data is never evicted.
+ENV_BUDGET = 'CHURCH_CACHE_BYTES'
+
+# loaded is the total of bytes of all loads, including reloads
+# of evicted data.
+CacheStats = namedtuple('CacheStats',
+                        'hits misses evictions load_time size resident '
+                        'loaded')
+
+
+def sizeof(obj):
+    """
+    Estimate memory used by data: strings, numbers and containers
+    of them, and objects with __slots__. Shared objects are counted once.
+    :param obj: Object.
+    :return: Size in bytes.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        if hasattr(obj, '__slots__'):
+            stack.extend(getattr(obj, name) for name in obj.__slots__
+                         if hasattr(obj, name))
+    return size
+
+
+class _Entry(object):
+    __slots__ = ('value', 'hits', 'misses', 'evictions', 'load_time', 'size',
+                 'loaded')
+
+    def __init__(self):
+        self.value = None
+        self.hits = self.misses = self.evictions = 0
+        self.load_time = 0.0
+        self.size = self.loaded = 0
+
+
+class DataCache(object):
+    """
+    Cache of loaded data files, limited by a budget in bytes.
+    Least recently used data is evicted when the budget is exceeded.
+    The cache can be shared by threads.
+    Hits are counted only with a budget or count_hits (enabled by
+    church.instrument()), else a hit is a lookup in a dict.
+    """
+
+    def __init__(self, budget=None):
+        """
+        :param budget: Max size of resident data in bytes.
+        Default is no limit.
+        """
+        self._data = OrderedDict()
+        # Values of resident data for hits without the lock, only
+        # when order of use and hits aren't tracked, else empty.
+        self._values = {}
+        self._stats = {}
+        self._budget = budget
+        self._count_hits = False
+        self.size = 0
+        # Guards data, statistics and size. Loads run without it,
+        # loaders may use other cached data (table() uses pull()).
+        self._lock = Lock()
+
+    @property
+    def budget(self):
+        return self._budget
+
+    @budget.setter
+    def budget(self, value):
+        with self._lock:
+            self._budget = value
+            self._evict()
+            self._sync()
+
+    @property
+    def count_hits(self):
+        return self._count_hits
+
+    @count_hits.setter
+    def count_hits(self, value):
+        with self._lock:
+            self._count_hits = bool(value)
+            self._sync()
+
+    def _untracked(self):
+        return self._budget is None and not self._count_hits
+
+    def _sync(self):
+        # Called with the lock held. The dict is shared with
+        # functions made by cached(), so it's never replaced.
+        values = self._values
+        values.clear()
+        if self._untracked():
+            values.update((key, entry.value)
+                          for key, entry in self._data.items())
+
+    def cached(self, kind):
+        """
+        Decorator for functions that load data, i.e pull(filename, lang).
+        Data is kept as (lang, filename, kind).
+        :param kind: Kind of data. Example: 'table'
+        :return: Decorator.
+        """
+        def decorator(load):
+            data, values, lock = self._data, self._values, self._lock
+
+            @wraps(load)
+            def get(filename, lang='en_us'):
+                key = (lang, filename, kind)
+                value = values.get(key)
+                if value is not None:
+                    return value
+                if self._budget is None:
+                    # Nothing is evicted, hits are counted without
+                    # the lock, so some may be lost when threads race.
+                    entry = data.get(key)
+                    if entry is not None:
+                        value = entry.value
+                        if value is not None:
+                            entry.hits += 1
+                            return value
+                with lock:
+                    entry = data.get(key)
+                    if entry is not None:
+                        entry.hits += 1
+                        # Without a budget nothing is evicted,
+                        # so the order of use isn't tracked.
+                        if self._budget is not None:
+                            data.move_to_end(key)
+                        return entry.value
+                return self._load(key, load, filename, lang)
+
+            return get
+
+        return decorator
+
+    def _load(self, key, load, *args):
+        start = perf_counter()
+        value = load(*args)
+        elapsed = perf_counter() - start
+        size = sizeof(value)
+
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = _Entry()
+            entry.misses += 1
+            entry.load_time += elapsed
+            entry.loaded += size
+            if key in self._data:
+                # Another thread has loaded it meanwhile,
+                # its data is shared and counted once.
+                if self._budget is not None:
+                    self._data.move_to_end(key)
+                return entry.value
+
+            entry.value = value
+            entry.size = size
+            self._data[key] = entry
+            self.size += size
+            self._evict(keep=key)
+            if self._untracked():
+                self._values[key] = value
+        return value
+
+    def _evict(self, keep=None):
+        # Called with the lock held.
+        if self._budget is None:
+            return
+        # The data being returned is kept even if it exceeds the budget,
+        # it's the last one, so it's never the least recently used
+        # unless it's the only one.
+        data = self._data
+        while self.size > self._budget and data:
+            key = next(iter(data))
+            if key == keep:
+                break
+            entry = data.pop(key)
+            entry.value = None
+            entry.evictions += 1
+            self.size -= entry.size
+
+    def stats(self):
+        """
+        Get statistics of all data ever loaded.
+        :return: Dict {(lang, filename, kind): CacheStats}.
+        """
+        with self._lock:
+            return {key: CacheStats(s.hits, s.misses, s.evictions,
+                                    s.load_time,
+                                    s.size if key in self._data else 0,
+                                    key in self._data, s.loaded)
+                    for key, s in self._stats.items()}
+
+    def clear(self):
+        """
+        Remove all data and statistics.
+        """
+        with self._lock:
+            for entry in self._data.values():
+                entry.value = None
+            self._values.clear()
+            self._data.clear()
+            self._stats.clear()
+            self.size = 0
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '<DataCache {0} entries, {1} of {2} bytes>'.format(
+            len(self), self.size, self._budget)
+
+
+def _env_budget():
+    value = os.environ.get(ENV_BUDGET)
+    return int(value) if value else None
+
+
+# Cache of church.utils.pull() and church.utils.table().
+CACHE = DataCache(budget=_env_budget())
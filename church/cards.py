@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from itertools import accumulate
+
+__all__ = ['NETWORKS', 'Card', 'Scheme', 'scheme', 'iin', 'iin_table',
+           'numbers', 'luhn_digit', 'luhn_valid', 'format_number']
+
+# Card of a payment sandbox.
+Card = namedtuple('Card', 'network number expiration_date cvv')
+
+# Issuing network: ranges of 6-digit issuer identification numbers
+# (IIN) as (first, last), length of numbers, length of CVV/CID
+# and groups of digits in the printed number.
+Scheme = namedtuple('Scheme', 'name ranges length cvv_length groups')
+
+
+def _scheme(name, prefixes, length=16, cvv_length=3, groups=(4, 4, 4, 4)):
+    # Prefixes as (first, last) of any length, i.e (51, 55).
+    ranges = []
+    for first, last in prefixes:
+        scale = 10 ** (6 - len(str(first)))
+        ranges.append((first * scale, (last + 1) * scale - 1))
+    return Scheme(name, tuple(ranges), length, cvv_length, groups)
+
+
+# Read more: https://en.wikipedia.org/wiki/Payment_card_number
+NETWORKS = {
+    'visa': _scheme('visa', [(4, 4)]),
+    'mastercard': _scheme('mastercard', [(51, 55), (2221, 2720)]),
+    'amex': _scheme('amex', [(34, 34), (37, 37)], 15, 4, (4, 6, 5)),
+    'mir': _scheme('mir', [(2200, 2204)]),
+    'discover': _scheme('discover', [(6011, 6011), (644, 649), (65, 65)]),
+    'jcb': _scheme('jcb', [(3528, 3589)]),
+    'diners': _scheme('diners', [(300, 305), (36, 36), (38, 39)], 14,
+                      groups=(4, 6, 4)),
+    'unionpay': _scheme('unionpay', [(62, 62)]),
+    'maestro': _scheme('maestro', [(5018, 5018), (5020, 5020),
+                                   (5038, 5038), (5893, 5893),
+                                   (6304, 6304), (6759, 6759),
+                                   (6761, 6763)]),
+}
+
+_ALIASES = {
+    'mc': 'mastercard',
+    'master_card': 'mastercard',
+    'american_express': 'amex',
+    'diners_club': 'diners',
+    'union_pay': 'unionpay',
+}
+
+# Sum of digits of doubled digits.
+_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+_DOUBLE = str.maketrans('0123456789', ''.join(map(str, _DOUBLED)))
+
+
+def scheme(name):
+    """
+    Get an issuing network by name.
+    :param name: Name of network or alias, i.e 'visa', 'mc', 'amex'.
+    :return: Scheme.
+    :raises KeyError: if network is unknown.
+    """
+    key = name.lower().replace(' ', '_')
+    key = _ALIASES.get(key, key)
+    if key not in NETWORKS:
+        raise KeyError('Unknown card network: {0!r}, use one of '
+                       '{1}'.format(name, ', '.join(NETWORKS)))
+    return NETWORKS[key]
+
+
+@lru_cache(maxsize=None)
+def iin_table(network):
+    """
+    Get cumulative sizes of IIN ranges of a network,
+    IINs are drawn uniformly from all ranges.
+    :param network: Scheme.
+    :return: Tuple (list of cumulative sizes, total size).
+    """
+    sizes = [last - first + 1 for first, last in network.ranges]
+    cumulative = list(accumulate(sizes))
+    return cumulative, cumulative[-1]
+
+
+def iin(network, index):
+    """
+    Get IIN of a network by its index in all ranges.
+    :param network: Scheme.
+    :param index: Index in range(total size of ranges).
+    :return: 6-digit IIN.
+    """
+    cumulative, _ = iin_table(network)
+    i = bisect_right(cumulative, index)
+    first = network.ranges[i][0]
+    return first + index - (cumulative[i - 1] if i else 0)
+
+
+def luhn_digit(payload):
+    """
+    Compute the check digit of the Luhn algorithm.
+    :param payload: Digits without check digit.
+    :return: Check digit as string.
+    """
+    # Digits to double are every second one from the right.
+    total = sum(map(int, payload[-1::-2].translate(_DOUBLE)))
+    total += sum(map(int, payload[-2::-2]))
+    return str(-total % 10)
+
+
+def luhn_valid(number):
+    """
+    Check a number with the Luhn algorithm.
+    :param number: Digits, spaces and dashes are ignored.
+    :return: True if check digit is valid.
+    """
+    number = number.replace(' ', '').replace('-', '')
+    if not number.isdigit():
+        return False
+    return luhn_digit(number[:-1]) == number[-1]
+
+
+def numbers(rnd, network, n):
+    """
+    Generate n valid card numbers of a network.
+    :param rnd: Instance of random.Random.
+    :param network: Scheme.
+    :param n: Quantity of values.
+    :return: List of numbers as strings of digits.
+    """
+    cumulative, total = iin_table(network)
+    ranges = network.ranges
+    # Digits between IIN and check digit.
+    size = network.length - 7
+    pattern = '{0}{1:0%dd}' % size
+    result = []
+    for index, serial in zip(rnd.choices(range(total), k=n),
+                             rnd.choices(range(10 ** size), k=n)):
+        # iin() inlined.
+        i = bisect_right(cumulative, index)
+        first = ranges[i][0] + index - (cumulative[i - 1] if i else 0)
+        payload = pattern.format(first, serial)
+        result.append(payload + luhn_digit(payload))
+    return result
+
+
+def format_number(number, groups):
+    """
+    Split a number into groups of digits.
+    :param number: Digits.
+    :param groups: Lengths of groups, i.e (4, 6, 5).
+    :return: Number. Example: 3782 822463 10005
+    """
+    parts, start = [], 0
+    for size in groups:
+        parts.append(number[start:start + size])
+        start += size
+    return ' '.join(parts)
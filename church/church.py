@@ -4,11 +4,44 @@
 :software_license: MIT, see LICENSE for more details.
 """
 
-from datetime import date
-from random import choice, sample, randint, uniform
-from string import digits, ascii_letters
+import io
+from collections import namedtuple
+from os import environ
+from random import Random
 
-from .utils import pull
+from .utils import Weighted, pull, table
+
+# Subsystems (church.blob, church.cards, church.events, church.hashing,
+# church.markov, church.subnets and others) are imported by methods
+# which use them, so importing providers stays cheap. NumPy is
+# imported only by methods with use_numpy.
+
+# Same as string.digits and string.ascii_letters, the module
+# string is not imported because it imports re.
+digits = '0123456789'
+ascii_letters = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Length of salts of hashed passwords, 22 letters and digits are
+# more than 128 bits.
+SALT_LENGTH = 22
+
+# Default range of random instants, 2000-01-01 - 2035-12-31 (UTC).
+START, STOP = 946684800, 2082758400
+
+# Default current year of Personal: years of birth are counted from
+# it, so the same seed gives the same data in any year.
+YEAR = 2024
+
+# Coherent record of a person, see Personal.profile().
+Profile = namedtuple('Profile', 'gender name surname username email age '
+                                'telephone nationality profession')
+
+# Formats of usernames of profiles: {0} - name, {1} - surname,
+# {2} - initial, {3} - year of birth, {4} - two digits of year of birth.
+USERNAME_FORMATS = (
+    '{0}.{1}', '{0}_{1}', '{0}{1}', '{2}{1}', '{1}.{0}',
+    '{0}.{1}{4}', '{0}{1}{3}', '{2}.{1}{4}', '{0}{4}', '{1}{3}',
+)
 
 # pull - is internal function,
 # please do not use this function outside the module 'church'.
@@ -21,36 +54,140 @@ __all__ = ['Address', 'Personal',
            ]
 
 
-class Address(object):
+def _random(seed):
+    """
+    Get the generator of a seed.
+    :param seed: Seed (int, str, bytes) or instance of random.Random.
+    :return: The given instance or a new random.Random.
+    """
+    if isinstance(seed, Random):
+        return seed
+    return Random(seed)
+
+
+class BaseProvider(object):
+    """
+    Base class for all providers.
+    """
+
+    # Batch counterparts of methods, i.e. methods that take quantity
+    # of values as the first argument: {'city': 'cities'}.
+    _batch = {}
+
+    def __init__(self, seed=None):
+        """
+        :param seed: Seed (int, str, bytes) or instance of random.Random.
+        All random values of provider are taken from this generator,
+        so the same seed gives the same data. Default is a random seed.
+        """
+        self.random = _random(seed)
+
+    def bulk(self, method, n, *args, **kwargs):
+        """
+        Call a method of provider n times.
+        Batch counterpart of the method is used when it exists.
+        :param method: Name of method. Example: 'full_name'
+        :param n: Quantity of values.
+        :return: List of values.
+        """
+        batch = self._batch.get(method)
+        if batch is not None:
+            return getattr(self, batch)(n, *args, **kwargs)
+
+        func = getattr(self, method)
+        return [func(*args, **kwargs) for _ in range(n)]
+
+    def _choice(self, filename, lang='en_us'):
+        """
+        Get a random line of a data file, weighted if the file has weights.
+        :param filename: Name of file.
+        :param lang: Locale.
+        :return: Line.
+        """
+        data = pull(filename, lang)
+        if data.__class__ is Weighted:
+            return data.sample(self.random)
+        return self.random.choice(data)
+
+    def _choices(self, filename, lang='en_us', n=1):
+        """
+        Get n random lines of a data file, see _choice().
+        :return: List of lines.
+        """
+        data = pull(filename, lang)
+        if data.__class__ is Weighted:
+            return data.samples(self.random, n)
+        return self.random.choices(data, k=n)
+
+
+class Address(BaseProvider):
     """
     Class for generate fake address data.
     """
 
-    def __init__(self, lang='en_us'):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'street_number': 'street_numbers',
+        'street_name': 'street_names',
+        'street_suffix': 'street_suffixes',
+        'address': 'addresses',
+        'state': 'states',
+        'postal_code': 'postal_codes',
+        'country': 'countries',
+        'city': 'cities'
+    }
+
+    def __init__(self, lang='en_us', seed=None):
+        super().__init__(seed)
         self.lang = lang.lower()
 
-    @staticmethod
-    def street_number():
+    def street_number(self):
         """
         Generate a random street number.
         :return: Street number.
         """
-        number = sample(digits, int(choice(digits[1:4])))
+        number = self.random.sample(
+            digits, int(self.random.choice(digits[1:4])))
         return ''.join(number)
 
+    def street_numbers(self, n):
+        """
+        Generate n random street numbers.
+        :param n: Quantity of values.
+        :return: List of street numbers.
+        """
+        return [''.join(self.random.sample(digits, k))
+                for k in self.random.choices((1, 2, 3), k=n)]
+
     def street_name(self):
         """
         Get a random street name.
         :return: Street name.
         """
-        return choice(pull('street', self.lang)).strip()
+        return self._choice('street', self.lang)
+
+    def street_names(self, n):
+        """
+        Get n random street names.
+        :param n: Quantity of values.
+        :return: List of street names.
+        """
+        return self._choices('street', self.lang, n=n)
 
     def street_suffix(self):
         """
         Get a random street suffix.
         :return: Street suffix. Example: Street.
         """
-        return choice(pull('street_suffix', self.lang)).strip()
+        return self._choice('street_suffix', self.lang)
+
+    def street_suffixes(self, n):
+        """
+        Get n random street suffixes.
+        :param n: Quantity of values.
+        :return: List of street suffixes.
+        """
+        return self._choices('street_suffix', self.lang, n=n)
 
     def address(self):
         """
@@ -70,20 +207,49 @@ class Address(object):
                 self.street_suffix()
             )
 
+    def addresses(self, n):
+        """
+        Get n random full addresses.
+        :param n: Quantity of values.
+        :return: List of full addresses.
+        """
+        parts = zip(self.street_numbers(n),
+                    self.street_names(n),
+                    self.street_suffixes(n))
+        if self.lang == 'ru_ru':
+            return ['{2} {1} {0}'.format(*p) for p in parts]
+        return ['{0} {1} {2}'.format(*p) for p in parts]
+
     def state(self):
         """
         Get a random states or subject of country.
         For locale 'ru_ru' always will be getting subject of Russia.
         :return: State of current country. Example (en_us): Alabama
         """
-        return choice(pull('states', self.lang)).strip()
+        return self._choice('states', self.lang)
+
+    def states(self, n):
+        """
+        Get n random states or subjects of country.
+        :param n: Quantity of values.
+        :return: List of states.
+        """
+        return self._choices('states', self.lang, n=n)
 
     def postal_code(self):
         """
         Get a random (real) postal code.
         :return: postal code. Example: 389213
         """
-        return choice(pull('postal_codes', self.lang)).strip()
+        return self._choice('postal_codes', self.lang)
+
+    def postal_codes(self, n):
+        """
+        Get n random (real) postal codes.
+        :param n: Quantity of values.
+        :return: List of postal codes.
+        """
+        return self._choices('postal_codes', self.lang, n=n)
 
     def country(self, only_iso_code=False):
         """
@@ -91,47 +257,168 @@ class Address(object):
         :param only_iso_code: Return only ISO code of country.
         :return: Country. Example: Russia
         """
-        country_name = choice(pull('countries', self.lang)).split('|')
+        countries = table('countries', self.lang).columns
+        if only_iso_code:
+            return self.random.choice(countries.iso_code)
+        return self.random.choice(countries.name)
+
+    def countries(self, n, only_iso_code=False):
+        """
+        Get n random countries.
+        :param n: Quantity of values.
+        :param only_iso_code: Return only ISO codes of countries.
+        :return: List of countries.
+        """
+        countries = table('countries', self.lang).columns
         if only_iso_code:
-            return country_name[0].strip()
-        return country_name[1].strip()
+            return self.random.choices(countries.iso_code, k=n)
+        return self.random.choices(countries.name, k=n)
+
+    def country_record(self):
+        """
+        Get a random country with its ISO code.
+        :return: Country. Example: Country(iso_code='RU', name='Russia')
+        """
+        return self.random.choice(table('countries', self.lang).records)
 
     def city(self):
         """
         Get a random name of city.
         :return: City name. Example (for ru_ru): Saint Petersburg
         """
-        return choice(pull('cities', self.lang)).strip()
+        return self._choice('cities', self.lang)
+
+    def cities(self, n):
+        """
+        Get n random names of cities.
+        :param n: Quantity of values.
+        :return: List of city names.
+        """
+        return self._choices('cities', self.lang, n=n)
 
 
-class Text(object):
+class Text(BaseProvider):
     """
     Class for generate text data, i.e text, lorem ipsum and another.
     """
 
-    def __init__(self, lang='en_us'):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'sentence': 'sentences',
+        'swear_word': 'swear_words',
+        'quote_from_movie': 'quotes_from_movie',
+        'currency_iso': 'currency_isos',
+        'color': 'colors',
+        'hex_color': 'hex_colors',
+        'company_type': 'company_types',
+        'company': 'companies',
+        'copyright': 'copyrights',
+        'emoji': 'emojis',
+        'word': 'words',
+        'paragraph': 'paragraphs',
+        'blob': 'blobs'
+    }
+
+    def __init__(self, lang='en_us', seed=None):
+        super().__init__(seed)
         self.lang = lang.lower()
 
     def lorem_ipsum(self, quantity=5):
         """
         Get random strings. Not only lorem ipsum.
+        Sentences are taken as they are, see paragraph() for new ones.
         :param quantity: Quantity of sentence.
         :return: Text.
         """
         if not isinstance(quantity, int):
             raise TypeError('lorem_ipsum takes only integer type')
         else:
-            text = ''
-            for _ in range(quantity):
-                text += choice(pull('text', self.lang)).replace('\n', ' ')
-            return text.strip()
+            return ' '.join(self._choices('text', self.lang, n=quantity))
+
+    def paragraph(self, quantity=5, mix=0.1):
+        """
+        Generate a paragraph with a Markov chain learned from
+        sentences of text and words of the locale (see church.markov).
+        :param quantity: Quantity of sentences.
+        :param mix: Share of words replaced by random words.
+        :return: Text.
+        """
+        from .markov import chain
+        return ' '.join(chain('text', self.lang).sentences(
+            self.random, quantity, mix))
+
+    def paragraphs(self, n, quantity=5, mix=0.1):
+        """
+        Generate n paragraphs, see paragraph().
+        :param n: Quantity of values.
+        :return: List of paragraphs.
+        """
+        stream = self.text_stream(quantity, mix)
+        return [next(stream) for _ in range(n)]
+
+    def text_stream(self, quantity=5, mix=0.1):
+        """
+        Endless stream of paragraphs, see paragraph().
+        :param quantity: Quantity of sentences in a paragraph.
+        :return: Iterator of paragraphs.
+        """
+        from .markov import chain
+        return chain('text', self.lang).paragraphs(self.random, quantity, mix)
+
+    def blob(self, size=1024, file=None, chunk_size=None, mix=0.1):
+        """
+        Generate exactly size bytes of UTF-8 text of the locale,
+        made by paragraph(). See church.blob.BlobWriter for writing
+        many files with one buffer.
+        :param size: Size in bytes.
+        :param file: Binary file-like object to write in chunks.
+        Default is to return bytes.
+        :param chunk_size: Max size of written chunks in bytes.
+        Default is church.blob.CHUNK_SIZE.
+        :param mix: Share of words replaced by random words.
+        :return: Bytes or size, if file is given.
+        """
+        from .blob import CHUNK_SIZE, BlobWriter
+        writer = BlobWriter(self.text_stream(mix=mix),
+                            chunk_size or CHUNK_SIZE)
+        if file is not None:
+            return writer.write(file, size)
+        buffer = io.BytesIO()
+        writer.write(buffer, size)
+        return buffer.getvalue()
+
+    def blobs(self, n, size=1024, chunk_size=None, mix=0.1):
+        """
+        Generate n documents of exactly size bytes, see blob().
+        :param n: Quantity of values.
+        :return: List of bytes.
+        """
+        from .blob import CHUNK_SIZE, BlobWriter
+        writer = BlobWriter(self.text_stream(mix=mix),
+                            chunk_size or CHUNK_SIZE)
+        buffer = io.BytesIO()
+        result = []
+        for _ in range(n):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.write(buffer, size)
+            result.append(buffer.getvalue())
+        return result
 
     def sentence(self):
         """
         Get a random sentence from text.
         :return: Sentence.
         """
-        return self.lorem_ipsum(quantity=1)
+        return self._choice('text', self.lang)
+
+    def sentences(self, n):
+        """
+        Get n random sentences from text.
+        :param n: Quantity of values.
+        :return: List of sentences.
+        """
+        return self._choices('text', self.lang, n=n)
 
     def title(self):
         """
@@ -150,10 +437,7 @@ class Text(object):
         if not isinstance(quantity, int):
             raise TypeError('words takes only integer type')
         else:
-            words_list = []
-            for _ in range(quantity):
-                words_list.append(choice(pull('words', self.lang)).strip())
-            return words_list
+            return self._choices('words', self.lang, n=quantity)
 
     def word(self):
         """
@@ -167,76 +451,138 @@ class Text(object):
         Get a random swear word.
         :return: Swear word.
         """
-        _word = choice(pull('swear_words', self.lang))
-        return _word.strip()
+        _word = self._choice('swear_words', self.lang)
+        return _word
 
-    @staticmethod
-    def naughty_strings():
+    def swear_words(self, n):
+        """
+        Get n random swear words.
+        :param n: Quantity of values.
+        :return: List of swear words.
+        """
+        return self._choices('swear_words', self.lang, n=n)
+
+    def naughty_strings(self):
         """
         Get a random naughty string form file.
         Authors of big-list-of-naughty-strings is Max Woolf and contributors.
         Thank you to all who have contributed in big-list-of-naughty-strings.
         Repository: https://github.com/minimaxir/big-list-of-naughty-strings
+        See church.fuzz for categories and mutations of naughty strings.
         :return: The list of naughty strings.
         """
-        import os.path as op
-        path = op.abspath(op.join(op.dirname(__file__), 'data'))
-
-        with open(op.join(path + '/other', 'naughty_strings'), 'r') as f:
-            naughty_list = [x.strip(u'\n') for x in f.readlines()]
-
-        return naughty_list
+        return list(pull('naughty_strings', 'other'))
 
     def quote_from_movie(self):
         """
         Get a random quotes from movie.
         :return: Quote from movie. Example: "Bond... James Bond."
         """
-        return choice(pull('quotes', self.lang)).strip()
+        return self._choice('quotes', self.lang)
+
+    def quotes_from_movie(self, n):
+        """
+        Get n random quotes from movie.
+        :param n: Quantity of values.
+        :return: List of quotes.
+        """
+        return self._choices('quotes', self.lang, n=n)
 
-    @staticmethod
-    def currency_iso():
+    def currency_iso(self):
         """
         Get a currency code. ISO 4217 format.
         :return: Currency code. Example: RUR
         """
-        return choice(pull('currency', 'en_us')).strip()
+        return self._choice('currency', 'en_us')
+
+    def currency_isos(self, n):
+        """
+        Get n currency codes, see currency_iso().
+        :param n: Quantity of values.
+        :return: List of currency codes.
+        """
+        return self._choices('currency', 'en_us', n=n)
 
     def color(self):
         """
         Get a random name of color.
         :return: Color name. Example: Red
         """
-        return choice(pull('colors', self.lang)).strip()
+        return self._choice('colors', self.lang)
+
+    def colors(self, n):
+        """
+        Get n random names of colors.
+        :param n: Quantity of values.
+        :return: List of color names.
+        """
+        return self._choices('colors', self.lang, n=n)
 
-    @staticmethod
-    def hex_color():
+    def hex_color(self):
         """
         Generate a hex color.
         :return: Hex color code. Example: #D8346B
         """
         letters = '0123456789ABCDEF'
-        color_code = '#' + ''.join(sample(letters, 6))
+        color_code = '#' + ''.join(self.random.sample(letters, 6))
         return color_code
 
+    def hex_colors(self, n):
+        """
+        Generate n hex colors.
+        :param n: Quantity of values.
+        :return: List of hex color codes.
+        """
+        letters = '0123456789ABCDEF'
+        return ['#' + ''.join(self.random.sample(letters, 6))
+                for _ in range(n)]
+
     def company_type(self, abbreviated=False):
         """
         Get a random company type.
         :param abbreviated: if True then abbreviated company type.
         :return: Company type. Example: Inc.
         """
-        _type = choice(pull('company_type', self.lang)).split('|')
+        types = table('company_type', self.lang).columns
+        if abbreviated:
+            return self.random.choice(types.abbr)
+        return self.random.choice(types.title)
+
+    def company_types(self, n, abbreviated=False):
+        """
+        Get n random company types.
+        :param n: Quantity of values.
+        :param abbreviated: if True then abbreviated company types.
+        :return: List of company types.
+        """
+        types = table('company_type', self.lang).columns
         if abbreviated:
-            return _type[1].strip()
-        return _type[0].strip()
+            return self.random.choices(types.abbr, k=n)
+        return self.random.choices(types.title, k=n)
+
+    def company_type_record(self):
+        """
+        Get a random company type with its abbreviation.
+        :return: Company type.
+        Example: CompanyType(title='Incorporated', abbr='Inc.')
+        """
+        return self.random.choice(table('company_type', self.lang).records)
 
     def company(self):
         """
         Get a random company name.
         :return: Company name. Example: Gamma Systems
         """
-        company = choice(pull('company', self.lang))
-        return company.strip()
+        company = self._choice('company', self.lang)
+        return company
+
+    def companies(self, n):
+        """
+        Get n random company names.
+        :param n: Quantity of values.
+        :return: List of company names.
+        """
+        return self._choices('company', self.lang, n=n)
 
     def copyright(self, from_=1990, to_=2016, without_date=False):
         """
@@ -247,45 +593,138 @@ class Text(object):
         copyright without date.
         :return: Copyright of company. Example: © 1990-2016 Komercia, Inc.
         """
-        founded = randint(int(from_), int(to_))
+        founded = self.random.randint(int(from_), int(to_))
         company = self.company()
         company_type = self.company_type(abbreviated=True)
         if without_date:
             return '© {}, {}'.format(company, company_type)
-        return '© {0}-{1} {2}, {3}'.format(founded, to_, company, company_type)
+        return '© {0}-{1} {2}, {3}'.format(founded, to_, company,
+                                           company_type)
+
+    def copyrights(self, n, from_=1990, to_=2016, without_date=False):
+        """
+        Generate n random copyrights.
+        :param n: Quantity of values.
+        :param from_: foundation date
+        :param to_: current date
+        :param without_date: if True then will be returned
+        copyrights without date.
+        :return: List of copyrights.
+        """
+        parts = zip(self.companies(n),
+                    self.company_types(n, abbreviated=True))
+        if without_date:
+            return ['© {}, {}'.format(*p) for p in parts]
+        years = self.random.choices(range(int(from_), int(to_) + 1), k=n)
+        return ['© {0}-{1} {2}, {3}'.format(year, to_, *p)
+                for year, p in zip(years, parts)]
 
-    @staticmethod
-    def emoji():
+    def emoji(self):
         """
         Get a random emoji shortcut code.
         :return: Emoji code. Example: :kissing:
         """
-        _shortcut = choice(pull('emoji', 'en_us'))
-        return _shortcut.strip()
+        _shortcut = self._choice('emoji', 'en_us')
+        return _shortcut
+
+    def emojis(self, n):
+        """
+        Get n random emoji shortcut codes.
+        :param n: Quantity of values.
+        :return: List of emoji codes.
+        """
+        return self._choices('emoji', 'en_us', n=n)
 
-    @staticmethod
-    def image_placeholder(width='400', height='300'):
+    def image_placeholder(self, width='400', height='300'):
         url = 'http://placehold.it/{0}x{1}'.format(width, height)
         return url
 
 
-class Personal(object):
+class Personal(BaseProvider):
     """
     Class for generate personal data, i.e names, surnames, age and another.
     """
 
-    def __init__(self, lang='en_us'):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'age': 'ages',
+        'name': 'names',
+        'surname': 'surnames',
+        'full_name': 'full_names',
+        'username': 'usernames',
+        'password': 'passwords',
+        'email': 'emails',
+        'home_page': 'home_pages',
+        'subreddit': 'subreddits',
+        'cvv': 'cvvs',
+        'credit_card_number': 'credit_card_numbers',
+        'credit_card': 'credit_cards',
+        'cid': 'cids',
+        'gender': 'genders',
+        'height': 'heights',
+        'weight': 'weights',
+        'sexual_orientation': 'sexual_orientations',
+        'profession': 'professions',
+        'worldview': 'worldviews',
+        'nationality': 'nationalities',
+        'university': 'universities',
+        'qualification': 'qualifications',
+        'language': 'languages',
+        'favorite_movie': 'favorite_movies',
+        'telephone': 'telephones',
+        'profile': 'profiles'
+    }
+
+    def __init__(self, lang='en_us', seed=None, year=YEAR):
+        """
+        :param lang: Locale.
+        :param seed: Seed or instance of random.Random.
+        :param year: Current year of persons and cards, i.e
+        date.today().year. Default is church.church.YEAR.
+        """
+        super().__init__(seed)
         self.lang = lang.lower()
-
-    @staticmethod
-    def age(minimum=16, maximum=66):
+        self.year = int(year)
+        # Streams of unique usernames and emails, see usernames().
+        self._unique = {}
+
+    def _unique_stream(self, kind):
+        # One stream for both genders: some names are in both lists,
+        # so streams per gender would give the same values.
+        stream = self._unique.get(kind)
+        if stream is None:
+            names = {n.replace(' ', '_').lower()
+                     for filename in ('m_names', 'f_names')
+                     for n in pull(filename)}
+            sequences = [
+                sorted(names),
+                [str(number) for number in range(2, 10000)]
+            ]
+            if kind == 'email':
+                sequences.append(sorted(set(pull('email', 'en_us'))))
+            from .unique import UniqueStream
+            stream = UniqueStream(sequences, self.random.getrandbits(64))
+            self._unique[kind] = stream
+        return stream
+
+    def age(self, minimum=16, maximum=66):
         """
         Get a random integer value.
         :param maximum: max age
         :param minimum: min age
         :return: Random integer from minimum=16 to maximum=66
         """
-        return randint(int(minimum), int(maximum))
+        return self.random.randint(int(minimum), int(maximum))
+
+    def ages(self, n, minimum=16, maximum=66):
+        """
+        Get n random ages.
+        :param n: Quantity of values.
+        :param maximum: max age
+        :param minimum: min age
+        :return: List of integers from minimum to maximum.
+        """
+        return self.random.choices(range(int(minimum), int(maximum) + 1), k=n)
 
     def name(self, gender='f'):
         """
@@ -297,7 +736,20 @@ class Personal(object):
             raise TypeError('name takes only string type')
 
         _filename = 'f_names' if gender.lower() == 'f' else 'm_names'
-        return choice(pull(_filename, self.lang)).strip()
+        return self._choice(_filename, self.lang)
+
+    def names(self, n, gender='f'):
+        """
+        Get n random names.
+        :param n: Quantity of values.
+        :param gender: if 'm' then will getting male names else female names.
+        :return: List of names.
+        """
+        if not isinstance(gender, str):
+            raise TypeError('names takes only string type')
+
+        _filename = 'f_names' if gender.lower() == 'f' else 'm_names'
+        return self._choices(_filename, self.lang, n=n)
 
     def surname(self, gender='f'):
         """
@@ -311,9 +763,26 @@ class Personal(object):
 
         if self.lang == 'ru_ru':
             _file = 'm_surnames' if gender == 'm' else 'f_surnames'
-            return choice(pull(_file, self.lang)).strip()
+            return self._choice(_file, self.lang)
 
-        return choice(pull('surnames', self.lang)).strip()
+        return self._choice('surnames', self.lang)
+
+    def surnames(self, n, gender='f'):
+        """
+        Get n random surnames.
+        :param n: Quantity of values.
+        :param gender: if 'm' then will getting male surnames else
+        female surnames.
+        :return: List of surnames.
+        """
+        if not isinstance(gender, str):
+            raise TypeError('surnames takes only string type')
+
+        if self.lang == 'ru_ru':
+            _file = 'm_surnames' if gender == 'm' else 'f_surnames'
+            return self._choices(_file, self.lang, n=n)
+
+        return self._choices('surnames', self.lang, n=n)
 
     def full_name(self, gender='f', reverse=False):
         """
@@ -328,33 +797,73 @@ class Personal(object):
             return '{0} {1}'.format(self.surname(_sex), self.name(_sex))
         return '{0} {1}'.format(self.name(_sex), self.surname(_sex))
 
-    @staticmethod
-    def username(gender='m'):
+    def full_names(self, n, gender='f', reverse=False):
+        """
+        Get n random full names.
+        :param n: Quantity of values.
+        :param reverse: if true: surname/name else name/surname
+        :param gender: if gender='m' then will be returned male names else
+        female names.
+        :return: List of full names.
+        """
+        _sex = gender.lower()
+        names = self.names(n, _sex)
+        surnames = self.surnames(n, _sex)
+        if reverse:
+            return ['{0} {1}'.format(*p) for p in zip(surnames, names)]
+        return ['{0} {1}'.format(*p) for p in zip(names, surnames)]
+
+    def username(self, gender='m', unique=False):
         """
         Get a random username with digits.
         Username generated from en_us names for all locales.
+        :param unique: if True then usernames never repeat (see usernames).
         :return: Username. For example: abby101
         """
+        if unique:
+            return self.usernames(1, gender, unique=True)[0]
 
         _file_name = 'f_names' \
             if gender.lower() == 'f' else 'm_names'
 
-        _u = choice(pull(_file_name)).replace(' ', '_')
-        return _u.strip().lower() + str(randint(2, 9999))
+        _u = self._choice(_file_name).replace(' ', '_')
+        return _u.lower() + str(self.random.randint(2, 9999))
 
-    @staticmethod
-    def twitter(gender='m'):
+    def usernames(self, n, gender='m', unique=False):
+        """
+        Get n random usernames with digits.
+        :param n: Quantity of values.
+        :param gender: gender of users.
+        :param unique: if True then usernames never repeat, also in
+        next calls and for other gender: all combinations of name
+        and number are enumerated in pseudorandom order, without keeping
+        generated usernames. Names of both genders are used then.
+        :return: List of usernames.
+        :raises ValueError: if there are not enough unique usernames left.
+        """
+        if unique:
+            stream = self._unique_stream('username')
+            return [''.join(parts) for parts in stream.take(n)]
+
+        _file_name = 'f_names' \
+            if gender.lower() == 'f' else 'm_names'
+
+        names = self._choices(_file_name, n=n)
+        numbers = self.random.choices(range(2, 10000), k=n)
+        return [name.replace(' ', '_').lower() + str(number)
+                for name, number in zip(names, numbers)]
+
+    def twitter(self, gender='m'):
         """
         Get a random twitter user.
         :param gender:
         :return: URL to user. Example: http://twitter.com/someuser12
         """
         url = "http://twitter.com/{0}"
-        _t = Personal.username(gender.lower())
+        _t = self.username(gender.lower())
         return url.format(_t)
 
-    @staticmethod
-    def facebook(gender='m'):
+    def facebook(self, gender='m'):
         """
         Generate a random facebook user.
         :param gender: gender of user.
@@ -362,43 +871,84 @@ class Personal(object):
         Example: https://facebook.com/some.user
         """
         url = 'https://facebook.com/{0}'
-        _f = Personal.username(gender.lower())
+        _f = self.username(gender.lower())
         return url.format(_f)
 
-    @staticmethod
-    def password(length=8, algorithm=''):
+    def password(self, length=8, algorithm='', **params):
         """
         Generate a password or hash of password.
         :param length: length of password.
-        :param algorithm: hashing algorithm.
+        :param algorithm: hashing algorithm, one of
+        church.hashing.ALGORITHMS. Default is no hashing.
+        :param params: parameters of key derivation function,
+        i.e iterations=1000 (see church.hashing.KDFS).
         :return: Password or hash of password.
         """
-        import hashlib
-        _punc = '!"#$%+:<?@^_'
-        _str = [choice(ascii_letters + digits + _punc) for _ in range(length)]
-        _pass = "".join(_str)
-        if algorithm.lower() == 'sha1':
-            return hashlib.sha1(_pass.encode()).hexdigest()
-        elif algorithm.lower() == 'sha256':
-            return hashlib.sha256(_pass.encode()).hexdigest()
-        elif algorithm.lower() == 'sha512':
-            return hashlib.sha512(_pass.encode()).hexdigest()
-        elif algorithm.lower() == 'md5':
-            return hashlib.md5(_pass.encode()).hexdigest()
-        else:
-            return _pass
+        return self.passwords(1, length, algorithm, **params)[0]
 
-    @staticmethod
-    def email(gender='f'):
+    def passwords(self, n, length=8, algorithm='', pairs=False,
+                  workers=None, **params):
+        """
+        Generate n passwords or hashes of passwords.
+        Hashes are computed on a pool of threads, salts of key
+        derivation functions depend on the seed.
+        :param n: Quantity of values.
+        :param length: length of password.
+        :param algorithm: hashing algorithm (see password).
+        :param pairs: if True then return (password, hash) pairs.
+        :param workers: quantity of threads. Default is os.cpu_count().
+        :param params: parameters of key derivation function.
+        :return: List of passwords, hashes of passwords or pairs.
+        """
+        from .hashing import KDFS, hash_passwords
+        choices = self.random.choices
+        chars = ascii_letters + digits + '!"#$%+:<?@^_'
+        plain = [''.join(choices(chars, k=length)) for _ in range(n)]
+        if not algorithm:
+            return list(zip(plain, plain)) if pairs else plain
+
+        salts = None
+        if algorithm.lower() in KDFS:
+            salt_chars = ascii_letters + digits
+            salts = [''.join(choices(salt_chars, k=SALT_LENGTH))
+                     for _ in range(n)]
+        hashes = hash_passwords(plain, algorithm, salts, workers, **params)
+        return list(zip(plain, hashes)) if pairs else hashes
+
+    def email(self, gender='f', unique=False):
         """
         Generate a random email using usernames.
         :param gender: gender of user.
+        :param unique: if True then emails never repeat (see emails).
         :return: Email address. Example: foretime10@live.com
         """
+        if unique:
+            return self.emails(1, gender, unique=True)[0]
+
+        gender = 'm' if gender.lower() == 'm' else 'f'
+        name = self.username(gender=gender)
+        email_adders = name + self._choice('email', 'en_us')
+        return email_adders
+
+    def emails(self, n, gender='f', unique=False):
+        """
+        Generate n random emails using usernames.
+        :param n: Quantity of values.
+        :param gender: gender of users.
+        :param unique: if True then emails never repeat, also in next
+        calls and for other gender (name x number x domain,
+        see usernames).
+        :return: List of email addresses.
+        :raises ValueError: if there are not enough unique emails left.
+        """
+        if unique:
+            stream = self._unique_stream('email')
+            return [''.join(parts) for parts in stream.take(n)]
+
         gender = 'm' if gender.lower() == 'm' else 'f'
-        name = Personal.username(gender=gender)
-        email_adders = name + choice(pull('email', 'en_us'))
-        return email_adders.strip()
+        domains = self._choices('email', 'en_us', n=n)
+        return [name + domain for name, domain in
+                zip(self.usernames(n, gender=gender), domains)]
 
     def home_page(self):
         """
@@ -407,10 +957,19 @@ class Personal(object):
         """
         username = self.username().replace(' ', '-')
         url = 'http://www.' + username
-        return url + choice(pull('domains', 'en_us')).strip()
+        return url + self._choice('domains', 'en_us')
 
-    @staticmethod
-    def subreddit(nsfw=False, full_url=False):
+    def home_pages(self, n):
+        """
+        Generate n random home pages, see home_page().
+        :param n: Quantity of values.
+        :return: List of home pages.
+        """
+        domains = self._choices('domains', 'en_us', n=n)
+        return ['http://www.' + username.replace(' ', '-') + domain
+                for username, domain in zip(self.usernames(n), domains)]
+
+    def subreddit(self, nsfw=False, full_url=False):
         """
         Get a random subreddit from list.
         :param nsfw: if True then will be returned NSFW subreddit.
@@ -421,15 +980,26 @@ class Personal(object):
         url = 'http://www.reddit.com'
         if nsfw:
             if full_url:
-                return url + choice(pull('nsfw_subreddits'))
+                return url + self._choice('nsfw_subreddits')
             else:
-                return choice(pull('nsfw_subreddits'))
-        _subreddit = choice(pull('subreddits'))
+                return self._choice('nsfw_subreddits')
+        _subreddit = self._choice('subreddits')
         _r = url + _subreddit if full_url else _subreddit
         return _r
 
-    @staticmethod
-    def bitcoin(address_format='p2pkh'):
+    def subreddits(self, n, nsfw=False, full_url=False):
+        """
+        Get n random subreddits, see subreddit().
+        :param n: Quantity of values.
+        :return: List of subreddits or URLs to subreddits.
+        """
+        result = self._choices('nsfw_subreddits' if nsfw else 'subreddits',
+                               n=n)
+        if full_url:
+            return ['http://www.reddit.com' + x for x in result]
+        return result
+
+    def bitcoin(self, address_format='p2pkh'):
         """
         Get a random bitcoin address.
         Currently supported only two address formats that are most popular.
@@ -438,62 +1008,114 @@ class Personal(object):
         :return: Bitcoin address. Example: 3EktnHQD7RiAE6uzMj2ZifT9YgRrkSgzQX
         """
         _fmt = '1' if address_format.lower() == 'p2pkh' else '3'
-        _fmt += "".join([choice(ascii_letters + digits) for _ in range(33)])
+        _fmt += "".join([self.random.choice(ascii_letters + digits)
+                         for _ in range(33)])
         return _fmt
 
-    @staticmethod
-    def cvv():
+    def cvv(self):
         """
         Generate a random card verification value (CVV)
         :return: CVV code
         """
-        return randint(100, 999)
+        return self.random.randint(100, 999)
 
-    @staticmethod
-    def credit_card_number(card_type='visa'):
+    def cvvs(self, n):
         """
-        Generate a random credit card number.
-        :param card_type: Issuing Network. Default is Visa
-        :return: Credit card number. Example: 4455 5299 1152 2450
+        Generate n random card verification values (CVV).
+        :param n: Quantity of values.
+        :return: List of CVV codes.
         """
-        visa = randint(4000, 4999)
-        mc = choice([randint(2221, 2720), randint(5100, 5500)])
+        return self.random.choices(range(100, 1000), k=n)
 
-        # Issuer identification number.
-        # Read more: http://bit.ly/2dBhNcX
-        iin = mc if card_type.lower() == 'mastercard' or 'mc' else visa
+    def credit_card_number(self, card_type='visa'):
+        """
+        Generate a random credit card number, valid by the Luhn algorithm.
+        :param card_type: Issuing Network, i.e visa, mastercard (mc),
+        amex, mir, discover, jcb, diners, unionpay, maestro.
+        Default is Visa
+        :return: Credit card number. Example: 4455 5299 1152 2451
+        """
+        return self.credit_card_numbers(1, card_type)[0]
 
-        tail = ''.join([str(randint(0000, 9999)) for _ in range(0, 3)])
-        return '{0} {1}'.format(str(iin), tail)
+    def credit_card_numbers(self, n, card_type='visa'):
+        """
+        Generate n random credit card numbers, see credit_card_number().
+        :param n: Quantity of values.
+        :param card_type: Issuing Network. Default is Visa
+        :return: List of credit card numbers.
+        :raises KeyError: if network is unknown.
+        """
+        from .cards import format_number, numbers, scheme
+        network = scheme(card_type)
+        groups = network.groups
+        return [format_number(number, groups)
+                for number in numbers(self.random, network, n)]
 
-    @staticmethod
-    def credit_card_expiration_date(from_=16, to_=25):
+    def credit_card(self, card_type='visa'):
+        """
+        Generate a random credit card with matching number,
+        expiration date in the 5 years after the year of the provider
+        and CVV (CID for Amex).
+        :param card_type: Issuing Network, see credit_card_number().
+        :return: Card. Example: Card(network='amex',
+        number='3782 822463 10005', expiration_date='03/29', cvv=7834)
+        """
+        return self.credit_cards(1, card_type)[0]
+
+    def credit_cards(self, n, card_type='visa'):
+        """
+        Generate n random credit cards, see credit_card().
+        :param n: Quantity of values.
+        :param card_type: Issuing Network. Default is Visa
+        :return: List of cards.
+        """
+        from .cards import Card, scheme
+        network = scheme(card_type)
+        choices = self.random.choices
+        year = self.year % 100
+        months = choices(range(1, 13), k=n)
+        years = choices(range(year + 1, year + 6), k=n)
+        length = network.cvv_length
+        codes = choices(range(10 ** (length - 1), 10 ** length), k=n)
+        return [Card(network.name, number,
+                     '{0:02d}/{1:02d}'.format(month, year % 100), code)
+                for number, month, year, code in zip(
+                    self.credit_card_numbers(n, card_type),
+                    months, years, codes)]
+
+    def credit_card_expiration_date(self, from_=16, to_=25):
         """
         Generate a random expiration date for credit card.
         :param from_: date of issue.
         :param to_: maximum of expiration_date.
         :return: Expiration date of credit card. Example: 03/19.
         """
-        month = randint(1, 12)
-        year = randint(int(from_), int(to_))
+        month = self.random.randint(1, 12)
+        year = self.random.randint(int(from_), int(to_))
         month = '0' + str(month) if month < 10 else month
         return '{0}/{1}'.format(month, year)
 
-    @staticmethod
-    def cid():
+    def cid(self):
         """
         Generate a random CID code.
         :return: CID code.
         """
-        return randint(1000, 9999)
+        return self.random.randint(1000, 9999)
 
-    @staticmethod
-    def wmid():
+    def cids(self, n):
+        """
+        Generate n random CID codes.
+        :param n: Quantity of values.
+        :return: List of CID codes.
+        """
+        return self.random.choices(range(1000, 10000), k=n)
+
+    def wmid(self):
         """
         Generate a identifier of user WMID for WebMoney
         :return: WMID (WebMoney ID). Example: 834296404761
         """
-        return "".join([choice(digits) for _ in range(12)])
+        return "".join([self.random.choice(digits) for _ in range(12)])
 
     def paypal(self):
         """
@@ -502,13 +1124,12 @@ class Personal(object):
         """
         return self.email()
 
-    @staticmethod
-    def yandex_money():
+    def yandex_money(self):
         """
         Generate a random Yandex.Money account.
         :return: Yandex.Money account.
         """
-        return "".join([choice(digits) for _ in range(14)])
+        return "".join([self.random.choice(digits) for _ in range(14)])
 
     def gender(self, abbreviated=False):
         """
@@ -518,66 +1139,121 @@ class Personal(object):
         :return: Title of gender. Example: Male.
         """
         if abbreviated:
-            return choice(pull('gender', self.lang))[0:1]
-        return choice(pull('gender', self.lang)).strip()
+            return self._choice('gender', self.lang)[0:1]
+        return self._choice('gender', self.lang)
+
+    def genders(self, n, abbreviated=False):
+        """
+        Get n random genders.
+        :param n: Quantity of values.
+        :param abbreviated: if True then will getting abbreviated titles.
+        :return: List of titles of gender.
+        """
+        genders = self._choices('gender', self.lang, n=n)
+        if abbreviated:
+            return [g[0:1] for g in genders]
+        return genders
 
-    @staticmethod
-    def height(from_=1.5, to_=2.0):
+    def height(self, from_=1.5, to_=2.0):
         """
         Generate a random height in M.
         :param from_: min value
         :param to_: max value
         :return: Height. Example: 1.85.
         """
-        h = uniform(float(from_), float(to_))
+        h = self.random.uniform(float(from_), float(to_))
         return '{:0.2f}'.format(h)
 
-    @staticmethod
-    def weight(from_=38, to_=90):
+    def heights(self, n, from_=1.5, to_=2.0):
+        """
+        Generate n random heights in M.
+        :param n: Quantity of values.
+        :param from_: min value
+        :param to_: max value
+        :return: List of heights.
+        """
+        return ['{:0.2f}'.format(self.random.uniform(float(from_), float(to_)))
+                for _ in range(n)]
+
+    def weight(self, from_=38, to_=90):
         """
         Generate a random weight in KG.
         :param from_: min value
         :param to_: max value
         :return: Weight. Example: 74.
         """
-        w = randint(int(from_), int(to_))
+        w = self.random.randint(int(from_), int(to_))
         return w
 
+    def weights(self, n, from_=38, to_=90):
+        """
+        Generate n random weights in KG.
+        :param n: Quantity of values.
+        :param from_: min value
+        :param to_: max value
+        :return: List of weights.
+        """
+        return self.random.choices(range(int(from_), int(to_) + 1), k=n)
+
     def sexual_orientation(self):
         """
         Get a random (LOL) sexual orientation.
         :return: Sexual orientation. Example: Heterosexuality.
         """
-        so = choice(pull('sexual_orientation', self.lang))
-        return so.strip()
+        so = self._choice('sexual_orientation', self.lang)
+        return so
+
+    def sexual_orientations(self, n):
+        """
+        Get n random sexual orientations.
+        :param n: Quantity of values.
+        :return: List of sexual orientations.
+        """
+        return self._choices('sexual_orientation', self.lang, n=n)
 
     def profession(self):
         """
         Get a random profession.
         :return: The name of profession. Example: Programmer.
         """
-        return choice(pull('professions', self.lang)).strip()
+        return self._choice('professions', self.lang)
+
+    def professions(self, n):
+        """
+        Get n random professions.
+        :param n: Quantity of values.
+        :return: List of professions.
+        """
+        return self._choices('professions', self.lang, n=n)
 
     def political_views(self):
         """
         Get a random political views.
         :return: Political views. Example: Liberal.
         """
-        return choice(pull('political_views', self.lang)).strip()
+        return self._choice('political_views', self.lang)
 
     def worldview(self):
         """
         Get a random worldview.
         :return: Worldview. Example: Pantheism.
         """
-        return choice(pull('worldview', self.lang)).strip()
+        return self._choice('worldview', self.lang)
+
+    def worldviews(self, n):
+        """
+        Get n random worldviews.
+        :param n: Quantity of values.
+        :return: List of worldviews.
+        """
+        return self._choices('worldview', self.lang, n=n)
 
     def views_on(self):
         """
         Get a random views on.
         :return: Views on string. Example: Negative.
         """
-        return choice(pull('views_on', self.lang)).strip()
+        return self._choice('views_on', self.lang)
 
     def nationality(self, gender='f'):
         """
@@ -585,43 +1261,98 @@ class Personal(object):
         :param gender: female or male
         :return: Nationality. Example: Russian.
         """
-        try:
-            # Subtleties of the Russian orthography.
-            if self.lang == 'ru_ru':
-                i = 0 if gender.lower() == 'm' else 1
-                return choice(pull('nation', self.lang)).split('|')[i].strip()
-            else:
-                return choice(pull('nation', self.lang)).strip()
-        except Exception:
-            raise TypeError('name takes only string type')
+        if not isinstance(gender, str):
+            raise TypeError('nationality takes only string type')
+
+        # Subtleties of the Russian orthography: nations have
+        # male and female forms, other locales use one form for both.
+        nations = table('nation', self.lang).columns
+        if gender.lower() == 'm':
+            return self.random.choice(nations.male)
+        return self.random.choice(nations.female)
+
+    def nationalities(self, n, gender='f'):
+        """
+        Get n random nationalities.
+        :param n: Quantity of values.
+        :param gender: female or male
+        :return: List of nationalities.
+        """
+        if not isinstance(gender, str):
+            raise TypeError('nationalities takes only string type')
+
+        nations = table('nation', self.lang).columns
+        if gender.lower() == 'm':
+            return self.random.choices(nations.male, k=n)
+        return self.random.choices(nations.female, k=n)
+
+    def nationality_record(self):
+        """
+        Get a random nationality in both forms.
+        :return: Nationality.
+        Example: Nation(male='Русский', female='Русская')
+        """
+        return self.random.choice(table('nation', self.lang).records)
 
     def university(self):
         """
         Get a random university.
         :return: University name. Example: MIT.
         """
-        return choice(pull('university', self.lang)).strip()
+        return self._choice('university', self.lang)
+
+    def universities(self, n):
+        """
+        Get n random universities.
+        :param n: Quantity of values.
+        :return: List of university names.
+        """
+        return self._choices('university', self.lang, n=n)
 
     def qualification(self):
         """
         Get a random qualification.
         :return: Degree. Example: Bachelor.
         """
-        return choice(pull('qualifications', self.lang)).strip()
+        return self._choice('qualifications', self.lang)
+
+    def qualifications(self, n):
+        """
+        Get n random qualifications.
+        :param n: Quantity of values.
+        :return: List of degrees.
+        """
+        return self._choices('qualifications', self.lang, n=n)
 
     def language(self):
         """
         Get a random language.
         :return: Random language. Example: Irish
         """
-        return choice(pull('languages', self.lang)).strip()
+        return self._choice('languages', self.lang)
+
+    def languages(self, n):
+        """
+        Get n random languages.
+        :param n: Quantity of values.
+        :return: List of languages.
+        """
+        return self._choices('languages', self.lang, n=n)
 
     def favorite_movie(self):
         """
         Get a random movie.
         :return: Name of the movie.
         """
-        return choice(pull('favorite_movie', self.lang)).strip()
+        return self._choice('favorite_movie', self.lang)
+
+    def favorite_movies(self, n):
+        """
+        Get n random movies.
+        :param n: Quantity of values.
+        :return: List of names of movies.
+        """
+        return self._choices('favorite_movie', self.lang, n=n)
 
     def telephone(self):
         """
@@ -633,25 +1364,134 @@ class Personal(object):
             else '+$-($$$)$$$-$$-$$'
         for i in mask:
             if i == '$':
-                phone_number += str(randint(1, 9))
+                phone_number += str(self.random.randint(1, 9))
             else:
                 phone_number += i
         return phone_number.strip()
 
-    @staticmethod
-    def avatar():
+    def telephones(self, n):
+        """
+        Generate n random phone numbers.
+        :param n: Quantity of values.
+        :return: List of phone numbers.
+        """
+        mask = '+7-($$$)$$$-$$-$$' if self.lang == 'ru_ru' \
+            else '+$-($$$)$$$-$$-$$'
+        size = mask.count('$')
+        mask = mask.replace('$', '{}')
+        _digits = self.random.choices('123456789', k=n * size)
+        return [mask.format(*_digits[i:i + size])
+                for i in range(0, n * size, size)]
+
+    def profile(self, gender=None, minimum=16, maximum=66):
+        """
+        Generate a coherent person: username and email are made
+        of the name, surname and year of birth, surname and nationality
+        match the gender. Years of birth are counted from the year
+        of the provider.
+        :param gender: 'm' or 'f'. Default is a random gender.
+        :param minimum: min age.
+        :param maximum: max age.
+        :return: Profile. Example: Profile(gender='Male', name='Leo',
+        surname='Johnson', username='leo.johnson88',
+        email='leo.johnson88@gmail.com', age=30, ...)
+        """
+        rnd, lang = self.random, self.lang
+        if gender is None:
+            sex = 'm' if rnd.random() < 0.5 else 'f'
+        else:
+            sex = 'm' if gender.lower() == 'm' else 'f'
+        _surnames = sex + '_surnames' if lang == 'ru_ru' else 'surnames'
+        nations = table('nation', lang).columns
+        return self._profile(
+            sex, self._choice(sex + '_names', lang),
+            self._choice(_surnames, lang),
+            rnd.choice(nations.male if sex == 'm' else nations.female),
+            rnd.randint(int(minimum), int(maximum)),
+            rnd.choice(USERNAME_FORMATS), self._choice('email', 'en_us'),
+            self.telephones(1)[0], self._choice('professions', lang),
+            self.year)
+
+    def _profile(self, sex, name, surname, nationality, age, _format,
+                 domain, telephone, profession, this_year):
+        from .translit import romanize
+        first, last = romanize(name), romanize(surname)
+        year = str(this_year - age)
+        username = _format.format(first, last, first[:1], year, year[2:])
+        # Titles of genders are "Male", "Female" and others in each locale.
+        title = pull('gender', self.lang)[0 if sex == 'm' else 1]
+        return Profile(title, name, surname, username, username + domain,
+                       age, telephone, nationality, profession)
+
+    def profiles(self, n, gender=None, minimum=16, maximum=66):
+        """
+        Generate n coherent persons, see profile().
+        Every column is drawn at once, data is looked up once per call.
+        :param n: Quantity of values.
+        :param gender: 'm' or 'f'. Default is a random gender.
+        :return: List of profiles.
+        """
+        rnd, lang = self.random, self.lang
+        if gender is None:
+            genders = rnd.choices('mf', k=n)
+        else:
+            genders = ['m' if gender.lower() == 'm' else 'f'] * n
+
+        # Values of gendered columns are drawn for each gender
+        # and taken in order of genders.
+        counts = {'m': genders.count('m'), 'f': n - genders.count('m')}
+        nations = table('nation', lang).columns
+        columns = {}
+        for sex, count in counts.items():
+            _surnames = sex + '_surnames' if lang == 'ru_ru' else 'surnames'
+            columns[sex] = zip(
+                self._choices(sex + '_names', lang, n=count),
+                self._choices(_surnames, lang, n=count),
+                rnd.choices(nations.male if sex == 'm' else nations.female,
+                            k=count))
+        ages = self.ages(n, minimum, maximum)
+        formats = rnd.choices(USERNAME_FORMATS, k=n)
+        domains = self._choices('email', 'en_us', n=n)
+        this_year = self.year
+
+        profile = self._profile
+        result = []
+        for sex, age, _format, domain, telephone, profession in zip(
+                genders, ages, formats, domains, self.telephones(n),
+                self.professions(n)):
+            name, surname, nationality = next(columns[sex])
+            result.append(profile(sex, name, surname, nationality, age,
+                                  _format, domain, telephone, profession,
+                                  this_year))
+        return result
+
+    def avatar(self):
         url = 'https://raw.githubusercontent.com/lk-geimfari/' \
-              'church/master/examples/avatars/{0}.png'.format(randint(1, 7))
+              'church/master/examples/avatars/{0}.png'.format(
+                  self.random.randint(1, 7))
         return url
 
 
-class Datetime(object):
+class Datetime(BaseProvider):
     """
     Class for generate the fake data that you can use for
     working with date and time.
     """
 
-    def __init__(self, lang='en_us'):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'day_of_week': 'days_of_week',
+        'month': 'months',
+        'year': 'years',
+        'periodicity': 'periodicities',
+        'date': 'dates',
+        'timestamp': 'timestamps',
+        'datetime': 'datetimes',
+        'formatted_datetime': 'formatted_datetimes'
+    }
+
+    def __init__(self, lang='en_us', seed=None):
+        super().__init__(seed)
         self.lang = lang.lower()
 
     def day_of_week(self, abbreviated=False):
@@ -661,10 +1501,29 @@ class Datetime(object):
         of day of the week.
         :return: Name of day of the week.
         """
-        _day = choice(pull('days', self.lang)).split('|')
+        days = table('days', self.lang).columns
         if abbreviated:
-            return _day[1].strip()
-        return _day[0].strip()
+            return self.random.choice(days.abbr)
+        return self.random.choice(days.name)
+
+    def days_of_week(self, n, abbreviated=False):
+        """
+        Get n random days of week.
+        :param n: Quantity of values.
+        :param abbreviated: if True then will be returned abbreviated names.
+        :return: List of names of days of the week.
+        """
+        days = table('days', self.lang).columns
+        if abbreviated:
+            return self.random.choices(days.abbr, k=n)
+        return self.random.choices(days.name, k=n)
+
+    def day_of_week_record(self):
+        """
+        Get a random day of week with its abbreviation.
+        :return: Day of the week. Example: Day(name='Monday', abbr='Mon.')
+        """
+        return self.random.choice(table('days', self.lang).records)
 
     def month(self, abbreviated=False):
         """
@@ -673,103 +1532,392 @@ class Datetime(object):
         abbreviated month name.
         :return: Month name. Example: November.
         """
-        _month = choice(pull('months', self.lang)).split('|')
+        months = table('months', self.lang).columns
         if abbreviated:
-            return _month[1].strip()
-        return _month[0].strip()
+            return self.random.choice(months.abbr)
+        return self.random.choice(months.name)
 
-    @staticmethod
-    def year(from_=1990, to_=2050):
+    def months(self, n, abbreviated=False):
+        """
+        Get n random months.
+        :param n: Quantity of values.
+        :param abbreviated: if True then will be returned
+        abbreviated month names.
+        :return: List of month names.
+        """
+        months = table('months', self.lang).columns
+        if abbreviated:
+            return self.random.choices(months.abbr, k=n)
+        return self.random.choices(months.name, k=n)
+
+    def month_record(self):
+        """
+        Get a random month with its abbreviation.
+        :return: Month. Example: Month(name='November', abbr='Nov.')
+        """
+        return self.random.choice(table('months', self.lang).records)
+
+    def year(self, from_=1990, to_=2050):
         """
         Generate a random year.
         :param from_:
         :param to_:
         :return: Year. Example 2023.
         """
-        return randint(int(from_), int(to_))
+        return self.random.randint(int(from_), int(to_))
+
+    def years(self, n, from_=1990, to_=2050):
+        """
+        Generate n random years.
+        :param n: Quantity of values.
+        :param from_:
+        :param to_:
+        :return: List of years.
+        """
+        return self.random.choices(range(int(from_), int(to_) + 1), k=n)
 
     def periodicity(self):
         """
         Get a random periodicity string.
         :return: Periodicity. Example: Never.
         """
-        return choice(pull('periodicity', self.lang)).strip()
+        return self._choice('periodicity', self.lang)
+
+    def periodicities(self, n):
+        """
+        Get n random periodicity strings.
+        :param n: Quantity of values.
+        :return: List of periodicities.
+        """
+        return self._choices('periodicity', self.lang, n=n)
 
-    @staticmethod
-    def date(sep='-', with_time=False):
+    def date(self, sep='-', with_time=False):
         """
         Generate a random date formatted as a 11-05-2016
         :param sep: a separator for date. Default is '-'.
         :param with_time: if it's True then will be added random time.
         :return: Formatted date and time: 20-03-2016 03:20.
         """
-        _d = date(randint(2000, 2035), randint(1, 12), randint(1, 28))
-        pattern = '%d{0}%m{0}%Y %m:%d' if with_time else '%d{0}%m{0}%Y'
-        return _d.strftime(pattern.format(sep))
+        return self.dates(1, sep, with_time)[0]
 
-    @staticmethod
-    def day_of_month():
+    def dates(self, n, sep='-', with_time=False):
+        """
+        Generate n random dates formatted as a 11-05-2016
+        :param n: Quantity of values.
+        :param sep: a separator for date. Default is '-'.
+        :param with_time: if it's True then will be added random time.
+        :return: List of formatted dates.
+        """
+        sep = sep.replace('%', '%%')
+        pattern = '%d{0}%m{0}%Y'.format(sep)
+        if with_time:
+            pattern += ' %H:%M'
+        from .dates import formatter
+        return formatter(pattern, self.lang).format(self.timestamps(n))
+
+    def timestamp(self, start=START, stop=STOP, unit='s'):
+        """
+        Generate a random instant as epoch time.
+        :param start: Epoch seconds, date or datetime (naive is UTC).
+        Default is 2000-01-01.
+        :param stop: End of range (exclusive). Default is 2036-01-01.
+        :param unit: Unit of timestamp: 's', 'ms' or 'us'.
+        :return: Integer. Example: 1700000000
+        """
+        return self.timestamps(1, start, stop, unit)[0]
+
+    def timestamps(self, n, start=START, stop=STOP, unit='s'):
+        """
+        Generate n random instants as epoch time, see timestamp().
+        :param n: Quantity of values.
+        :return: List of integers.
+        """
+        from .events import UNITS, epoch
+        scale = UNITS[unit]
+        return self.random.choices(
+            range(epoch(start) * scale, epoch(stop) * scale), k=n)
+
+    def datetime(self, start=START, stop=STOP, utc_offset=0):
+        """
+        Generate a random aware datetime.
+        :param start: Start of range, see timestamp().
+        :param stop: End of range (exclusive).
+        :param utc_offset: Offset of time zone in seconds.
+        :return: Datetime.
+        """
+        return self.datetimes(1, start, stop, utc_offset)[0]
+
+    def datetimes(self, n, start=START, stop=STOP, utc_offset=0):
+        """
+        Generate n random aware datetimes, see datetime().
+        :param n: Quantity of values.
+        :return: List of datetimes.
+        """
+        from .events import to_datetimes
+        return to_datetimes(self.timestamps(n, start, stop, 'us'), 'us',
+                            utc_offset)
+
+    def formatted_datetime(self, pattern='iso', start=START, stop=STOP,
+                           utc_offset=0, unit='s'):
+        """
+        Generate a random instant formatted by a pattern.
+        :param pattern: Pattern of strftime or name of church.dates.FORMATS,
+        names of months and days are taken from the locale.
+        :param start: Start of range, see timestamp().
+        :param stop: End of range (exclusive).
+        :param utc_offset: Offset of time zone in seconds.
+        :param unit: Unit of instants: 's', 'ms' or 'us' (see %f).
+        :return: String. Example: 2023-11-14T22:13:20+00:00
+        """
+        return self.formatted_datetimes(1, pattern, start, stop, utc_offset,
+                                        unit)[0]
+
+    def formatted_datetimes(self, n, pattern='iso', start=START, stop=STOP,
+                            utc_offset=0, unit='s'):
+        """
+        Generate n random formatted instants, see formatted_datetime().
+        Use church.dates.Formatter to format other timestamps,
+        i.e of events().
+        :param n: Quantity of values.
+        :return: List of strings.
+        """
+        from .dates import formatter
+        return formatter(pattern, self.lang, utc_offset, unit).format(
+            self.timestamps(n, start, stop, unit))
+
+    def _arrivals(self, segments, unit, datetimes, rng):
+        from .events import arrivals, to_datetimes
+        result = arrivals(self.random, segments, unit, rng)
+        return to_datetimes(result, unit) if datetimes else result
+
+    def events(self, start, stop, rate=1.0, seasonality=None, unit='s',
+               datetimes=False, use_numpy=None):
+        """
+        Generate ordered times of events, i.e requests to a service:
+        Poisson arrivals with seasonality and bursts.
+        :param start: Epoch seconds, date or datetime (naive is UTC).
+        :param stop: End of time, same as start.
+        :param rate: Mean quantity of events per second.
+        :param seasonality: church.events.Seasonality, profiles of hour
+        of day and day of week and bursts. Default is a constant rate.
+        :param unit: Unit of epoch timestamps: 's', 'ms' or 'us'.
+        :param datetimes: if True then datetimes are returned.
+        :param use_numpy: if False then pure Python is used.
+        Default is True when NumPy is installed.
+        :return: Epoch timestamps or datetimes in UTC, as a NumPy array
+        (numpy.datetime64 for datetimes) or a list.
+        """
+        from .events import Seasonality, epoch, generator
+        seasonality = seasonality or Seasonality(None, None)
+        rng = generator(self.random, use_numpy)
+        segments = seasonality.segments(self.random, rate, epoch(start),
+                                        epoch(stop))
+        return self._arrivals(segments, unit, datetimes, rng)
+
+    def event_stream(self, start, rate=1.0, seasonality=None, unit='s',
+                     datetimes=False, use_numpy=None, chunk=86400):
+        """
+        Endless stream of times of events, see events().
+        :param chunk: Duration of chunks in seconds.
+        :return: Iterator of chunks, arrays or lists of timestamps.
+        Example: zip(chunk, personal.usernames(len(chunk)))
+        """
+        from .events import Seasonality, chunks, epoch, generator
+        seasonality = seasonality or Seasonality(None, None)
+        rng = generator(self.random, use_numpy)
+        start = epoch(start)
+        segments = seasonality.segments(self.random, rate, start)
+        for part in chunks(segments, start, chunk):
+            yield self._arrivals(part, unit, datetimes, rng)
+
+    def day_of_month(self):
         """
         Static method for generate a random days of month, from 1 to 31.
         :return: Random value from 1 to 31.
         """
-        return randint(1, 31)
+        return self.random.randint(1, 31)
 
 
-class Network(object):
+class Network(BaseProvider):
     """
     Class for generate data for working with network,
     i.e IPv4, IPv6 and another
     """
 
-    @staticmethod
-    def ip_v4():
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'ip_v4': 'ip_v4s',
+        'ip_v6': 'ip_v6s',
+        'mac_address': 'mac_addresses',
+        'user_agent': 'user_agents',
+        'ip_address': 'ip_addresses'
+    }
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        # Orders of unique addresses, see ip_addresses().
+        self._unique = {}
+
+    def ip_v4(self):
         """
         Static method for generate a random IPv4 address.
         :return: Random IPv4 address.
         """
-        ip = '.'.join([str(randint(0, 255)) for i in range(0, 4)])
+        ip = '.'.join([str(self.random.randint(0, 255)) for i in range(0, 4)])
         return ip.strip()
 
-    @staticmethod
-    def ip_v6():
+    def ip_v4s(self, n):
+        """
+        Generate n random IPv4 addresses.
+        :param n: Quantity of values.
+        :return: List of IPv4 addresses.
+        """
+        octets = self.random.choices(range(256), k=n * 4)
+        return ['{}.{}.{}.{}'.format(*octets[i:i + 4])
+                for i in range(0, n * 4, 4)]
+
+    def ip_v6(self):
         """
         Static method for generate a random IPv6 address.
         :return: Random IPv6 address.
         """
-        return "2001:" + ":".join("%x" % randint(0, 16 ** 4) for _ in range(7))
-
-    @staticmethod
-    def mac_address():
+        return "2001:" + ":".join(
+            "%x" % self.random.randint(0, 16 ** 4 - 1) for _ in range(7))
+
+    def ip_v6s(self, n):
+        """
+        Generate n random IPv6 addresses.
+        :param n: Quantity of values.
+        :return: List of IPv6 addresses.
+        """
+        groups = self.random.choices(range(16 ** 4), k=n * 7)
+        return ['2001:{:x}:{:x}:{:x}:{:x}:{:x}:{:x}:{:x}'.format(
+            *groups[i:i + 7]) for i in range(0, n * 7, 7)]
+
+    def ip_address(self, networks='0.0.0.0/0', exclude=(), hosts=False,
+                   unique=False, fmt='str'):
+        """
+        Generate a random IP address in CIDR blocks.
+        :param networks: CIDR block or list of blocks of one IP version.
+        Default is all IPv4 addresses.
+        :param exclude: CIDR blocks to exclude,
+        i.e church.subnets.RESERVED_V4.
+        :param hosts: if True then network and broadcast addresses
+        of IPv4 blocks are excluded.
+        :param unique: if True then addresses never repeat (see
+        ip_addresses).
+        :param fmt: 'str', 'int', 'bytes' (packed) or 'object'
+        (ipaddress objects).
+        :return: IP address. Example: 10.12.0.7
+        """
+        return self.ip_addresses(1, networks, exclude, hosts, unique, fmt)[0]
+
+    def ip_addresses(self, n, networks='0.0.0.0/0', exclude=(),
+                     hosts=False, unique=False, fmt='str'):
+        """
+        Generate n random IP addresses in CIDR blocks, see ip_address().
+        :param n: Quantity of values.
+        :param unique: if True then addresses never repeat, also in next
+        calls with the same blocks: addresses are taken in the order of
+        a pseudorandom permutation of the space, without keeping
+        generated addresses.
+        :return: List of IP addresses.
+        :raises ValueError: if there are not enough unique addresses left.
+        """
+        if not isinstance(networks, str):
+            networks = tuple(networks)
+        if not isinstance(exclude, str):
+            exclude = tuple(exclude)
+        from .subnets import address_space
+        space = address_space(networks, exclude, hosts)
+        if not unique:
+            return space.format(space.sample(self.random, n), fmt)
+
+        key = (networks, exclude, hosts)
+        state = self._unique.get(key)
+        if state is None:
+            state = self._unique[key] = [
+                space.permutation(self.random.getrandbits(64)), 0]
+        permutation, position = state
+        if n > space.size - position:
+            raise ValueError(
+                'Requested {0} unique addresses, but only {1} of {2} '
+                'are left'.format(n, space.size - position, space.size))
+        state[1] = position + n
+        indexes = permutation.range(position, position + n)
+        return space.format(space.addresses(indexes), fmt)
+
+    def mac_address(self):
         """
         Static method for generate a random MAC address.
         :return: Random MAC address
         """
         mac = [0x00, 0x16, 0x3e,
-               randint(0x00, 0x7f),
-               randint(0x00, 0xff),
-               randint(0x00, 0xff)
+               self.random.randint(0x00, 0x7f),
+               self.random.randint(0x00, 0xff),
+               self.random.randint(0x00, 0xff)
                ]
         _mac = map(lambda x: "%02x" % x, mac)
         return ':'.join(_mac)
 
-    @staticmethod
-    def user_agent():
+    def mac_addresses(self, n):
+        """
+        Generate n random MAC addresses.
+        :param n: Quantity of values.
+        :return: List of MAC addresses.
+        """
+        parts = zip(self.random.choices(range(0x80), k=n),
+                    self.random.choices(range(0x100), k=n),
+                    self.random.choices(range(0x100), k=n))
+        return ['00:16:3e:{:02x}:{:02x}:{:02x}'.format(*p) for p in parts]
+
+    def user_agent(self):
         """
         Get a random user agent.
         :return: User agent.
         """
-        u_agent = choice(pull('useragents', 'en_us'))
-        return u_agent.strip()
+        u_agent = self._choice('useragents', 'en_us')
+        return u_agent
+
+    def user_agents(self, n):
+        """
+        Get n random user agents.
+        :param n: Quantity of values.
+        :return: List of user agents.
+        """
+        return self._choices('useragents', 'en_us', n=n)
 
 
-class File(object):
+class File(BaseProvider):
     """
     Class for generate fake data for files.
      """
 
-    @staticmethod
-    def extension(file_type='text'):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'extension': 'extensions'
+    }
+
+    _extensions = {
+        'source': (
+            '.a', '.asm', '.asp', '.awk', '.c', '.class',
+            '.cpp', '.pl', '.js', '.java', '.clj', '.py',
+            '.rb', '.hs', '.erl', '.rs', '.swift', '.html',
+            '.json', '.xml', '.css', '.php', '.jl', '.r',
+            '.cs', 'd', '.lisp', '.cl', '.go', '.h', '.scala',
+            '.sc', '.ts', '.sql'
+        ),
+        'text': ('.doc', '.docx', '.log', '.rtf', '.md',
+                 '.pdf', '.odt', '.txt'),
+        'data': ('.csv', '.dat', '.ged', '.pps', '.ppt', '.pptx'),
+        'audio': ('.flac', '.mp3', '.m3u', '.m4a', '.wav', '.wma'),
+        'video': ('.3gp', '.mp4', '.abi', '.m4v', '.mov', '.mpg', '.wmv'),
+        'image': ('.bmp', '.jpg', '.jpeg', '.png', '.svg'),
+        'executable': ('.apk', '.app', '.bat', '.jar', '.com', '.exe'),
+        'compressed': ('.7z', '.war', '.zip', '.tar.gz', '.tar.xz', '.rar'),
+    }
+
+    def extension(self, file_type='text'):
         """
         Get a random extension from list.
         :param file_type: The type of extension. Default is text.
@@ -782,63 +1930,57 @@ class File(object):
             6. image = '.jpeg', '.jpg', '.png' and other.
             7. executable = '.exe', '.apk', '.bat' and other.
             8. compressed = '.zip', '.7z', '.tar.xz' and other.
+        Unknown types are text.
         :return: Extension of a file. Example (file_type='source'): .py
         """
-        _type = file_type.lower()
+        extensions = self._extensions
+        return self.random.choice(
+            extensions.get(file_type.lower(), extensions['text']))
 
-        source = [
-            '.a', '.asm', '.asp', '.awk', '.c', '.class',
-            '.cpp', '.pl', '.js', '.java', '.clj', '.py',
-            '.rb', '.hs', '.erl', '.rs', '.swift', '.html',
-            '.json', '.xml', '.css', '.php', '.jl', '.r',
-            '.cs', 'd', '.lisp', '.cl', '.go', '.h', '.scala',
-            '.sc', '.ts', '.sql'
-        ]
-        text = ['.doc', '.docx', '.log', '.rtf', '.md',
-                '.pdf', '.odt', '.txt'
-                ]
-
-        data = ['.csv', '.dat', '.ged', '.pps', '.ppt', '.pptx']
-        audio = ['.flac', '.mp3', '.m3u', '.m4a', '.wav', '.wma']
-        video = ['.3gp', '.mp4', '.abi', '.m4v', '.mov', '.mpg', '.wmv']
-        image = ['.bmp', '.jpg', '.jpeg', '.png', '.svg']
-        executable = ['.apk', '.app', '.bat', '.jar', '.com', '.exe']
-        compressed = ['.7z', '.war', '.zip', '.tar.gz', '.tar.xz', '.rar']
-
-        if _type == 'source':
-            return choice(source)
-        elif _type == 'data':
-            return choice(data)
-        elif _type == 'audio':
-            return choice(audio)
-        elif _type == 'video':
-            return choice(video)
-        elif _type == 'image':
-            return choice(image)
-        elif _type == 'executable':
-            return choice(executable)
-        elif _type == 'compressed':
-            return choice(compressed)
-        else:
-            return choice(text)
+    def extensions(self, n, file_type='text'):
+        """
+        Get n random extensions, see extension().
+        :param n: Quantity of values.
+        :param file_type: The type of extensions. Default is text.
+        :return: List of extensions.
+        """
+        extensions = self._extensions
+        return self.random.choices(
+            extensions.get(file_type.lower(), extensions['text']), k=n)
 
 
-class Science(object):
+class Science(BaseProvider):
     """
     Class for getting facts science.
     """
 
-    def __init__(self, lang='en_us'):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'math_formula': 'math_formulas',
+        'chemical_element': 'chemical_elements',
+        'article_on_wiki': 'articles_on_wiki',
+        'scientist': 'scientists'
+    }
+
+    def __init__(self, lang='en_us', seed=None):
+        super().__init__(seed)
         self.lang = lang.lower()
 
-    @staticmethod
-    def math_formula():
+    def math_formula(self):
         """
         Get a random mathematical formula.
         :return: Math formula. For example: A = (ab)/2
         """
-        formula = choice(pull('math_formula', 'en_us'))
-        return formula.strip()
+        formula = self._choice('math_formula', 'en_us')
+        return formula
+
+    def math_formulas(self, n):
+        """
+        Get n random mathematical formulas.
+        :param n: Quantity of values.
+        :return: List of math formulas.
+        """
+        return self._choices('math_formula', 'en_us', n=n)
 
     def chemical_element(self, name_only=True):
         """
@@ -851,14 +1993,34 @@ class Science(object):
                 }
            or name of chemical element: 'Helium'
         """
-        _e = choice(pull('chemical_elements', self.lang)).split('|')
+        elements = table('chemical_elements', self.lang)
         if not name_only:
-            return {'name': _e[0].strip(),
-                    'symbol': _e[1].strip(),
-                    'atomic_number': _e[2].strip()
-                    }
+            return self.random.choice(elements.records)._asdict()
         else:
-            return _e[0]
+            return self.random.choice(elements.columns.name)
+
+    def chemical_elements(self, n, name_only=True):
+        """
+        Get n random chemical elements.
+        :param n: Quantity of values.
+        :param name_only: if False then will be returned dicts.
+        :return: List of names of chemical elements or dicts.
+        """
+        elements = table('chemical_elements', self.lang)
+        if not name_only:
+            return [e._asdict()
+                    for e in self.random.choices(elements.records, k=n)]
+        return self.random.choices(elements.columns.name, k=n)
+
+    def chemical_element_record(self):
+        """
+        Get a random chemical element.
+        :return: Chemical element.
+        Example: ChemicalElement(name='Sulfur', symbol='S',
+                                 atomic_number='16')
+        """
+        return self.random.choice(
+            table('chemical_elements', self.lang).records)
 
     def article_on_wiki(self):
         """
@@ -866,62 +2028,102 @@ class Science(object):
         :return: Link to article on Wikipedia.
         Example: https://en.wikipedia.org/wiki/Black_hole
         """
-        article = choice(pull('science_wiki', self.lang))
-        return article.strip()
+        article = self._choice('science_wiki', self.lang)
+        return article
+
+    def articles_on_wiki(self, n):
+        """
+        Get n random links to scientific articles on Wikipedia.
+        :param n: Quantity of values.
+        :return: List of links.
+        """
+        return self._choices('science_wiki', self.lang, n=n)
 
     def scientist(self):
         """
         Get a random name of scientist.
         :return: Name of scientist. Example: Konstantin Tsiolkovsky
         """
-        scientist_name = choice(pull('scientist', self.lang))
-        return scientist_name.strip()
+        scientist_name = self._choice('scientist', self.lang)
+        return scientist_name
+
+    def scientists(self, n):
+        """
+        Get n random names of scientists.
+        :param n: Quantity of values.
+        :return: List of names of scientists.
+        """
+        return self._choices('scientist', self.lang, n=n)
 
 
-class Development(object):
+class Development(BaseProvider):
     """
     Class for getting fake data for Developers.
     """
 
-    @staticmethod
-    def software_license():
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'software_license': 'software_licenses',
+        'database': 'databases',
+        'programming_language': 'programming_languages',
+        'framework': 'frameworks',
+        'github_repo': 'github_repos',
+        'os': 'operating_systems'
+    }
+
+    _licenses = (
+        'Apache License, 2.0 (Apache-2.0)',
+        'The BSD 3-Clause License',
+        'The BSD 2-Clause License',
+        'GNU General Public License (GPL)',
+        'General Public License (LGPL),'
+        'MIT software_license (MIT)',
+        'Mozilla Public License 2.0 (MPL-2.0)',
+        'Common Development and Distribution License (CDDL-1.0)',
+        'Eclipse Public License (EPL-1.0)'
+    )
+
+    _sql = ('MariaDB', 'MySQL', 'PostgreSQL', 'Oracle DB', 'SQLite')
+
+    _nosql = (
+        'MongoDB', 'RethinkDB', 'Couchbase', 'CouchDB',
+        'Aerospike', 'MemcacheDB', 'MUMPS,  Riak', 'Redis',
+        'AllegroGraph', 'Neo4J', 'InfiniteGraph'
+    )
+
+    def software_license(self):
         """
         Get a random software license from list.
         :return:
         """
-        _license = [
-            'Apache License, 2.0 (Apache-2.0)',
-            'The BSD 3-Clause License',
-            'The BSD 2-Clause License',
-            'GNU General Public License (GPL)',
-            'General Public License (LGPL),'
-            'MIT software_license (MIT)',
-            'Mozilla Public License 2.0 (MPL-2.0)',
-            'Common Development and Distribution License (CDDL-1.0)',
-            'Eclipse Public License (EPL-1.0)'
-        ]
-        return choice(_license)
+        return self.random.choice(self._licenses)
+
+    def software_licenses(self, n):
+        """
+        Get n random software licenses.
+        :param n: Quantity of values.
+        :return: List of licenses.
+        """
+        return self.random.choices(self._licenses, k=n)
 
-    @staticmethod
-    def database(nosql=False):
+    def database(self, nosql=False):
         """
         Get a random database name.
         :param nosql: only NoSQL databases.
         :return: Database name. Example: PostgreSQL.
         """
-        _nosql = [
-            'MongoDB', 'RethinkDB', 'Couchbase', 'CouchDB',
-            'Aerospike', 'MemcacheDB', 'MUMPS,  Riak', 'Redis',
-            'AllegroGraph', 'Neo4J', 'InfiniteGraph'
-        ]
+        return self.random.choice(self._nosql if nosql else self._sql)
 
-        _sql = ['MariaDB', 'MySQL', 'PostgreSQL', 'Oracle DB', 'SQLite']
-        if nosql:
-            return choice(_nosql)
-        return choice(_sql)
+    def databases(self, n, nosql=False):
+        """
+        Get n random database names.
+        :param n: Quantity of values.
+        :param nosql: only NoSQL databases.
+        :return: List of database names.
+        """
+        return self.random.choices(self._nosql if nosql else self._sql, k=n)
 
-    @staticmethod
-    def other():
+    def other(self):
         """
         Get a random value list.
         :return: Some other technology. Example: Nginx
@@ -933,18 +2135,24 @@ class Development(object):
             'Scrum', 'Redmine', 'Mercurial',
             'Apache Kafka', 'Apache Spark'
         ]
-        return choice(other_tech)
+        return self.random.choice(other_tech)
 
-    @staticmethod
-    def programming_language():
+    def programming_language(self):
         """
         Get a random programming language from list.
         :return: Programming language. Example: Erlang
         """
-        return choice(pull('pro_lang', 'en_us')).strip()
+        return self._choice('pro_lang', 'en_us')
+
+    def programming_languages(self, n):
+        """
+        Get n random programming languages from list.
+        :param n: Quantity of values.
+        :return: List of programming languages.
+        """
+        return self._choices('pro_lang', 'en_us', n=n)
 
-    @staticmethod
-    def framework(_type='back'):
+    def framework(self, _type='back'):
         """
         Get a random framework from file.
         :param _type: If _type='front' then will be returned
@@ -952,8 +2160,19 @@ class Development(object):
         :return: Framework or dict of used stack: Example:  Python/Django.
         """
         _file = 'frontend' if _type.lower() == 'front' else 'backend'
-        _framework = choice(pull(_file))
-        return _framework.strip()
+        _framework = self._choice(_file)
+        return _framework
+
+    def frameworks(self, n, _type='back'):
+        """
+        Get n random frameworks from file.
+        :param n: Quantity of values.
+        :param _type: If _type='front' then will be returned
+        front-end frameworks, else will be returned back-end frameworks.
+        :return: List of frameworks.
+        """
+        _file = 'frontend' if _type.lower() == 'front' else 'backend'
+        return self._choices(_file, n=n)
 
     def stack_of_tech(self, nosql=False):
         """
@@ -974,30 +2193,56 @@ class Development(object):
 
         return _stack
 
-    @staticmethod
-    def github_repo():
+    def github_repo(self):
         """
         Get a random link to github repository.
         :return: Link to repository.
         Example: https://github.com/lk-geimfari/church
         """
-        return choice(pull('github_repos')).strip()
+        return self._choice('github_repos')
+
+    def github_repos(self, n):
+        """
+        Get n random links to github repositories.
+        :param n: Quantity of values.
+        :return: List of links.
+        """
+        return self._choices('github_repos', n=n)
 
-    @staticmethod
-    def os():
+    def os(self):
         """
         Get a random operating system or distributive name.
         :return: os name. Example: Gentoo
         """
-        return choice(pull('os')).strip()
+        return self._choice('os')
+
+    def operating_systems(self, n):
+        """
+        Get n random operating systems, see os().
+        :param n: Quantity of values.
+        :return: List of os names.
+        """
+        return self._choices('os', n=n)
 
 
-class Food(object):
+class Food(BaseProvider):
     """
     Class for Food, i.e fruits, vegetables, berries and other.
     """
 
-    def __init__(self, lang):
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'berry': 'berries',
+        'vegetable': 'vegetables',
+        'fruit': 'fruits',
+        'dish': 'dishes',
+        'mushroom': 'mushrooms',
+        'alcoholic_drink': 'alcoholic_drinks',
+        'cocktail': 'cocktails'
+    }
+
+    def __init__(self, lang, seed=None):
+        super().__init__(seed)
         self.lang = lang.lower()
 
     def berry(self):
@@ -1005,67 +2250,123 @@ class Food(object):
         Get random berry.
         :return: Berry. Example: Blackberry
         """
-        _berry = choice(pull('berries', self.lang))
-        return _berry.strip()
+        _berry = self._choice('berries', self.lang)
+        return _berry
+
+    def berries(self, n):
+        """
+        Get n random berries.
+        :param n: Quantity of values.
+        :return: List of berries.
+        """
+        return self._choices('berries', self.lang, n=n)
 
     def vegetable(self):
         """
         Get a random vegetable.
         :return: Vegetable. Example: Tomato
         """
-        _vegetable = choice(pull('vegetables', self.lang))
-        return _vegetable.strip()
+        _vegetable = self._choice('vegetables', self.lang)
+        return _vegetable
+
+    def vegetables(self, n):
+        """
+        Get n random vegetables.
+        :param n: Quantity of values.
+        :return: List of vegetables.
+        """
+        return self._choices('vegetables', self.lang, n=n)
 
     def fruit(self):
         """
         Get a random fruit name.
         :return: Fruit. Example: Banana
         """
-        _fruit = choice(pull('fruits', self.lang))
-        return _fruit.strip()
+        _fruit = self._choice('fruits', self.lang)
+        return _fruit
+
+    def fruits(self, n):
+        """
+        Get n random fruits.
+        :param n: Quantity of values.
+        :return: List of fruits.
+        """
+        return self._choices('fruits', self.lang, n=n)
 
     def dish(self):
         """
         Get a random dish for current locale.
         :return: Dish name. Example (ru_ru): Борщ
         """
-        _dishes = choice(pull('dishes', self.lang))
-        return _dishes.strip()
+        _dishes = self._choice('dishes', self.lang)
+        return _dishes
+
+    def dishes(self, n):
+        """
+        Get n random dishes.
+        :param n: Quantity of values.
+        :return: List of dishes.
+        """
+        return self._choices('dishes', self.lang, n=n)
 
     def spices(self):
         """
         Get a random spices or herbs.
         :return: Spices or herbs.
         """
-        result = choice(pull('spices', self.lang))
-        return result.strip()
+        result = self._choice('spices', self.lang)
+        return result
 
     def mushroom(self):
         """
         Get a random mushroom's name
         :return: Mushroom's name. Example: Marasmius oreades
         """
-        result = choice(pull('mushrooms', self.lang))
-        return result.strip()
+        result = self._choice('mushrooms', self.lang)
+        return result
+
+    def mushrooms(self, n):
+        """
+        Get n random mushrooms.
+        :param n: Quantity of values.
+        :return: List of mushrooms.
+        """
+        return self._choices('mushrooms', self.lang, n=n)
 
     def alcoholic_drink(self):
         """
         Get a random alcoholic drink.
         :return: Alcoholic drink. Example: Vodka
         """
-        _ad = choice(pull('alcoholic_drinks', self.lang))
-        return _ad.strip()
+        _ad = self._choice('alcoholic_drinks', self.lang)
+        return _ad
+
+    def alcoholic_drinks(self, n):
+        """
+        Get n random alcoholic drinks.
+        :param n: Quantity of values.
+        :return: List of alcoholic drinks.
+        """
+        return self._choices('alcoholic_drinks', self.lang, n=n)
 
     def cocktail(self):
         """
         Get a random cocktail.
         :return: Cocktail name.
         """
-        _list = choice(pull('cocktails', self.lang))
-        return _list.strip()
+        _list = self._choice('cocktails', self.lang)
+        return _list
+
+    def cocktails(self, n):
+        """
+        Get n random cocktails.
+        :param n: Quantity of values.
+        :return: List of cocktails.
+        """
+        return self._choices('cocktails', self.lang, n=n)
 
 
-class Hardware(object):
+class Hardware(BaseProvider):
     """
     Class for generate data about hardware.
     All available methods:
@@ -1081,125 +2382,221 @@ class Hardware(object):
       10. cpu - cpu name.
     """
 
-    @staticmethod
-    def resolution():
+    # Batch counterparts of methods, see bulk().
+    _batch = {
+        'resolution': 'resolutions',
+        'screen_size': 'screen_sizes',
+        'cpu': 'cpus',
+        'cpu_frequency': 'cpu_frequencies',
+        'generation': 'generations',
+        'cpu_codename': 'cpu_codenames',
+        'ram_type': 'ram_types',
+        'ram_size': 'ram_sizes',
+        'ssd_or_hdd': 'ssds_or_hdds',
+        'manufacturer': 'manufacturers',
+        'phone_model': 'phone_models'
+    }
+
+    _resolutions = (
+        '1152x768', '1280x854', '1440x960',
+        '2880x1920', '1024x768', '1152x864',
+        '1280x960', '1400x1050', '1600x1200',
+        '2048x1536', '3200x2400', '1280x768',
+        '1280x1024', '2560x2048', '1280x720',
+        '1365x768', '1600x900', '1920x1080',
+        '1280x800', '1440x900', '1680x1050',
+        '1920x1200', '2560x1600'
+    )
+
+    _screen_sizes = (
+        '14″', '12.1″', '12″', '14.4″',
+        '15″', ' 15.7″', '13.3″', '13″',
+        '17″', '15.4″', ' 14.1″'
+    )
+
+    _cpus = ('Intel® Core i3', 'Intel® Core i5', 'Intel® Core i7')
+
+    _cpu_frequencies = (
+        '3.50', '3.67', '2.2', '1.6',
+        '2.7', '2.8', '3.2', '3.0',
+        '2.5', '2.9', '2.4', '4.0',
+        '3.8', '3.7', '3.9', '4.2',
+        '2.3', '2.9', '3.3', '3.1'
+    )
+
+    _generations = (
+        '2nd Generation', '3rd Generation', '4th Generation',
+        '5th Generation', '6th Generation', '7th Generation'
+    )
+
+    _cpu_codenames = (
+        'Ivytown', 'Haswell', 'Fortville',
+        'Devil\'s Canyon', 'Valley Island',
+        'Broadwell', 'Bay Trail', 'Skylake',
+        'Orchid Island', 'Bear Ridge',
+        'Cannonlake'
+    )
+
+    _ram_types = ('DDR2', 'DDR3', 'DDR4')
+
+    _ram_sizes = ('4', '6', '8', '16', '32')
+
+    _drives = (
+        '64GB SSD', '128GB SSD',
+        '256GB SDD', '512GB SSD', '1024GB SSD',
+        '256GB HDD', '256GB HDD(7200 RPM)',
+        '256GB HDD(5400 RPM)', '512GB HDD',
+        '512GB HDD(7200 RPM)', '1TB HDD',
+        '1TB HDD(7200 RPM)', '1TB HDD + 64GB SSD',
+        '2TB HDD(7200 RPM)', '512 GB HDD + 32GB SSD',
+        '1TB HDD(7200 RPM) + 32GB SSD'
+    )
+
+    _manufacturers = (
+        'Acer', 'Dell', 'ASUS',
+        'VAIO', 'Lenovo', 'HP',
+        'Toshiba', 'Sony', 'Samsung',
+        'Fujitsu', 'Apple'
+    )
+
+    def resolution(self):
         """
         Get a random screen resolution.
         :return: Resolution of screen. Example: 1280x720.
         """
-        _res = ['1152x768', '1280x854', '1440x960',
-                '2880x1920', '1024x768', '1152x864',
-                '1280x960', '1400x1050', '1600x1200',
-                '2048x1536', '3200x2400', '1280x768',
-                '1280x1024', '2560x2048', '1280x720',
-                '1365x768', '1600x900', '1920x1080',
-                '1280x800', '1440x900', '1680x1050',
-                '1920x1200', '2560x1600'
-                ]
+        return self.random.choice(self._resolutions)
 
-        return choice(_res)
+    def resolutions(self, n):
+        """
+        Get n random screen resolutions.
+        :param n: Quantity of values.
+        :return: List of resolutions.
+        """
+        return self.random.choices(self._resolutions, k=n)
 
-    @staticmethod
-    def screen_size():
+    def screen_size(self):
         """
         Get a random size of screen in inch.
         :return: Screen size. Example: 13″.
         """
-        _size = ['14″', '12.1″', '12″', '14.4″',
-                 '15″', ' 15.7″', '13.3″', '13″',
-                 '17″', '15.4″', ' 14.1″'
-                 ]
-        return choice(_size)
+        return self.random.choice(self._screen_sizes)
 
-    @staticmethod
-    def cpu():
+    def screen_sizes(self, n):
+        """
+        Get n random sizes of screens.
+        :param n: Quantity of values.
+        :return: List of screen sizes.
+        """
+        return self.random.choices(self._screen_sizes, k=n)
+
+    def cpu(self):
         """
         Get a random CPU name.
         :return: CPU name. Example: Intel® Core i7
         """
-        _cpu = ['Intel® Core i3',
-                'Intel® Core i5',
-                'Intel® Core i7']
-        return choice(_cpu)
+        return self.random.choice(self._cpus)
+
+    def cpus(self, n):
+        """
+        Get n random CPU names.
+        :param n: Quantity of values.
+        :return: List of CPU names.
+        """
+        return self.random.choices(self._cpus, k=n)
 
-    @staticmethod
-    def cpu_frequency():
+    def cpu_frequency(self):
         """
         Get a random frequency of CPU.
         :return: frequency. Example: 4.0 GHz
         """
-        _c = ['3.50', '3.67', '2.2', '1.6',
-              '2.7', '2.8', '3.2', '3.0',
-              '2.5', '2.9', '2.4', '4.0',
-              '3.8', '3.7', '3.9', '4.2',
-              '2.3', '2.9', '3.3', '3.1']
-        return choice(_c) + ' GHz'
+        return self.random.choice(self._cpu_frequencies) + ' GHz'
 
-    @staticmethod
-    def generation():
+    def cpu_frequencies(self, n):
+        """
+        Get n random frequencies of CPU.
+        :param n: Quantity of values.
+        :return: List of frequencies.
+        """
+        return [f + ' GHz' for f in
+                self.random.choices(self._cpu_frequencies, k=n)]
+
+    def generation(self):
         """
         Get a random generation.
         :return: Generation of something.
         """
-        _gn = ['2nd Generation',
-               '3rd Generation',
-               '4th Generation',
-               '5th Generation',
-               '6th Generation',
-               '7th Generation',
-               ]
-        return choice(_gn)
+        return self.random.choice(self._generations)
+
+    def generations(self, n):
+        """
+        Get n random generations.
+        :param n: Quantity of values.
+        :return: List of generations.
+        """
+        return self.random.choices(self._generations, k=n)
 
-    @staticmethod
-    def cpu_codename():
+    def cpu_codename(self):
         """
         Get a random CPU code name.
         :return: CPU code name. Example: .
         """
-        _cn = ['Ivytown', 'Haswell', 'Fortville',
-               'Devil\'s Canyon', 'Valley Island',
-               'Broadwell', 'Bay Trail', 'Skylake',
-               'Orchid Island', 'Bear Ridge',
-               'Cannonlake'
-               ]
-        return choice(_cn)
+        return self.random.choice(self._cpu_codenames)
+
+    def cpu_codenames(self, n):
+        """
+        Get n random CPU code names.
+        :param n: Quantity of values.
+        :return: List of CPU code names.
+        """
+        return self.random.choices(self._cpu_codenames, k=n)
 
-    @staticmethod
-    def ram_type():
+    def ram_type(self):
         """
         Get a random RAM type.
         :return: Type of RAM. Example: DDR3.
         """
-        return choice(['DDR2', 'DDR3', 'DDR4'])
+        return self.random.choice(self._ram_types)
+
+    def ram_types(self, n):
+        """
+        Get n random RAM types.
+        :param n: Quantity of values.
+        :return: List of types of RAM.
+        """
+        return self.random.choices(self._ram_types, k=n)
 
-    @staticmethod
-    def ram_size():
+    def ram_size(self):
         """
         Get a random size of RAM.
         :return: RAM size. Example: 16GB.
         """
-        return choice(['4', '6', '8', '16', '32']) + 'GB'
+        return self.random.choice(self._ram_sizes) + 'GB'
+
+    def ram_sizes(self, n):
+        """
+        Get n random sizes of RAM.
+        :param n: Quantity of values.
+        :return: List of RAM sizes.
+        """
+        return [size + 'GB' for size in
+                self.random.choices(self._ram_sizes, k=n)]
 
-    @staticmethod
-    def ssd_or_hdd():
+    def ssd_or_hdd(self):
         """
         Get a random value from list.
         :return: HDD or SSD. Example: 512GB HDD.
         """
-        _hard = [
-            '64GB SSD', '128GB SSD',
-            '256GB SDD', '512GB SSD', '1024GB SSD',
-            '256GB HDD', '256GB HDD(7200 RPM)',
-            '256GB HDD(5400 RPM)', '512GB HDD',
-            '512GB HDD(7200 RPM)', '1TB HDD',
-            '1TB HDD(7200 RPM)', '1TB HDD + 64GB SSD',
-            '2TB HDD(7200 RPM)', '512 GB HDD + 32GB SSD',
-            '1TB HDD(7200 RPM) + 32GB SSD'
-        ]
-        return choice(_hard)
+        return self.random.choice(self._drives)
 
-    @staticmethod
-    def graphics():
+    def ssds_or_hdds(self, n):
+        """
+        Get n random drives, see ssd_or_hdd().
+        :param n: Quantity of values.
+        :return: List of drives.
+        """
+        return self.random.choices(self._drives, k=n)
+
+    def graphics(self):
         """
         Get a random graphics.
         :return: Graphics. Example: Intel® Iris™ Pro Graphics 6200
@@ -1234,19 +2631,22 @@ class Hardware(object):
               'AMD Radeon R9 M485X',
               'AMD Radeon R9 M395'
               ]
-        return choice(_g)
+        return self.random.choice(_g)
 
-    @staticmethod
-    def manufacturer():
+    def manufacturer(self):
         """
         Get a random manufacturer.
         :return: Manufacturer. Example: Dell
         """
-        _m = ['Acer', 'Dell', 'ASUS',
-              'VAIO', 'Lenovo', 'HP',
-              'Toshiba', 'Sony', 'Samsung',
-              'Fujitsu', 'Apple']
-        return choice(_m)
+        return self.random.choice(self._manufacturers)
+
+    def manufacturers(self, n):
+        """
+        Get n random manufacturers.
+        :param n: Quantity of values.
+        :return: List of manufacturers.
+        """
+        return self.random.choices(self._manufacturers, k=n)
 
     def hardware_full_info(self):
         """
@@ -1264,11 +2664,25 @@ class Hardware(object):
         )
         return _full
 
-    @staticmethod
-    def phone_model():
+    def phone_model(self):
         """
         Get a random phone model.
         :return: Phone model. Example: Nokia Lumia 920
         """
-        _model = choice(pull('phone_models', 'en_us'))
-        return _model.strip()
+        _model = self._choice('phone_models', 'en_us')
+        return _model
+
+    def phone_models(self, n):
+        """
+        Get n random phone models.
+        :param n: Quantity of values.
+        :return: List of phone models.
+        """
+        return self._choices('phone_models', 'en_us', n=n)
+
+
+# Instrumentation is opt-in: CHURCH_STATS=1 or church.instrument(),
+# church.metrics is imported only when the variable is set.
+if environ.get('CHURCH_STATS'):
+    from .metrics import enable_from_env
+    enable_from_env()
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from functools import lru_cache
+from socket import inet_ntoa
+from struct import Struct
+
+from .cards import format_number, iin_table, numbers, scheme
+from .church import BaseProvider
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['Columns']
+
+_IP_V4 = Struct('!I')
+_IP_V6 = Struct('!7H')
+_MAC_PREFIX = 0x00163e000000
+
+
+@lru_cache(maxsize=None)
+def _hex_table(size, pattern):
+    # Strings of all numbers below size, e.g. _hex_table(256, '%02x').
+    return numpy.array([pattern % i for i in range(size)])
+
+
+def _join(parts, sep, prefix=''):
+    result = numpy.char.add(prefix, parts[0]) if prefix else parts[0]
+    for part in parts[1:]:
+        result = numpy.char.add(numpy.char.add(result, sep), part)
+    return result
+
+
+class Columns(BaseProvider):
+    """
+    Class for generate whole columns of numeric fields, i.e IPs,
+    MAC addresses, ages and another, as raw integers or strings.
+    NumPy arrays are returned when NumPy is installed, else lists.
+    Note that NumPy and pure Python give different data for one seed.
+    """
+
+    def __init__(self, seed=None, use_numpy=None):
+        """
+        :param seed: Seed or instance of random.Random.
+        :param use_numpy: if False then pure Python is used.
+        Default is True when NumPy is installed.
+        """
+        super().__init__(seed)
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError('use_numpy requires NumPy to be installed')
+
+        self.numpy = use_numpy
+        if use_numpy:
+            self._rng = numpy.random.default_rng(self.random.getrandbits(64))
+
+    def integers(self, n, minimum, maximum):
+        """
+        Generate a column of random integers.
+        :param n: Quantity of values.
+        :param minimum: min value
+        :param maximum: max value (inclusive)
+        :return: Column of integers.
+        """
+        if self.numpy:
+            return self._rng.integers(minimum, maximum, size=n,
+                                      endpoint=True)
+        return self.random.choices(range(minimum, maximum + 1), k=n)
+
+    def ip_v4(self, n, raw=False):
+        """
+        Generate a column of random IPv4 addresses.
+        :param n: Quantity of values.
+        :param raw: if True then addresses are returned as integers.
+        :return: Column of IPv4 addresses.
+        """
+        if self.numpy:
+            ips = self._rng.integers(0, 1 << 32, size=n, dtype=numpy.uint32)
+            if raw:
+                return ips
+            octets = _hex_table(256, '%d')
+            return _join([octets[(ips >> s) & 255] for s in (24, 16, 8, 0)],
+                         '.')
+
+        bits = self.random.getrandbits
+        ips = [bits(32) for _ in range(n)]
+        if raw:
+            return ips
+        pack = _IP_V4.pack
+        return [inet_ntoa(pack(ip)) for ip in ips]
+
+    def ip_v6(self, n, raw=False):
+        """
+        Generate a column of random IPv6 addresses in 2001::/16.
+        :param n: Quantity of values.
+        :param raw: if True then addresses are returned as 8 groups
+        of 16 bits: array of shape (n, 8) or list of lists of 8 integers.
+        :return: Column of IPv6 addresses.
+        """
+        if self.numpy:
+            groups = self._rng.integers(0, 1 << 16, size=(n, 8),
+                                        dtype=numpy.uint16)
+            groups[:, 0] = 0x2001
+            if raw:
+                return groups
+            table = _hex_table(1 << 16, '%x')
+            return _join([table[groups[:, i]] for i in range(1, 8)],
+                         ':', prefix='2001:')
+
+        bits = self.random.getrandbits
+        unpack = _IP_V6.unpack
+        if raw:
+            return [[0x2001, *unpack(bits(112).to_bytes(14, 'big'))]
+                    for _ in range(n)]
+        return ['2001:%x:%x:%x:%x:%x:%x:%x' % unpack(
+            bits(112).to_bytes(14, 'big')) for _ in range(n)]
+
+    def mac_address(self, n, raw=False):
+        """
+        Generate a column of random MAC addresses (00:16:3e prefix).
+        :param n: Quantity of values.
+        :param raw: if True then addresses are returned as integers.
+        :return: Column of MAC addresses.
+        """
+        if self.numpy:
+            macs = self._rng.integers(0, 1 << 23, size=n, dtype=numpy.uint64)
+            if raw:
+                return macs | numpy.uint64(_MAC_PREFIX)
+            table = _hex_table(256, '%02x')
+            return _join([table[(macs >> s) & 255] for s in (16, 8, 0)],
+                         ':', prefix='00:16:3e:')
+
+        bits = self.random.getrandbits
+        macs = [bits(23) for _ in range(n)]
+        if raw:
+            return [_MAC_PREFIX | mac for mac in macs]
+        return ['00:16:3e:%02x:%02x:%02x' % (m >> 16, (m >> 8) & 255, m & 255)
+                for m in macs]
+
+    def hex_color(self, n, raw=False):
+        """
+        Generate a column of hex colors of six different digits.
+        :param n: Quantity of values.
+        :param raw: if True then colors are returned as integers.
+        :return: Column of hex color codes. Example: #D8346B
+        """
+        if self.numpy:
+            # First six positions of random permutations of 0..15.
+            digits = self._rng.random((n, 16)).argsort(axis=1)[:, :6]
+            if raw:
+                return digits @ (16 ** numpy.arange(5, -1, -1))
+            table = _hex_table(16, '%X')
+            return _join([table[digits[:, i]] for i in range(6)],
+                         '', prefix='#')
+
+        sample = self.random.sample
+        letters = '0123456789ABCDEF'
+        colors = [''.join(sample(letters, 6)) for _ in range(n)]
+        if raw:
+            return [int(color, 16) for color in colors]
+        return ['#' + color for color in colors]
+
+    def age(self, n, minimum=16, maximum=66):
+        """
+        Generate a column of random ages.
+        :param n: Quantity of values.
+        :param minimum: min age
+        :param maximum: max age
+        :return: Column of integers.
+        """
+        return self.integers(n, int(minimum), int(maximum))
+
+    def weight(self, n, from_=38, to_=90):
+        """
+        Generate a column of random weights in KG.
+        :param n: Quantity of values.
+        :param from_: min value
+        :param to_: max value
+        :return: Column of integers.
+        """
+        return self.integers(n, int(from_), int(to_))
+
+    def cvv(self, n):
+        """
+        Generate a column of random card verification values.
+        :param n: Quantity of values.
+        :return: Column of integers.
+        """
+        return self.integers(n, 100, 999)
+
+    def credit_card_number(self, n, card_type='visa', raw=False):
+        """
+        Generate a column of random credit card numbers,
+        valid by the Luhn algorithm (see Personal.credit_card_number).
+        :param n: Quantity of values.
+        :param card_type: Issuing Network. Default is Visa
+        :param raw: if True then numbers are returned as integers.
+        :return: Column of numbers. Example: 4455 5299 1152 2451
+        """
+        network = scheme(card_type)
+        if not self.numpy:
+            result = numbers(self.random, network, n)
+            if raw:
+                return [int(number) for number in result]
+            return [format_number(number, network.groups)
+                    for number in result]
+
+        cumulative, total = iin_table(network)
+        cumulative = numpy.array(cumulative)
+        firsts = numpy.array([first for first, _ in network.ranges])
+        index = self._rng.integers(0, total, size=n)
+        i = numpy.searchsorted(cumulative, index, side='right')
+        starts = numpy.concatenate(([0], cumulative[:-1]))
+        size = network.length - 7
+        payload = (firsts[i] + index - starts[i]) * 10 ** size + \
+            self._rng.integers(0, 10 ** size, size=n)
+
+        # Digits of payload from the right, every second one
+        # from the first is doubled.
+        powers = 10 ** numpy.arange(network.length - 1, dtype=numpy.int64)
+        digits = payload[:, None] // powers % 10
+        doubled = numpy.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9])[digits[:, ::2]]
+        check = -(doubled.sum(axis=1) + digits[:, 1::2].sum(axis=1)) % 10
+        result = payload * 10 + check
+        if raw:
+            return result
+
+        # Characters of numbers with spaces between groups.
+        width = network.length + len(network.groups) - 1
+        chars = numpy.full((n, width), ord(' '), dtype=numpy.uint8)
+        groups = network.groups
+        columns = [j + k for k in range(len(groups))
+                   for j in range(sum(groups[:k]), sum(groups[:k + 1]))]
+        powers = 10 ** numpy.arange(network.length - 1, -1, -1,
+                                    dtype=numpy.int64)
+        chars[:, columns] = result[:, None] // powers % 10 + ord('0')
+        return chars.view('S{0}'.format(width)).ravel().astype('U')
+
+    def height(self, n, from_=1.5, to_=2.0, raw=False):
+        """
+        Generate a column of random heights in M.
+        :param n: Quantity of values.
+        :param from_: min value
+        :param to_: max value
+        :param raw: if True then heights are returned as floats.
+        :return: Column of heights. Example: 1.85.
+        """
+        if self.numpy:
+            heights = self._rng.uniform(float(from_), float(to_), size=n)
+            if raw:
+                return heights
+            return numpy.char.mod('%0.2f', heights)
+
+        uniform = self.random.uniform
+        heights = [uniform(float(from_), float(to_)) for _ in range(n)]
+        if raw:
+            return heights
+        return ['%0.2f' % h for h in heights]
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from datetime import date
+from functools import lru_cache
+
+from .events import UNITS
+from .utils import table
+
+__all__ = ['Formatter', 'FORMATS', 'formatter']
+
+# Named patterns. Directives are those of strftime: %Y %y %m %d %j %H %I
+# %M %S %f %p %z %B %b %A %a %%, and %:z, an offset as +03:00.
+FORMATS = {
+    'iso': '%Y-%m-%dT%H:%M:%S%:z',
+    'iso_ms': '%Y-%m-%dT%H:%M:%S.%f%:z',
+    'date': '%Y-%m-%d',
+    'time': '%H:%M:%S',
+    'datetime': '%Y-%m-%d %H:%M:%S',
+    # Common Log Format and RFC 2822 use English names in all locales.
+    'clf': '%d/%b/%Y:%H:%M:%S %z',
+    'rfc2822': '%a, %d %b %Y %H:%M:%S %z',
+}
+
+# Names of the C locale, used when lang is None.
+_C_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+             'August', 'September', 'October', 'November', 'December')
+_C_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+           'Saturday', 'Sunday')
+
+# Directives of date, they are formatted once per day.
+_DAY = {
+    'Y': '{year:04d}', 'y': '{yy:02d}', 'm': '{month:02d}',
+    'd': '{day:02d}', 'j': '{yday:03d}', 'B': '{month_name}',
+    'b': '{month_abbr}', 'A': '{day_name}', 'a': '{day_abbr}',
+}
+
+# Directives of time, arguments of the template of a day.
+_TIME = {
+    'H': '{0:02d}', 'M': '{1:02d}', 'S': '{2:02d}', 'I': '{3:02d}',
+    'p': '{4}', 'f': '{5:06d}',
+}
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _offset(seconds, colon):
+    sign = '-' if seconds < 0 else '+'
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return '{0}{1:02d}{2}{3:02d}'.format(sign, hours, ':' if colon else '',
+                                         minutes)
+
+
+def _names(lang):
+    # Names of months and days of week, abbreviations without dots.
+    if lang is None:
+        return (_C_MONTHS, tuple(m[:3] for m in _C_MONTHS),
+                _C_DAYS, tuple(d[:3] for d in _C_DAYS))
+    months = table('months', lang).columns
+    days = table('days', lang).columns
+    return (months.name, tuple(a.rstrip('.') for a in months.abbr),
+            days.name, tuple(a.rstrip('.') for a in days.abbr))
+
+
+def _join(tokens, *stages):
+    # Template of str.format, formatted once per stage: fields of the n-th
+    # stage are escaped n times, literals are escaped for every stage.
+    parts = []
+    for kind, template in tokens:
+        escapes = stages.index(kind) if kind in stages else len(stages)
+        for _ in range(escapes):
+            template = template.replace('{', '{{').replace('}', '}}')
+        parts.append(template)
+    return ''.join(parts)
+
+
+class Formatter(object):
+    """
+    Formatter of epoch timestamps by a strftime-like pattern.
+    The pattern is compiled to a template of str.format, the date part
+    is filled once per day and cached, so each timestamp costs
+    a divmod and a str.format call, without datetime objects.
+    """
+
+    def __init__(self, pattern='iso', lang='en_us', utc_offset=0,
+                 unit='s'):
+        """
+        :param pattern: Pattern or name of FORMATS.
+        :param lang: Locale of names of months and days of week,
+        None is the C locale (English), which is always used
+        by 'clf' and 'rfc2822'.
+        :param utc_offset: Offset of time zone in seconds.
+        :param unit: Unit of timestamps: 's', 'ms' or 'us'.
+        """
+        if unit not in UNITS:
+            raise KeyError('Unknown unit: {0!r}, use one of {1}'.format(
+                unit, ', '.join(UNITS)))
+        if pattern in ('clf', 'rfc2822'):
+            lang = None
+        self.pattern = FORMATS.get(pattern, pattern)
+        self.lang = lang
+        self.utc_offset = int(utc_offset)
+        self.unit = unit
+        self._names = _names(lang)
+        self._days = {}
+        self._compile(self.pattern)
+
+    def _compile(self, pattern):
+        # Tokens as (kind, template), kind is 'day', 'time' or ''
+        # for literals, including offsets, which are the same for
+        # all timestamps of a formatter.
+        tokens = []
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if c != '%':
+                tokens.append(('', c))
+                i += 1
+                continue
+            directive = pattern[i + 1:i + 2]
+            if directive == ':' and pattern[i + 2:i + 3] == 'z':
+                tokens.append(('', _offset(self.utc_offset, True)))
+                i += 3
+                continue
+            if directive in _DAY:
+                tokens.append(('day', _DAY[directive]))
+            elif directive in _TIME:
+                tokens.append(('time', _TIME[directive]))
+            elif directive == 'z':
+                tokens.append(('', _offset(self.utc_offset, False)))
+            elif directive == '%':
+                tokens.append(('', '%'))
+            else:
+                raise ValueError('Unsupported directive: %{0}'.format(
+                    directive))
+            i += 2
+
+        # Time of day is formatted once per second of day, when fields
+        # of time are together, i.e %H:%M:%S, and there is no %f.
+        times = [i for i, (kind, _) in enumerate(tokens) if kind == 'time']
+        first, last = (times[0], times[-1] + 1) if times else (0, 0)
+        self._mixed = ('time', _TIME['f']) in tokens or any(
+            kind == 'day' for kind, _ in tokens[first:last])
+        if self._mixed:
+            # Template of two stages: the first one gets fields of a day,
+            # the second one gets fields of time.
+            self._middle = _join(tokens, 'day', 'time')
+        else:
+            self._prefix = _join(tokens[:first], 'day')
+            self._suffix = _join(tokens[last:], 'day')
+            self._middle = _join(tokens[first:last], 'time')
+        self._times = {}
+
+    def _day(self, day):
+        d = date.fromordinal(_EPOCH_ORDINAL + day)
+        months, months_abbr, days, days_abbr = self._names
+        weekday = d.weekday()
+        fields = dict(
+            year=d.year, yy=d.year % 100, month=d.month, day=d.day,
+            yday=d.timetuple().tm_yday,
+            month_name=months[d.month - 1],
+            month_abbr=months_abbr[d.month - 1],
+            day_name=days[weekday], day_abbr=days_abbr[weekday])
+        if self._mixed:
+            value = self._middle.format_map(fields).format
+        else:
+            value = (self._prefix.format_map(fields),
+                     self._suffix.format_map(fields))
+        self._days[day] = value
+        return value
+
+    def _time(self, second):
+        hour, minute = divmod(second // 60, 60)
+        value = self._middle.format(
+            hour, minute, second % 60, hour % 12 or 12,
+            'AM' if hour < 12 else 'PM', 0)
+        self._times[second] = value
+        return value
+
+    def format(self, timestamps):
+        """
+        Format timestamps.
+        :param timestamps: Iterable of integers (i.e a NumPy array).
+        :return: List of strings.
+        """
+        if hasattr(timestamps, 'tolist'):
+            timestamps = timestamps.tolist()
+        scale = UNITS[self.unit]
+        offset = self.utc_offset * scale
+        days, get_day = self._days, self._day
+        result = []
+        append = result.append
+        if self._mixed:
+            micro = 1000000 // scale
+            for t in timestamps:
+                t, fraction = divmod(t + offset, scale)
+                day, t = divmod(t, 86400)
+                hour, t = divmod(t, 3600)
+                minute, second = divmod(t, 60)
+                append((days.get(day) or get_day(day))(
+                    hour, minute, second, hour % 12 or 12,
+                    'AM' if hour < 12 else 'PM', fraction * micro))
+            return result
+
+        # A timestamp costs two lookups and a concatenation,
+        # repeats of sorted timestamps cost a comparison.
+        times, get_time = self._times, self._time
+        unit_day = 86400 * scale
+        last = value = None
+        for t in timestamps:
+            if t != last:
+                last = t
+                day, t = divmod(t + offset, unit_day)
+                prefix, suffix = days.get(day) or get_day(day)
+                t //= scale
+                value = prefix + (times.get(t) or get_time(t)) + suffix
+            append(value)
+        return result
+
+    def __call__(self, timestamp):
+        return self.format((timestamp,))[0]
+
+    def __repr__(self):
+        return '<Formatter {0!r} {1}>'.format(self.pattern, self.lang)
+
+
+@lru_cache(maxsize=64)
+def formatter(pattern='iso', lang='en_us', utc_offset=0, unit='s'):
+    """
+    Get a formatter, formatters are kept with their caches of days.
+    :return: Formatter.
+    """
+    return Formatter(pattern, lang, utc_offset, unit)
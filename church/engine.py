@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import os
+from collections import deque
+from random import Random
+
+__all__ = ['generate', 'stream', 'shard_seed']
+
+SHARD_SIZE = 10000
+
+
+def shard_seed(seed, index):
+    """
+    Derive the seed of a shard.
+    :param seed: Seed of the whole run.
+    :param index: Index of shard.
+    :return: Seed for random.Random.
+    """
+    # String seeds are hashed with SHA-512 by random.Random,
+    # so neighbouring shards get unrelated streams.
+    return '{0}/{1}'.format(seed, index)
+
+
+def _shard(recipe, lang, seed, index, size):
+    make = recipe(lang, Random(shard_seed(seed, index)))
+    return [make() for _ in range(size)]
+
+
+def _shards(count, shard_size):
+    for index, start in enumerate(range(0, count, shard_size)):
+        yield index, min(shard_size, count - start)
+
+
+def stream(recipe, count, lang='en_us', seed=None,
+           workers=None, shard_size=SHARD_SIZE):
+    """
+    Generate records on a pool of processes.
+    The work is split into shards of shard_size records, every shard
+    gets its own seed, so the result doesn't depend on workers.
+    :param recipe: Picklable (i.e. module-level) callable which takes
+    lang and an instance of random.Random and returns a function
+    that makes one record. Example:
+
+        def user(lang, rnd):
+            person = Personal(lang, seed=rnd)
+            return lambda: (person.full_name(), person.email())
+
+    :param count: Quantity of records.
+    :param lang: Locale passed to recipe.
+    :param seed: Seed of the run. Default is a random seed.
+    :param workers: Quantity of processes. Default is os.cpu_count().
+    If it's 1 then records are generated in this process.
+    :param shard_size: Quantity of records in one shard.
+    :return: Generator of records in order.
+    """
+    if seed is None:
+        seed = Random().getrandbits(64)
+    workers = workers or os.cpu_count() or 1
+    shards = _shards(count, shard_size)
+
+    if workers == 1:
+        for index, size in shards:
+            yield from _shard(recipe, lang, seed, index, size)
+        return
+
+    # Imported here, it takes longer than the rest of church
+    # and it's only needed for the pool.
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Only a few shards per worker are in flight,
+    # so memory doesn't grow with count.
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for index, size in shards:
+            pending.append(executor.submit(
+                _shard, recipe, lang, seed, index, size))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def generate(recipe, count, lang='en_us', seed=None,
+             workers=None, shard_size=SHARD_SIZE):
+    """
+    Generate records on a pool of processes.
+    See stream() for arguments.
+    :return: List of records.
+    """
+    return list(stream(recipe, count, lang, seed, workers, shard_size))
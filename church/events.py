@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+# NumPy is imported on first use: it takes longer to import
+# than the rest of the package.
+
+__all__ = ['Seasonality', 'DIURNAL', 'WEEKLY', 'UNITS', 'arrivals',
+           'chunks', 'epoch', 'generator', 'to_datetimes']
+
+# Traffic of a web service by hour of day, from 00:00 to 23:00.
+DIURNAL = (0.35, 0.25, 0.2, 0.18, 0.18, 0.22, 0.35, 0.6, 0.9, 1.2, 1.4, 1.5,
+           1.5, 1.5, 1.45, 1.4, 1.35, 1.3, 1.3, 1.35, 1.3, 1.1, 0.8, 0.55)
+
+# Traffic by day of week, from Monday to Sunday.
+WEEKLY = (1.1, 1.1, 1.1, 1.1, 1.05, 0.8, 0.75)
+
+# Units of timestamps: units per second.
+UNITS = {'s': 1, 'ms': 1000, 'us': 1000000}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _normalize(profile):
+    mean = sum(profile) / len(profile)
+    return tuple(p / mean for p in profile)
+
+
+class Seasonality(object):
+    """
+    Rate of events over time: a base rate multiplied by profiles
+    of hour of day and day of week, and random bursts.
+    Profiles are normalized, so the base rate is the mean rate.
+    """
+
+    def __init__(self, diurnal=DIURNAL, weekly=WEEKLY, bursts=0.0,
+                 burst_factor=10.0, burst_duration=300, utc_offset=0):
+        """
+        :param diurnal: 24 multipliers of rate by hour of day.
+        Default is a profile of a web service, None is flat.
+        :param weekly: 7 multipliers of rate by day of week.
+        :param bursts: Probability that a burst starts in an hour.
+        :param burst_factor: Multiplier of rate in bursts.
+        :param burst_duration: Duration of bursts in seconds.
+        :param utc_offset: Offset of local time of profiles in seconds.
+        """
+        if diurnal is not None and len(diurnal) != 24:
+            raise ValueError('diurnal must have 24 values')
+        if weekly is not None and len(weekly) != 7:
+            raise ValueError('weekly must have 7 values')
+        self.diurnal = _normalize(diurnal) if diurnal else (1.0,) * 24
+        self.weekly = _normalize(weekly) if weekly else (1.0,) * 7
+        self.bursts = bursts
+        self.burst_factor = burst_factor
+        self.burst_duration = int(burst_duration)
+        self.utc_offset = int(utc_offset)
+
+    def segments(self, rnd, rate, start, stop=None):
+        """
+        Split time into intervals of constant rate.
+        :param rnd: Instance of random.Random, draws bursts.
+        :param rate: Mean rate of events per second.
+        :param start: Epoch seconds.
+        :param stop: Epoch seconds. Default is endless.
+        :return: Iterator of tuples (start, stop, rate).
+        """
+        diurnal, weekly = self.diurnal, self.weekly
+        offset = self.utc_offset
+        bursts = []
+        t = start
+        hour = start - (start + offset) % 3600
+        while stop is None or t < stop:
+            end = hour + 3600 if stop is None else min(hour + 3600, stop)
+            local = hour + offset
+            # 1970-01-01 was a Thursday.
+            base = rate * diurnal[local // 3600 % 24] * \
+                weekly[(local // 86400 + 3) % 7]
+
+            if self.bursts and rnd.random() < self.bursts:
+                begin = hour + int(rnd.random() * 3600)
+                bursts.append((begin, begin + self.burst_duration))
+
+            points = {t, end}
+            for begin, finish in bursts:
+                points.update(p for p in (begin, finish) if t < p < end)
+            points = sorted(points)
+            for a, b in zip(points, points[1:]):
+                if any(begin <= a < finish for begin, finish in bursts):
+                    yield a, b, base * self.burst_factor
+                else:
+                    yield a, b, base
+            bursts = [burst for burst in bursts if burst[1] > end]
+            t = hour = end
+
+
+def _python_arrivals(rnd, segments, scale):
+    # Exponential gaps, Poisson process is memoryless,
+    # so it restarts at borders of segments.
+    expovariate = rnd.expovariate
+    result = []
+    append = result.append
+    for start, stop, rate in segments:
+        if rate <= 0:
+            continue
+        t = start + expovariate(rate)
+        while t < stop:
+            append(int(t * scale))
+            t += expovariate(rate)
+    return result
+
+
+def generator(rnd, use_numpy=None):
+    """
+    Create a NumPy generator seeded from a Random.
+    :param rnd: Instance of random.Random.
+    :param use_numpy: if False then None is returned.
+    Default is a generator when NumPy is installed.
+    :return: numpy.random.Generator or None.
+    :raises ImportError: if use_numpy is True and NumPy is not installed.
+    """
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise ImportError('use_numpy requires NumPy to be installed')
+        return None
+    return numpy.random.default_rng(rnd.getrandbits(64))
+
+
+def _numpy_arrivals(rng, segments, scale):
+    # Counts of events of each second, events of a second
+    # get random offsets in the second.
+    import numpy
+    seconds = []
+    for start, stop, rate in segments:
+        counts = rng.poisson(rate, stop - start)
+        seconds.append(numpy.repeat(
+            numpy.arange(start, stop, dtype=numpy.int64), counts))
+    if not seconds:
+        return numpy.empty(0, dtype=numpy.int64)
+    result = numpy.concatenate(seconds)
+    if scale > 1:
+        result *= scale
+        result += rng.integers(0, scale, size=len(result))
+        # Almost sorted, the stable sort of integers is a radix sort.
+        result.sort(kind='stable')
+    return result
+
+
+def arrivals(rnd, segments, unit='s', rng=None):
+    """
+    Generate times of events of a Poisson process.
+    :param rnd: Instance of random.Random.
+    :param segments: Iterable of (start, stop, rate) in epoch seconds.
+    :param unit: Unit of timestamps (see UNITS).
+    :param rng: Instance of numpy.random.Generator.
+    Default is pure Python.
+    :return: Sorted epoch timestamps, NumPy array if rng is given,
+    else list of integers.
+    """
+    if unit not in UNITS:
+        raise KeyError('Unknown unit: {0!r}, use one of {1}'.format(
+            unit, ', '.join(UNITS)))
+    if rng is not None:
+        return _numpy_arrivals(rng, segments, UNITS[unit])
+    return _python_arrivals(rnd, segments, UNITS[unit])
+
+
+def chunks(segments, start, size):
+    """
+    Group intervals into chunks of time.
+    :param segments: Iterable of (start, stop, rate).
+    :param start: Start of the first chunk in epoch seconds.
+    :param size: Duration of chunks in seconds.
+    :return: Iterator of lists of (start, stop, rate).
+    """
+    border = start + size
+    chunk = []
+    for a, b, rate in segments:
+        while b > border:
+            if a < border:
+                chunk.append((a, border, rate))
+                a = border
+            yield chunk
+            chunk = []
+            border += size
+        chunk.append((a, b, rate))
+        if b == border:
+            yield chunk
+            chunk = []
+            border += size
+    if chunk:
+        yield chunk
+
+
+def epoch(value):
+    """
+    Convert a time to epoch seconds.
+    :param value: Epoch seconds, date or datetime (naive is UTC).
+    :return: Integer.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int((value - _EPOCH).total_seconds())
+    if isinstance(value, date):
+        return (value - _EPOCH.date()).days * 86400
+    return int(value)
+
+
+def to_datetimes(timestamps, unit='s', utc_offset=0):
+    """
+    Convert epoch timestamps to datetimes.
+    :param timestamps: NumPy array or list of integers.
+    :param unit: Unit of timestamps (see UNITS).
+    :param utc_offset: Offset of time zone of datetimes in seconds.
+    :return: Array of numpy.datetime64 (naive, UTC) for arrays,
+    else list of aware datetimes.
+    """
+    # There are no arrays until NumPy is imported.
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(timestamps, numpy.ndarray):
+        return timestamps.astype('datetime64[{0}]'.format(unit))
+    scale = 1000000 // UNITS[unit]
+    start = _EPOCH.astimezone(timezone(timedelta(seconds=utc_offset)))
+    return [start + timedelta(microseconds=t * scale) for t in timestamps]
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import csv
+import io
+import json
+from itertools import chain, islice
+
+__all__ = ['to_csv', 'to_jsonl', 'to_sql', 'sql_literal']
+
+BATCH_SIZE = 10000
+
+
+def _batches(records, size):
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _prepare(records, names):
+    # Take names from the first record when records are dicts.
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return names, iter(())
+
+    records = chain((first,), records)
+    if isinstance(first, dict):
+        names = tuple(names or first)
+        records = (tuple(r[name] for name in names) for r in records)
+    return names, records
+
+
+def to_csv(records, file, names=None, batch_size=BATCH_SIZE, **fmtparams):
+    """
+    Write records to CSV.
+    :param records: Iterable of tuples or dicts.
+    :param file: Text file object (open it with newline='').
+    :param names: Column names for the header. Default are keys
+    of the first record for dicts and no header for tuples.
+    :param batch_size: Quantity of rows in one write.
+    :param fmtparams: Formatting parameters of csv.writer.
+    :return: Quantity of written rows.
+    """
+    names, records = _prepare(records, names)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, **fmtparams)
+    if names:
+        writer.writerow(names)
+
+    count = 0
+    for batch in _batches(records, batch_size):
+        writer.writerows(batch)
+        file.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+        count += len(batch)
+
+    if names and not count:
+        file.write(buffer.getvalue())
+    return count
+
+
+def to_jsonl(records, file, names=None, batch_size=BATCH_SIZE):
+    """
+    Write records to JSON Lines, one object per line.
+    :param records: Iterable of tuples or dicts.
+    :param file: Text file object.
+    :param names: Keys of objects. Without names tuples are written
+    as arrays.
+    :param batch_size: Quantity of rows in one write.
+    :return: Quantity of written rows.
+    """
+    names, records = _prepare(records, names)
+    dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+    count = 0
+    for batch in _batches(records, batch_size):
+        if names:
+            lines = [dumps(dict(zip(names, row))) for row in batch]
+        else:
+            lines = [dumps(row) for row in batch]
+        lines.append('')
+        file.write('\n'.join(lines))
+        count += len(batch)
+    return count
+
+
+def sql_literal(value):
+    """
+    Convert a value to SQL literal.
+    :param value: Value.
+    :return: Literal. Example: 'O''Neil'
+    """
+    if value is None:
+        return 'NULL'
+    if value is True or value is False:
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'{0}'".format(str(value).replace("'", "''"))
+
+
+def _identifier(name):
+    return '"{0}"'.format(name.replace('"', '""'))
+
+
+def to_sql(records, file, table, names=None, batch_size=1000):
+    """
+    Write records as multi-row INSERT statements.
+    :param records: Iterable of tuples or dicts.
+    :param file: Text file object.
+    :param table: Name of table.
+    :param names: Column names. Default are keys of the first record
+    for dicts and no column list for tuples.
+    :param batch_size: Quantity of rows in one INSERT statement.
+    :return: Quantity of written rows.
+    """
+    names, records = _prepare(records, names)
+    head = 'INSERT INTO {0}'.format(_identifier(table))
+    if names:
+        head += ' ({0})'.format(', '.join(_identifier(n) for n in names))
+    head += ' VALUES\n'
+
+    count = 0
+    for batch in _batches(records, batch_size):
+        rows = ',\n'.join(
+            '(' + ', '.join(map(sql_literal, row)) + ')' for row in batch)
+        file.write(head + rows + ';\n')
+        count += len(batch)
+    return count
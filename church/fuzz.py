@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+
+from .church import BaseProvider
+from .utils import pull
+
+__all__ = ['Corpus', 'Fuzzer', 'corpus', 'CATEGORIES']
+
+# Categories of naughty strings. A string can be in several categories.
+CATEGORIES = {
+    'blank': re.compile(r'^\s*$'),
+    'reserved': re.compile(
+        r'^(undefined|undef|null|NULL|\(null\)|nil|NIL|true|false|True|'
+        r'False|TRUE|FALSE|None|hasOwnProperty|\\|\\\\|'
+        r'(CON|PRN|AUX|NUL|COM\d|LPT\d)(\.\w+)?)$'),
+    'numeric': re.compile(
+        r'^[-+]?[$]?[\d.,\' ]*\d[\d.,\' eE+/-]*$|'
+        r'Infinity|NaN|QNAN|0x[0-9a-fA-F]+'),
+    'script': re.compile(
+        r'<\s*/?\s*script|javascript|on\w+\s*=|alert\(|<img|<iframe|'
+        r'<svg|<a\s|expression\(', re.IGNORECASE),
+    'sql': re.compile(
+        r"'\s*OR\s*'|\bOR\s+1\s*=\s*1|^--$|;\s*DROP\s|\bSELECT\b|"
+        r"\bUNION\b|' --|1'='1", re.IGNORECASE),
+    'command': re.compile(
+        r'\$\(|`\w[^`]*`|&&|;\s*(ls|rm|cat|touch|echo|id|sleep)\b|'
+        r'/dev/null|/etc/passwd|%[*\d.]*[sdnx]|\$\{|\beval\(|Kernel\.'),
+    'unicode': re.compile(r'[^\x00-\x7f]'),
+}
+
+
+class Corpus(Sequence):
+    """
+    Read-only sequence of naughty strings with categories.
+    Authors of big-list-of-naughty-strings is Max Woolf and contributors.
+    Repository: https://github.com/minimaxir/big-list-of-naughty-strings
+    """
+
+    __slots__ = ('_strings', '_categories')
+
+    def __init__(self, strings):
+        self._strings = tuple(strings)
+        self._categories = {}
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __getitem__(self, i):
+        return self._strings[i]
+
+    def __iter__(self):
+        return iter(self._strings)
+
+    def category(self, name=None):
+        """
+        Get strings of a category.
+        :param name: Name of category (see CATEGORIES).
+        Default is all strings.
+        :return: Tuple of strings.
+        """
+        if name is None:
+            return self._strings
+
+        strings = self._categories.get(name)
+        if strings is None:
+            if name not in CATEGORIES:
+                raise KeyError('Unknown category: {0!r}'.format(name))
+            search = CATEGORIES[name].search
+            strings = tuple(s for s in self._strings if search(s))
+            self._categories[name] = strings
+        return strings
+
+    def categories(self, string):
+        """
+        Get categories of a string.
+        :param string: String.
+        :return: List of names of categories.
+        """
+        return [name for name, regex in CATEGORIES.items()
+                if regex.search(string)]
+
+    def iter(self, *names):
+        """
+        Iterate over strings which are in any of categories.
+        :param names: Names of categories. Default is all strings.
+        :return: Iterator of strings.
+        """
+        if not names:
+            return iter(self._strings)
+        wanted = set()
+        for name in names:
+            wanted.update(self.category(name))
+        return (s for s in self._strings if s in wanted)
+
+    def __repr__(self):
+        return '<Corpus of {0} strings>'.format(len(self))
+
+
+@lru_cache(maxsize=None)
+def corpus():
+    """
+    Get the naughty strings corpus, it's built once per process.
+    :return: Corpus.
+    """
+    return Corpus(pull('naughty_strings', 'other'))
+
+
+def _prefix(bad, word, emoji, i):
+    return bad + ' ' + word
+
+
+def _suffix(bad, word, emoji, i):
+    return word + ' ' + bad
+
+
+def _insert(bad, word, emoji, i):
+    i %= len(word) + 1
+    return word[:i] + bad + word[i:]
+
+
+def _wrap(bad, word, emoji, i):
+    return emoji + bad + emoji
+
+
+def _repeat(bad, word, emoji, i):
+    return bad * (i % 4 + 2)
+
+
+def _truncate(bad, word, emoji, i):
+    return bad[:i % (len(bad) + 1)]
+
+
+def _plain(bad, word, emoji, i):
+    return bad
+
+
+# Mutations of a naughty string with a word and an emoji.
+MUTATIONS = {
+    'plain': _plain,
+    'prefix': _prefix,
+    'suffix': _suffix,
+    'insert': _insert,
+    'wrap': _wrap,
+    'repeat': _repeat,
+    'truncate': _truncate,
+}
+
+
+class Fuzzer(BaseProvider):
+    """
+    Class for generate fuzzing input: naughty strings and their
+    mutations with words and emoji.
+    """
+
+    _batch = {
+        'naughty_string': 'naughty_strings',
+        'mutation': 'mutations',
+    }
+
+    def __init__(self, lang='en_us', seed=None, categories=(),
+                 mutations=tuple(MUTATIONS)):
+        """
+        :param lang: Locale of words.
+        :param seed: Seed or instance of random.Random.
+        :param categories: Categories of naughty strings.
+        Default is all strings.
+        :param mutations: Names of mutations (see MUTATIONS).
+        """
+        super().__init__(seed)
+        self.lang = lang.lower()
+        self.strings = tuple(corpus().iter(*categories))
+        self._mutations = tuple(MUTATIONS[name] for name in mutations)
+
+    def naughty_string(self):
+        """
+        Get a random naughty string.
+        :return: Naughty string.
+        """
+        return self.random.choice(self.strings)
+
+    def naughty_strings(self, n):
+        """
+        Get n random naughty strings.
+        :param n: Quantity of values.
+        :return: List of naughty strings.
+        """
+        return self.random.choices(self.strings, k=n)
+
+    def mutation(self):
+        """
+        Get a random mutation of a naughty string.
+        :return: String. Example: science<script>alert(123)</script>
+        """
+        return self.mutations(1)[0]
+
+    def mutations(self, n):
+        """
+        Get n random mutations of naughty strings.
+        :param n: Quantity of values.
+        :return: List of strings.
+        """
+        choices = self.random.choices
+        return list(map(
+            lambda func, *args: func(*args),
+            choices(self._mutations, k=n),
+            choices(self.strings, k=n),
+            self._choices('words', self.lang, n=n),
+            self._choices('emoji', 'en_us', n=n),
+            choices(range(256), k=n)))
+
+    def stream(self, batch_size=10000):
+        """
+        Endless stream of mutations.
+        :param batch_size: Quantity of values generated at once.
+        :return: Iterator of strings.
+        """
+        while True:
+            yield from self.mutations(batch_size)
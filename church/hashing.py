@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import hashlib
+import os
+from base64 import b64encode
+
+__all__ = ['ALGORITHMS', 'DIGESTS', 'KDFS', 'hash_password',
+           'hash_passwords']
+
+# Unsalted hex digests.
+DIGESTS = ('md5', 'sha1', 'sha256', 'sha512')
+
+# Salted key derivation functions with default parameters.
+# Hashes are encoded as by Django, i.e pbkdf2_sha256$iterations$salt$hash
+KDFS = {
+    'pbkdf2_sha1': {'iterations': 600000},
+    'pbkdf2_sha256': {'iterations': 600000},
+    'pbkdf2_sha512': {'iterations': 210000},
+    'scrypt': {'cost': 2 ** 14, 'block_size': 8, 'parallelism': 1},
+}
+
+ALGORITHMS = DIGESTS + tuple(KDFS)
+
+
+def _pbkdf2(name, password, salt, iterations):
+    key = hashlib.pbkdf2_hmac(name, password.encode(), salt.encode(),
+                              iterations)
+    return 'pbkdf2_{0}${1}${2}${3}'.format(
+        name, iterations, salt, b64encode(key).decode('ascii'))
+
+
+def _scrypt(password, salt, cost, block_size, parallelism):
+    # Twice the memory which scrypt needs.
+    maxmem = 256 * cost * block_size * parallelism
+    key = hashlib.scrypt(password.encode(), salt=salt.encode(), n=cost,
+                         r=block_size, p=parallelism, maxmem=maxmem,
+                         dklen=64)
+    return 'scrypt${0}${1}${2}${3}${4}'.format(
+        cost, salt, block_size, parallelism, b64encode(key).decode('ascii'))
+
+
+def _hasher(algorithm, params):
+    algorithm = algorithm.lower()
+    if algorithm in DIGESTS:
+        new = getattr(hashlib, algorithm)
+        return lambda password, salt: new(password.encode()).hexdigest()
+
+    if algorithm not in KDFS:
+        raise ValueError('Unsupported algorithm: {0!r}, use one of '
+                         '{1}'.format(algorithm, ', '.join(ALGORITHMS)))
+    unknown = set(params) - set(KDFS[algorithm])
+    if unknown:
+        raise TypeError('Unknown parameters of {0}: {1}'.format(
+            algorithm, ', '.join(sorted(unknown))))
+    params = dict(KDFS[algorithm], **params)
+
+    if algorithm == 'scrypt':
+        return lambda password, salt: _scrypt(password, salt, **params)
+    name = algorithm[len('pbkdf2_'):]
+    return lambda password, salt: _pbkdf2(name, password, salt, **params)
+
+
+def hash_password(password, algorithm, salt='', **params):
+    """
+    Hash a password.
+    :param password: Password.
+    :param algorithm: One of ALGORITHMS.
+    :param salt: Salt of key derivation functions, digests are unsalted.
+    :param params: Parameters of key derivation function (see KDFS).
+    :return: Hex digest or encoded hash.
+    Example: pbkdf2_sha256$600000$E4wgKnQ2aQ1Y$Ml5MZjcMUz...
+    """
+    return _hasher(algorithm, params)(password, salt)
+
+
+def _hash_chunk(hasher, passwords, salts):
+    return list(map(hasher, passwords, salts))
+
+
+def hash_passwords(passwords, algorithm, salts=None, workers=None,
+                   **params):
+    """
+    Hash passwords on a pool of threads.
+    hashlib releases the GIL in key derivation functions, so they
+    are computed in parallel. Digests of short strings hold the GIL,
+    so they are computed in this thread.
+    :param passwords: List of passwords.
+    :param algorithm: One of ALGORITHMS.
+    :param salts: List of salts. Default is no salt.
+    :param workers: Quantity of threads. Default is os.cpu_count().
+    :param params: Parameters of key derivation function (see KDFS).
+    :return: List of hashes in order of passwords.
+    """
+    hasher = _hasher(algorithm, params)
+    if salts is None:
+        salts = [''] * len(passwords)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or algorithm.lower() in DIGESTS or len(passwords) < 2:
+        return _hash_chunk(hasher, passwords, salts)
+
+    # Imported here, like in church.engine.
+    from concurrent.futures import ThreadPoolExecutor
+
+    # A few chunks per thread, so threads finish at about the same time
+    # and the overhead of tasks doesn't matter.
+    size = max(1, len(passwords) // (workers * 4))
+    result = []
+    with ThreadPoolExecutor(workers) as executor:
+        chunks = [executor.submit(_hash_chunk, hasher,
+                                  passwords[i:i + size], salts[i:i + size])
+                  for i in range(0, len(passwords), size)]
+        for chunk in chunks:
+            result.extend(chunk.result())
+    return result
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import sqlite3
+from contextlib import nullcontext
+
+from .exporters import BATCH_SIZE, _batches, _identifier, _prepare, to_csv
+
+__all__ = ['load_sqlite', 'to_copy', 'copy_value']
+
+# Characters escaped in COPY text format.
+_COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def load_sqlite(records, db, table, names=None, batch_size=BATCH_SIZE,
+                indexes=(), fast=False):
+    """
+    Load records into a table of SQLite database.
+    Table is created when it doesn't exist. All rows are inserted
+    in one transaction with executemany() in batches. When the
+    connection has an open transaction, rows are inserted in it
+    and it's left for the caller to commit.
+    :param records: Iterable of tuples or dicts.
+    :param db: Instance of sqlite3.Connection or path to database.
+    :param table: Name of table.
+    :param names: Column names. Default are keys of the first record
+    for dicts and c0, c1, ... for tuples.
+    :param batch_size: Quantity of rows in one executemany().
+    :param indexes: Columns (names or tuples of names) to index
+    after loading.
+    :param fast: if True then journal is kept in memory and syncs
+    are off, i.e a crash during loading can corrupt the database.
+    Settings of a given connection are restored after loading.
+    SQLite can't change them inside a transaction, so ValueError
+    is raised for a connection with an open transaction.
+    :return: Quantity of loaded rows.
+    """
+    if fast and not isinstance(db, str) and db.in_transaction:
+        raise ValueError('fast loading needs a connection '
+                         'without an open transaction')
+
+    names, records = _prepare(records, names)
+    batches = _batches(records, batch_size)
+    first = next(batches, [])
+    if not first:
+        return 0
+    names = names or ['c{0}'.format(i) for i in range(len(first[0]))]
+
+    conn = sqlite3.connect(db) if isinstance(db, str) else db
+    # A transaction of the caller is neither committed
+    # nor rolled back here.
+    transaction = nullcontext() if conn.in_transaction else conn
+    pragmas = None
+    try:
+        if fast:
+            if conn is db:
+                pragmas = [(name, conn.execute(
+                    'PRAGMA {0}'.format(name)).fetchone()[0])
+                    for name in ('synchronous', 'journal_mode')]
+            conn.execute('PRAGMA synchronous = OFF')
+            conn.execute('PRAGMA journal_mode = MEMORY')
+
+        columns = ', '.join(_identifier(name) for name in names)
+        insert = 'INSERT INTO {0} ({1}) VALUES ({2})'.format(
+            _identifier(table), columns, ', '.join('?' * len(names)))
+
+        count = 0
+        with transaction:
+            conn.execute('CREATE TABLE IF NOT EXISTS {0} ({1})'.format(
+                _identifier(table), columns))
+            conn.executemany(insert, first)
+            count += len(first)
+            for batch in batches:
+                conn.executemany(insert, batch)
+                count += len(batch)
+
+        # Indexes are built once, which is much faster
+        # than updating them on every insert.
+        with transaction:
+            for index in indexes:
+                index = (index,) if isinstance(index, str) else tuple(index)
+                conn.execute('CREATE INDEX IF NOT EXISTS {0} '
+                             'ON {1} ({2})'.format(
+                                 _identifier('_'.join((table,) + index)),
+                                 _identifier(table),
+                                 ', '.join(map(_identifier, index))))
+    finally:
+        if conn is not db:
+            conn.close()
+        elif pragmas:
+            for name, value in pragmas:
+                conn.execute('PRAGMA {0} = {1}'.format(name, value))
+    return count
+
+
+def copy_value(value):
+    """
+    Convert a value to a field of PostgreSQL COPY text format.
+    :param value: Value.
+    :return: Field. Example: \\N
+    """
+    if value is None:
+        return '\\N'
+    if value is True or value is False:
+        return 't' if value else 'f'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def to_copy(records, file, names=None, format='text',
+            batch_size=BATCH_SIZE):
+    """
+    Write records in a format of PostgreSQL COPY, i.e for:
+
+        \\copy users FROM 'users.tsv'
+        \\copy users FROM 'users.csv' WITH (FORMAT csv, HEADER)
+
+    :param records: Iterable of tuples or dicts.
+    :param file: Text file object.
+    :param names: Column names. They are written as header only
+    in csv format.
+    :param format: 'text' or 'csv'.
+    :param batch_size: Quantity of rows in one write.
+    :return: Quantity of written rows.
+    """
+    if format == 'csv':
+        return to_csv(records, file, names, batch_size)
+    if format != 'text':
+        raise ValueError('format must be text or csv')
+
+    _, records = _prepare(records, names)
+    count = 0
+    for batch in _batches(records, batch_size):
+        lines = ['\t'.join(map(copy_value, row)) for row in batch]
+        lines.append('')
+        file.write('\n'.join(lines))
+        count += len(batch)
+    return count
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import json
+import time
+from math import exp
+from operator import getitem
+from statistics import NormalDist
+
+from .church import Network, Personal, _random
+from .dates import formatter
+from .events import Seasonality, arrivals, chunks, epoch, generator
+from .subnets import RESERVED_V4
+from .utils import Weighted
+
+__all__ = ['AccessLog', 'FORMATS', 'PATHS', 'METHODS', 'STATUSES',
+           'REFERRERS', 'SIZE']
+
+# Common Log Format, Combined Log Format (with referrer and user agent)
+# and JSON Lines with names of variables of nginx.
+FORMATS = ('common', 'combined', 'json')
+
+# Distributions are pairs (value, weight), weights are relative.
+PATHS = (
+    ('/', 30), ('/index.html', 8), ('/about', 3), ('/contact', 2),
+    ('/blog', 6), ('/blog/feed.xml', 4), ('/search?q=church', 3),
+    ('/login', 4), ('/logout', 1), ('/api/v1/users', 6),
+    ('/api/v1/orders', 5), ('/api/v1/items?page=2', 3),
+    ('/static/css/main.css', 10), ('/static/js/app.js', 10),
+    ('/static/img/logo.png', 8), ('/favicon.ico', 6), ('/robots.txt', 2),
+    ('/sitemap.xml', 1), ('/wp-login.php', 0.5),
+)
+METHODS = (
+    ('GET', 88), ('POST', 8), ('HEAD', 2), ('PUT', 1), ('DELETE', 0.5),
+    ('OPTIONS', 0.5),
+)
+STATUSES = (
+    (200, 82), (201, 1), (204, 1), (301, 1.5), (302, 2.5), (304, 6),
+    (400, 0.8), (401, 0.7), (403, 0.5), (404, 3), (500, 0.6), (502, 0.2),
+    (503, 0.2),
+)
+REFERRERS = (
+    ('-', 55), ('https://www.google.com/', 20), ('https://www.bing.com/', 3),
+    ('https://duckduckgo.com/', 2), ('https://www.facebook.com/', 3),
+    ('https://t.co/', 2), ('https://www.reddit.com/', 2),
+    ('https://news.ycombinator.com/', 1),
+)
+# Sizes of bodies in bytes are lognormal: median and sigma of logarithm.
+SIZE = (2300, 1.4)
+
+# Statuses without body.
+_EMPTY = (204, 304)
+
+# Sizes are drawn from quantiles of the distribution.
+_QUANTILES = 1024
+
+
+def _weighted(pairs):
+    if isinstance(pairs, dict):
+        pairs = pairs.items()
+    values, weights = zip(*pairs)
+    return Weighted(values, weights)
+
+
+def _quote(value, fmt):
+    if fmt == 'json':
+        return json.dumps(value)
+    return '"{0}"'.format(value.replace('\\', '\\\\').replace('"', '\\"'))
+
+
+class AccessLog(object):
+    """
+    Stream of lines of a web access log. Requests arrive as a Poisson
+    process (church.events), so timestamps are ordered, clients,
+    requests, statuses and referrers are drawn from distributions.
+    Fields are rendered once per value, a line is a concatenation
+    of ready parts and a formatted timestamp (church.dates).
+    """
+
+    def __init__(self, fmt='combined', rate=100.0, seasonality=None,
+                 paths=PATHS, methods=METHODS, statuses=STATUSES,
+                 referrers=REFERRERS, size=SIZE, clients=10000,
+                 networks='0.0.0.0/0', exclude=RESERVED_V4, users=0.05,
+                 utc_offset=0, unit='s', use_numpy=None, seed=None):
+        """
+        :param fmt: Format of lines: 'common', 'combined' or 'json'.
+        :param rate: Mean quantity of requests per second.
+        :param seasonality: church.events.Seasonality.
+        Default is a constant rate.
+        :param paths: Pairs (path, weight) or a dict.
+        :param methods: Pairs (method, weight) or a dict.
+        :param statuses: Pairs (status, weight) or a dict.
+        :param referrers: Pairs (referrer, weight) or a dict.
+        :param size: Median and sigma of logarithm of sizes of bodies.
+        :param clients: Quantity of clients, a client has an address,
+        a user agent and maybe a user name.
+        :param networks: CIDR blocks of addresses of clients,
+        see Network.ip_addresses().
+        :param exclude: CIDR blocks to exclude.
+        :param users: Probability that a client is logged in.
+        :param utc_offset: Offset of time zone of timestamps in seconds.
+        :param unit: Unit of time: 's', 'ms' or 'us', JSON logs
+        get fractions of seconds.
+        :param use_numpy: if False then arrivals use pure Python.
+        :param seed: Seed or instance of random.Random.
+        """
+        if fmt not in FORMATS:
+            raise KeyError('Unknown format: {0!r}, use one of {1}'.format(
+                fmt, ', '.join(FORMATS)))
+        self.fmt = fmt
+        self.rate = rate
+        self.seasonality = seasonality or Seasonality(None, None)
+        self.random = _random(seed)
+        self._rng = generator(self.random, use_numpy)
+        self.unit = unit
+        pattern = 'clf' if fmt != 'json' else \
+            'iso' if unit == 's' else 'iso_ms'
+        self._format = formatter(pattern, None, utc_offset, unit).format
+
+        self._heads, self._tails = self._render_clients(
+            clients, networks, exclude, users)
+        requests = [(m + ' ' + p, mw * pw) for m, mw in dict(methods).items()
+                    for p, pw in dict(paths).items()]
+        self._requests = self._render(requests, 'request')
+        self._statuses = self._render_statuses(statuses, size)
+        self._referrers = None if fmt == 'common' else \
+            self._render(referrers, 'referrer')
+
+    def _render_clients(self, n, networks, exclude, users):
+        # Parts of lines before the timestamp and at the end.
+        network = Network(seed=self.random.getrandbits(64))
+        personal = Personal(seed=self.random.getrandbits(64))
+        addresses = network.ip_addresses(n, networks, exclude)
+        agents = network.user_agents(n)
+        # Every client has its own gender, user names of each gender
+        # are drawn at once and taken in order of genders.
+        genders = self.random.choices('mf', k=n)
+        count = genders.count('m')
+        pools = {'m': iter(personal.usernames(count, 'm')),
+                 'f': iter(personal.usernames(n - count, 'f'))}
+        names = [next(pools[gender]) for gender in genders]
+        random = self.random.random
+        heads, tails = [], []
+        for address, agent, name in zip(addresses, agents, names):
+            name = name if random() < users else None
+            if self.fmt == 'json':
+                heads.append('{{"remote_addr": "{0}", "remote_user": {1}, '
+                             '"time_local": "'.format(address,
+                                                      json.dumps(name)))
+                tails.append(', "http_user_agent": {0}}}\n'.format(
+                    json.dumps(agent)))
+            else:
+                heads.append('{0} - {1} ['.format(address, name or '-'))
+                tails.append('\n' if self.fmt == 'common' else
+                             ' {0}\n'.format(_quote(agent, self.fmt)))
+        return heads, tails
+
+    def _column(self, values, weights):
+        # Values with samplers of their indexes: Weighted for Python,
+        # probabilities for NumPy.
+        sampler = Weighted(range(len(values)), weights)
+        if self._rng is not None:
+            import numpy
+            sampler = numpy.array(weights, dtype=float)
+            sampler /= sampler.sum()
+        return values, sampler
+
+    def _render(self, pairs, field):
+        pairs = pairs.items() if isinstance(pairs, dict) else pairs
+        if field == 'request':
+            if self.fmt == 'json':
+                template = '", "request": {0}, "status": '
+            else:
+                template = '] {0} '
+            pairs = [(value + ' HTTP/1.1', weight) for value, weight in pairs]
+        elif self.fmt == 'json':
+            template = ', "http_referer": {0}'
+        else:
+            template = ' {0}'
+        values, weights = [], []
+        for value, weight in pairs:
+            values.append(template.format(_quote(value, self.fmt)))
+            weights.append(weight)
+        return self._column(values, weights)
+
+    def _render_statuses(self, statuses, size):
+        # Each status has a table of quantiles of sizes, as strings.
+        median, sigma = size
+        normal = NormalDist()
+        sizes = [str(int(median * exp(sigma * normal.inv_cdf(
+            (i + 0.5) / _QUANTILES)))) for i in range(_QUANTILES)]
+        if self.fmt == 'json':
+            template, empty = '{0}, "body_bytes_sent": {1}', '0'
+        else:
+            template, empty = '{0} {1}', '-'
+        pairs = statuses.items() if isinstance(statuses, dict) else statuses
+        tables, weights = [], []
+        for status, weight in pairs:
+            if status in _EMPTY:
+                tables.append([template.format(status, empty)] * _QUANTILES)
+            else:
+                tables.append([template.format(status, v) for v in sizes])
+            weights.append(weight)
+        return self._column(tables, weights)
+
+    def _draw(self, column, n):
+        values, sampler = column
+        if self._rng is None:
+            indexes = sampler.samples(self.random, n)
+        else:
+            indexes = self._rng.choice(len(values), n, p=sampler).tolist()
+        return list(map(values.__getitem__, indexes))
+
+    def _uniform(self, size, n):
+        if self._rng is None:
+            return self.random.choices(range(size), k=n)
+        return self._rng.integers(0, size, n).tolist()
+
+    def _columns(self, timestamps):
+        # Parts of lines by columns, all columns are drawn at once.
+        times = self._format(timestamps)
+        n = len(times)
+        clients = self._uniform(len(self._heads), n)
+        statuses = list(map(getitem, self._draw(self._statuses, n),
+                            self._uniform(_QUANTILES, n)))
+        columns = [list(map(self._heads.__getitem__, clients)), times,
+                   self._draw(self._requests, n), statuses]
+        if self._referrers is not None:
+            columns.append(self._draw(self._referrers, n))
+        columns.append(list(map(self._tails.__getitem__, clients)))
+        return columns
+
+    def render(self, timestamps):
+        """
+        Render lines of requests at given times.
+        :param timestamps: Sorted epoch timestamps in unit of the log.
+        :return: List of lines with line breaks.
+        """
+        return list(map(''.join, zip(*self._columns(timestamps))))
+
+    def _text(self, timestamps):
+        # Lines as one string: parts are interleaved by slices.
+        columns = self._columns(timestamps)
+        width = len(columns)
+        parts = [''] * (width * len(columns[0]))
+        for i, column in enumerate(columns):
+            parts[i::width] = column
+        return ''.join(parts)
+
+    def _timestamps(self, start, stop, chunk):
+        start = epoch(time.time() if start is None else start)
+        stop = None if stop is None else epoch(stop)
+        segments = self.seasonality.segments(self.random, self.rate, start,
+                                             stop)
+        for part in chunks(segments, start, chunk):
+            timestamps = arrivals(self.random, part, self.unit, self._rng)
+            if len(timestamps):
+                yield timestamps
+
+    def chunks(self, start=None, stop=None, chunk=60):
+        """
+        Generate lines chunk by chunk of time.
+        :param start: Epoch seconds, date or datetime.
+        Default is the current time.
+        :param stop: End of time, same as start. Default is endless.
+        :param chunk: Duration of chunks in seconds.
+        :return: Iterator of lists of lines.
+        """
+        for timestamps in self._timestamps(start, stop, chunk):
+            yield self.render(timestamps)
+
+    def lines(self, n, start=None, chunk=60):
+        """
+        Generate the first n lines from start.
+        :param n: Quantity of lines.
+        :return: List of lines.
+        """
+        result = []
+        for timestamps in self._timestamps(start, None, chunk):
+            result.extend(self.render(timestamps[:n - len(result)]))
+            if len(result) >= n:
+                return result
+
+    def write(self, file, start=None, stop=None, lines=None, chunk=60):
+        """
+        Write lines to a text file, i.e sys.stdout. A chunk
+        is written at once.
+        :param file: Text file object.
+        :param start: Epoch seconds, date or datetime.
+        :param stop: End of time. Default is endless, until lines.
+        :param lines: Maximal quantity of lines.
+        :param chunk: Duration of chunks in seconds.
+        :return: Quantity of written lines.
+        """
+        if stop is None and lines is None:
+            raise ValueError('stop or lines is required')
+        count = 0
+        for timestamps in self._timestamps(start, stop, chunk):
+            if lines is not None and count + len(timestamps) >= lines:
+                timestamps = timestamps[:lines - count]
+                file.write(self._text(timestamps))
+                return count + len(timestamps)
+            file.write(self._text(timestamps))
+            count += len(timestamps)
+        return count
+
+    def __repr__(self):
+        return '<AccessLog {0}, {1} requests/s>'.format(self.fmt, self.rate)
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        prog='python -m church.logs', description='Write an access log.')
+    parser.add_argument('-n', '--lines', type=int, default=1000)
+    parser.add_argument('-f', '--format', choices=FORMATS,
+                        default='combined')
+    parser.add_argument('-r', '--rate', type=float, default=100.0)
+    parser.add_argument('-s', '--seed', type=int)
+    parser.add_argument('--start', type=int, help='epoch seconds')
+    args = parser.parse_args()
+    AccessLog(args.format, args.rate, seed=args.seed).write(
+        sys.stdout, args.start, lines=args.lines)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from math import log
+
+from .cache import CACHE
+from .utils import pull
+
+__all__ = ['Chain', 'chain']
+
+# Max quantity of phrases in one sentence.
+MAX_WORDS = 60
+
+
+class Chain(object):
+    """
+    Word-level Markov chain of sentences.
+    Words are states, successors of a word are kept with repetitions,
+    so a transition is one index into a list. Runs of words with a
+    single successor are joined into phrases, which are emitted at once.
+    """
+
+    __slots__ = ('starts', 'phrases', 'slots', 'tails', 'vocabulary')
+
+    def __init__(self, sentences, vocabulary=()):
+        """
+        :param sentences: Sentences to learn from.
+        :param vocabulary: Words which may replace lowercase words
+        of sentences.
+        """
+        # State 0 is the end of sentence.
+        index = {'': 0}
+        words = ['']
+        successors = [[]]
+        starts = []
+
+        for sentence in sentences:
+            states = []
+            for token in sentence.split():
+                state = index.get(token)
+                if state is None:
+                    state = index[token] = len(words)
+                    words.append(token)
+                    successors.append([])
+                states.append(state)
+            if states:
+                starts.append(states[0])
+            for state, following in zip(states, states[1:] + [0]):
+                successors[state].append(following)
+
+        self.starts = starts
+        self.phrases, self.slots, self.tails = [], [], []
+        for state in range(len(words)):
+            run = [state]
+            following = successors[state]
+            while len(run) < MAX_WORDS and following and \
+                    following[0] and following[0] not in run and \
+                    following.count(following[0]) == len(following):
+                run.append(following[0])
+                following = successors[following[0]]
+
+            tokens = [words[i] for i in run]
+            self.phrases.append(' '.join(tokens))
+            # Replaceable words as (text before, text after).
+            self.slots.append(tuple(
+                (' '.join(tokens[:i] + ['']), ' '.join([''] + tokens[i + 1:]))
+                for i, w in enumerate(tokens) if w.isalpha() and w.islower()))
+            self.tails.append(tuple(following))
+        self.vocabulary = [w for w in vocabulary if w]
+
+    def sentence(self, rnd, mix=0.1):
+        """
+        Generate a sentence.
+        :param rnd: Instance of random.Random.
+        :param mix: Probability to replace a lowercase word of a phrase
+        by a random word of vocabulary.
+        :return: Sentence.
+        """
+        random = rnd.random
+        phrases, tails, slots = self.phrases, self.tails, self.slots
+        vocabulary = self.vocabulary
+        # Phrases with replaceable words to skip till the next
+        # replacement, it's drawn once per replacement, not per phrase.
+        if not vocabulary or mix <= 0:
+            countdown = mix = float('inf')
+        elif mix >= 1:
+            countdown = mix = 0
+        else:
+            mix = log(1.0 - mix)
+            countdown = int(log(1.0 - random()) / mix)
+
+        starts = self.starts
+        state = starts[int(random() * len(starts))]
+        result = []
+        append = result.append
+        for _ in range(MAX_WORDS):
+            if not slots[state]:
+                append(phrases[state])
+            elif countdown:
+                countdown -= 1
+                append(phrases[state])
+            else:
+                positions = slots[state]
+                before, after = positions[int(random() * len(positions))]
+                append(before + vocabulary[int(random() * len(vocabulary))] +
+                       after)
+                countdown = int(log(1.0 - random()) / mix) if mix else 0
+            following = tails[state]
+            state = following[int(random() * len(following))]
+            if not state:
+                break
+        else:
+            result[-1] = result[-1].rstrip(',;:') + '.'
+        return ' '.join(result)
+
+    def sentences(self, rnd, n, mix=0.1):
+        """
+        Generate n sentences.
+        :return: List of sentences.
+        """
+        sentence = self.sentence
+        return [sentence(rnd, mix) for _ in range(n)]
+
+    def paragraphs(self, rnd, size=5, mix=0.1):
+        """
+        Endless stream of paragraphs.
+        :param size: Quantity of sentences in a paragraph.
+        :return: Iterator of strings.
+        """
+        sentence = self.sentence
+        while True:
+            yield ' '.join([sentence(rnd, mix) for _ in range(size)])
+
+
+@CACHE.cached('markov')
+def chain(filename, lang='en_us'):
+    """
+    Get the Markov chain of a text file (i.e 'text') of a locale,
+    mixed with words of the file 'words'. Chains are built once
+    and kept in church.cache.CACHE.
+    :param filename: Name of file of sentences.
+    :param lang: Locale.
+    :return: Chain.
+    """
+    return Chain(pull(filename, lang), pull('words', lang))
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import os
+from collections import namedtuple
+from functools import wraps
+from inspect import isfunction
+from threading import Lock
+from time import perf_counter_ns
+
+from .cache import CACHE
+
+__all__ = ['ENV_STATS', 'Stats', 'MethodStats', 'PullStats', 'enable',
+           'disable', 'is_enabled', 'snapshot', 'reset']
+
+# Instrumentation is enabled on import of providers
+# with CHURCH_STATS=1.
+ENV_STATS = 'CHURCH_STATS'
+
+# Calls of a method, times in seconds. Time includes calls of other
+# methods and only creation of generators.
+MethodStats = namedtuple('MethodStats', 'calls time mean p50 p90 p99 max')
+
+# Calls of pull() and table(): hits and misses of church.cache.CACHE,
+# time of loads in seconds and bytes of loaded data.
+PullStats = namedtuple('PullStats', 'calls hits misses load_time loaded')
+
+# Snapshot: {'Provider.method': MethodStats}, total PullStats and
+# {(lang, filename, kind): PullStats}.
+Stats = namedtuple('Stats', 'enabled methods pull files')
+
+_LOCK = Lock()
+_TIMERS = {}
+# Originals of wrapped methods: {(class, name): function}.
+_ORIGINALS = {}
+# Counters of CACHE at the last reset: {key: CacheStats}.
+_BASELINE = {}
+
+
+class _Timer(object):
+    # Latencies are counted in buckets, 4 per power of 2,
+    # so memory doesn't grow with calls and percentiles are
+    # accurate to about 10%.
+    __slots__ = ('calls', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.calls = self.total = self.max = 0
+        self.buckets = {}
+
+    def add(self, elapsed):
+        bits = elapsed.bit_length()
+        bucket = bits << 2 | elapsed >> (bits - 3) & 3 if bits > 3 \
+            else elapsed
+        with _LOCK:
+            self.calls += 1
+            self.total += elapsed
+            if elapsed > self.max:
+                self.max = elapsed
+            buckets = self.buckets
+            buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    def percentile(self, q):
+        rank = q * self.calls
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                break
+        if bucket < 16:
+            return bucket
+        # Middle of the bucket.
+        bits = bucket >> 2
+        return int(((bucket & 3) + 4.5) * (1 << (bits - 3)))
+
+    def stats(self):
+        if not self.calls:
+            return MethodStats(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        p50, p90, p99 = (min(self.percentile(q), self.max) / 1e9
+                         for q in (0.5, 0.9, 0.99))
+        return MethodStats(self.calls, self.total / 1e9,
+                           self.total / self.calls / 1e9, p50, p90, p99,
+                           self.max / 1e9)
+
+
+def _wrap(func, timer):
+    add = timer.add
+
+    @wraps(func)
+    def timed(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            add(perf_counter_ns() - start)
+
+    return timed
+
+
+def _classes():
+    from . import church
+    classes = [church.BaseProvider]
+    classes.extend(getattr(church, name) for name in church.__all__)
+    return classes
+
+
+def enable():
+    """
+    Start to count calls of public methods of providers. Methods
+    are wrapped in classes, so existing instances are counted too.
+    Without instrumentation methods are not wrapped and cost nothing.
+    """
+    with _LOCK:
+        if _ORIGINALS:
+            return
+        CACHE.count_hits = True
+        for cls in _classes():
+            for name, func in list(vars(cls).items()):
+                if name.startswith('_') or not isfunction(func):
+                    continue
+                key = '{0}.{1}'.format(cls.__name__, name)
+                timer = _TIMERS.get(key)
+                if timer is None:
+                    timer = _TIMERS[key] = _Timer()
+                _ORIGINALS[cls, name] = func
+                setattr(cls, name, _wrap(func, timer))
+
+
+def disable():
+    """
+    Restore original methods, collected statistics are kept.
+    """
+    with _LOCK:
+        for (cls, name), func in _ORIGINALS.items():
+            setattr(cls, name, func)
+        _ORIGINALS.clear()
+        CACHE.count_hits = False
+
+
+def is_enabled():
+    return bool(_ORIGINALS)
+
+
+def _pull_stats(current, base):
+    if base is None or current.misses < base.misses or \
+            current.hits < base.hits:
+        # New data or the cache was cleared after the reset.
+        return PullStats(current.hits + current.misses, current.hits,
+                         current.misses, current.load_time, current.loaded)
+    hits = current.hits - base.hits
+    misses = current.misses - base.misses
+    return PullStats(hits + misses, hits, misses,
+                     current.load_time - base.load_time,
+                     current.loaded - base.loaded)
+
+
+def snapshot():
+    """
+    Get statistics since the last reset.
+    :return: Stats, methods without calls are omitted.
+    """
+    methods = {}
+    for key, timer in list(_TIMERS.items()):
+        if timer.calls:
+            with _LOCK:
+                methods[key] = timer.stats()
+
+    files = {key: _pull_stats(stats, _BASELINE.get(key))
+             for key, stats in CACHE.stats().items()}
+    files = {key: stats for key, stats in files.items() if stats.calls}
+    pull = PullStats(*(sum(column) for column in zip(
+        (0, 0, 0, 0.0, 0), *files.values())))
+    return Stats(is_enabled(), methods, pull, files)
+
+
+def reset():
+    """
+    Reset statistics of methods and pull(), the cache keeps its data.
+    """
+    with _LOCK:
+        for timer in _TIMERS.values():
+            timer.calls = timer.total = timer.max = 0
+            timer.buckets = {}
+    _BASELINE.clear()
+    _BASELINE.update(CACHE.stats())
+
+
+def enable_from_env():
+    # Called on import of providers.
+    if os.environ.get(ENV_STATS, '').lower() in ('1', 'true', 'yes'):
+        enable()
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from collections import OrderedDict
+
+from . import engine
+from .church import (
+    Address, Personal, Text,
+    Network, Datetime, File, Science,
+    Development, Food, Hardware, _random
+)
+
+__all__ = ['Schema']
+
+# Providers by the name used in field specs, i.e 'personal.full_name'.
+PROVIDERS = {
+    'address': Address,
+    'personal': Personal,
+    'text': Text,
+    'network': Network,
+    'datetime': Datetime,
+    'file': File,
+    'science': Science,
+    'development': Development,
+    'food': Food,
+    'hardware': Hardware,
+}
+
+# Providers which take lang.
+LOCALIZED = (Address, Personal, Text, Datetime, Science, Food)
+
+OUTPUTS = ('tuple', 'dict')
+
+
+def _parse(spec):
+    if isinstance(spec, str):
+        spec, kwargs = spec, {}
+    else:
+        spec, kwargs = spec
+
+    provider, _, method = spec.partition('.')
+    if provider not in PROVIDERS or not method:
+        raise ValueError('Unknown field: {0!r}'.format(spec))
+    if not callable(getattr(PROVIDERS[provider], method, None)):
+        raise ValueError('Unknown method: {0!r}'.format(spec))
+    for key in kwargs:
+        if not key.isidentifier():
+            raise ValueError('Invalid argument: {0!r}'.format(key))
+    return provider, method, dict(kwargs)
+
+
+class Schema(object):
+    """
+    Description of a record, which is compiled once into a function
+    that makes records. Example:
+
+        schema = Schema([
+            ('name', 'personal.full_name'),
+            ('email', 'personal.email'),
+            ('gender', ('personal.gender', {'abbreviated': True})),
+            ('city', 'address.city'),
+        ], output='dict')
+
+    Schemas are picklable and can be used as recipes of church.engine.
+    """
+
+    def __init__(self, fields, output='tuple'):
+        """
+        :param fields: Mapping or list of pairs (name, spec), where spec
+        is 'provider.method' or ('provider.method', {kwargs}).
+        :param output: 'tuple' or 'dict'.
+        """
+        if output not in OUTPUTS:
+            raise ValueError('output must be one of {0}'.format(OUTPUTS))
+
+        if hasattr(fields, 'items'):
+            fields = fields.items()
+        self.fields = OrderedDict(
+            (name, _parse(spec)) for name, spec in fields)
+        self.output = output
+
+    @property
+    def names(self):
+        return tuple(self.fields)
+
+    def _providers(self, lang, seed):
+        # All providers share one random.Random, so a record
+        # depends only on seed.
+        rnd = _random(seed)
+        providers = {}
+        for provider, _, _ in self.fields.values():
+            if provider not in providers:
+                cls = PROVIDERS[provider]
+                providers[provider] = cls(lang, seed=rnd) \
+                    if cls in LOCALIZED else cls(seed=rnd)
+        return providers
+
+    def source(self):
+        """
+        Get the source code of the compiled function.
+        :return: Source code.
+        """
+        args, calls = [], []
+        for i, (provider, method, kwargs) in enumerate(
+                self.fields.values()):
+            args.append('f{0}'.format(i))
+            params = []
+            for key in kwargs:
+                args.append('a{0}_{1}'.format(i, key))
+                params.append('{1}=a{0}_{1}'.format(i, key))
+            calls.append('f{0}({1})'.format(i, ', '.join(params)))
+
+        if self.output == 'dict':
+            items = zip(self.names, calls)
+            body = '{' + ', '.join('{0!r}: {1}'.format(name, call)
+                                   for name, call in items) + '}'
+        else:
+            body = '(' + ''.join(call + ', ' for call in calls) + ')'
+
+        # Arguments of the outer function become closure
+        # variables, which are the fastest to look up.
+        return ('def build({0}):\n'
+                '    def make():\n'
+                '        return {1}\n'
+                '    return make\n').format(', '.join(args), body)
+
+    def compile(self, lang='en_us', seed=None):
+        """
+        Compile the schema into a function that makes one record.
+        :param lang: Locale.
+        :param seed: Seed or instance of random.Random.
+        :return: Function without arguments.
+        """
+        providers = self._providers(lang, seed)
+        values = []
+        for provider, method, kwargs in self.fields.values():
+            values.append(getattr(providers[provider], method))
+            values.extend(kwargs.values())
+
+        namespace = {}
+        exec(compile(self.source(), '<schema>', 'exec'), namespace)
+        return namespace['build'](*values)
+
+    def __call__(self, lang, rnd):
+        # Recipe protocol of church.engine.
+        return self.compile(lang, rnd)
+
+    def one(self, lang='en_us', seed=None):
+        """
+        Make one record.
+        :return: Record.
+        """
+        return self.compile(lang, seed)()
+
+    def rows(self, n, lang='en_us', seed=None):
+        """
+        Make n records column by column, using batch counterparts of
+        methods (see BaseProvider.bulk()). For the same seed records
+        differ from ones of compile().
+        :param n: Quantity of records.
+        :param lang: Locale.
+        :param seed: Seed or instance of random.Random.
+        :return: List of records.
+        """
+        providers = self._providers(lang, seed)
+        columns = [providers[provider].bulk(method, n, **kwargs)
+                   for provider, method, kwargs in self.fields.values()]
+        if self.output == 'dict':
+            names = self.names
+            return [dict(zip(names, row)) for row in zip(*columns)]
+        return list(zip(*columns))
+
+    def stream(self, count, lang='en_us', seed=None, workers=None,
+               shard_size=engine.SHARD_SIZE):
+        """
+        Make records on a pool of processes, see church.engine.stream().
+        :return: Generator of records.
+        """
+        return engine.stream(self, count, lang, seed, workers, shard_size)
+
+    def __repr__(self):
+        return 'Schema({0})'.format(', '.join(self.names))
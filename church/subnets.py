@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+import ipaddress
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from socket import AF_INET6, inet_ntoa, inet_ntop
+from struct import Struct
+
+from .unique import Permutation
+
+__all__ = ['AddressSpace', 'RESERVED_V4', 'RESERVED_V6', 'FORMATS',
+           'address_space']
+
+# Special-purpose blocks (RFC 6890 and later), except private ones.
+RESERVED_V4 = (
+    '0.0.0.0/8', '100.64.0.0/10', '127.0.0.0/8', '169.254.0.0/16',
+    '192.0.0.0/24', '192.0.2.0/24', '192.88.99.0/24', '198.18.0.0/15',
+    '198.51.100.0/24', '203.0.113.0/24', '224.0.0.0/4', '240.0.0.0/4',
+)
+RESERVED_V6 = (
+    '::/8', '64:ff9b::/96', '100::/64', '2001::/23', '2001:db8::/32',
+    '2002::/16', 'fc00::/7', 'fe80::/10', 'ff00::/8',
+)
+
+# Formats of addresses.
+FORMATS = ('str', 'int', 'bytes', 'object')
+
+_IP_V4 = Struct('!I')
+
+
+def _network(value):
+    if isinstance(value, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return value
+    return ipaddress.ip_network(value, strict=False)
+
+
+def _subtract(intervals, first, last):
+    # Remove [first, last] from sorted disjoint intervals.
+    result = []
+    for a, b in intervals:
+        if b < first or a > last:
+            result.append((a, b))
+            continue
+        if a < first:
+            result.append((a, first - 1))
+        if b > last:
+            result.append((last + 1, b))
+    return result
+
+
+class AddressSpace(object):
+    """
+    Addresses of CIDR blocks without excluded blocks. Addresses are
+    numbered by integers, so random addresses are random integers
+    and unique addresses are a permutation of integers (church.unique),
+    the space is never materialized.
+    """
+
+    def __init__(self, networks, exclude=(), hosts=False):
+        """
+        :param networks: CIDR blocks of one IP version,
+        i.e ['10.0.0.0/8', '192.168.0.0/16'].
+        :param exclude: CIDR blocks to exclude, i.e RESERVED_V4.
+        Blocks of other IP version are ignored.
+        :param hosts: if True then network and broadcast addresses
+        of IPv4 blocks are excluded.
+        """
+        networks = [_network(n) for n in networks]
+        if not networks:
+            raise ValueError('At least one network is required')
+        versions = {n.version for n in networks}
+        if len(versions) > 1:
+            raise ValueError('Networks must be of one IP version')
+        self.version = versions.pop()
+
+        intervals = []
+        for network in sorted(networks):
+            first = int(network.network_address)
+            last = int(network.broadcast_address)
+            if hosts and self.version == 4 and network.prefixlen < 31:
+                first, last = first + 1, last - 1
+            # Merge overlapping blocks.
+            if intervals and first <= intervals[-1][1] + 1:
+                if last > intervals[-1][1]:
+                    intervals[-1] = (intervals[-1][0], last)
+            else:
+                intervals.append((first, last))
+
+        for network in map(_network, exclude):
+            if network.version == self.version:
+                intervals = _subtract(intervals, int(network.network_address),
+                                      int(network.broadcast_address))
+        if not intervals:
+            raise ValueError('No addresses are left after exclusions')
+
+        self.intervals = intervals
+        self._firsts = [a for a, _ in intervals]
+        self._ends = list(accumulate(b - a + 1 for a, b in intervals))
+        self.size = self._ends[-1]
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError('address index out of range')
+        return self.addresses((index,))[0]
+
+    def addresses(self, indexes):
+        """
+        Get addresses by their indexes.
+        :param indexes: Iterable of indexes in range(size).
+        :return: List of addresses as integers.
+        """
+        if len(self.intervals) == 1:
+            first = self._firsts[0]
+            return [first + i for i in indexes]
+
+        firsts, ends = self._firsts, self._ends
+        result = []
+        for i in indexes:
+            j = bisect_right(ends, i)
+            result.append(firsts[j] + i - (ends[j - 1] if j else 0))
+        return result
+
+    def sample(self, rnd, n):
+        """
+        Get n random addresses, they can repeat.
+        :param rnd: Instance of random.Random.
+        :param n: Quantity of values.
+        :return: List of addresses as integers.
+        """
+        size = self.size
+        if size < 1 << 53:
+            indexes = rnd.choices(range(size), k=n)
+        else:
+            # Floats of choices() can't reach all indexes of IPv6.
+            randbelow = rnd.randrange
+            indexes = [randbelow(size) for _ in range(n)]
+        return self.addresses(indexes)
+
+    def permutation(self, key):
+        """
+        Get a pseudorandom order of all addresses.
+        :param key: Integer, seed of the order.
+        :return: church.unique.Permutation of indexes.
+        """
+        return Permutation(self.size, key)
+
+    def format(self, addresses, fmt='str'):
+        """
+        Convert addresses from integers.
+        :param addresses: List of integers.
+        :param fmt: 'str', 'int', 'bytes' (packed) or 'object'
+        (ipaddress.IPv4Address or ipaddress.IPv6Address).
+        :return: List of addresses.
+        """
+        if fmt == 'int':
+            return addresses
+        if fmt not in FORMATS:
+            raise KeyError('Unknown format: {0!r}, use one of {1}'.format(
+                fmt, ', '.join(FORMATS)))
+        if fmt == 'object':
+            cls = ipaddress.IPv4Address if self.version == 4 \
+                else ipaddress.IPv6Address
+            return [cls(a) for a in addresses]
+        if self.version == 4:
+            pack = _IP_V4.pack
+            if fmt == 'bytes':
+                return [pack(a) for a in addresses]
+            return [inet_ntoa(pack(a)) for a in addresses]
+        if fmt == 'bytes':
+            return [a.to_bytes(16, 'big') for a in addresses]
+        return [inet_ntop(AF_INET6, a.to_bytes(16, 'big')) for a in addresses]
+
+    def __repr__(self):
+        return '<AddressSpace IPv{0}, {1} addresses in {2} ranges>'.format(
+            self.version, self.size, len(self.intervals))
+
+
+@lru_cache(maxsize=128)
+def address_space(networks, exclude=(), hosts=False):
+    """
+    Get an address space, spaces are built once.
+    :param networks: Tuple of CIDR blocks or a CIDR block.
+    :param exclude: Tuple of CIDR blocks.
+    :param hosts: See AddressSpace.
+    :return: AddressSpace.
+    """
+    if isinstance(networks, str):
+        networks = (networks,)
+    if isinstance(exclude, str):
+        exclude = (exclude,)
+    return AddressSpace(networks, exclude, hosts)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from functools import lru_cache
+from unicodedata import normalize
+
+__all__ = ['romanize', 'TABLE']
+
+# Russian letters as in passports (ICAO Doc 9303), and letters
+# which don't decompose to latin letters with diacritics.
+TABLE = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e',
+    'ё': 'e', 'ж': 'zh', 'з': 'z', 'и': 'i', 'й': 'i', 'к': 'k',
+    'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r',
+    'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts',
+    'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': 'ie', 'ы': 'y', 'ь': '',
+    'э': 'e', 'ю': 'iu', 'я': 'ia',
+    'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'ø': 'o', 'ł': 'l', 'đ': 'd',
+})
+
+
+@lru_cache(maxsize=None)
+def romanize(text):
+    """
+    Convert text to lowercase ASCII letters and digits,
+    i.e for usernames. Other characters are dropped.
+    :param text: Text. Example: Пётр-Иван
+    :return: Text. Example: petrivan
+    """
+    text = normalize('NFKD', text.lower().translate(TABLE))
+    return ''.join(c for c in text if c.isascii() and c.isalnum())
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+:copyright: (c) 2016 by Lk Geimfari.
+:software_license: MIT, see LICENSE for more details.
+"""
+
+from random import Random
+
+__all__ = ['Permutation', 'UniqueStream', 'unravel']
+
+_M64 = (1 << 64) - 1
+
+
+# Multiplier of Fibonacci hashing, 2 ** 64 / golden ratio.
+_GOLDEN = 0x9e3779b97f4a7c15
+
+
+class Permutation(object):
+    """
+    Pseudorandom bijection of range(size), which takes no memory:
+    a Feistel network over the smallest even number of bits,
+    indexes outside of range(size) are encrypted again (cycle walking).
+    """
+
+    rounds = 4
+
+    def __init__(self, size, key=0):
+        """
+        :param size: Size of range.
+        :param key: Integer, seed of the permutation.
+        """
+        if size < 1:
+            raise ValueError('size must be positive')
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self._half = (bits + 1) // 2
+        self._mask = (1 << self._half) - 1
+        rnd = Random(key)
+        self._keys = [rnd.getrandbits(64) for _ in range(self.rounds)]
+
+    def _encrypt(self, x):
+        half, mask = self._half, self._mask
+        shift = 64 - half
+        left, right = x >> half, x & mask
+        for key in self._keys:
+            # Round function: high bits of multiplicative hash.
+            left, right = right, left ^ (
+                ((right ^ key) * _GOLDEN & _M64) >> shift)
+        return (left << half) | right
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.size:
+            raise IndexError('permutation index out of range')
+        x = self._encrypt(i)
+        while x >= self.size:
+            x = self._encrypt(x)
+        return x
+
+    def __len__(self):
+        return self.size
+
+    def range(self, start, stop):
+        """
+        Get permuted indexes of range(start, stop).
+        Same as [p[i] for i in range(start, stop)], but faster.
+        :return: List of indexes.
+        """
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError('permutation index out of range')
+        size, half, mask = self.size, self._half, self._mask
+        shift = 64 - half
+        keys = self._keys
+        result = []
+        for x in range(start, stop):
+            # _encrypt() inlined.
+            while True:
+                left, right = x >> half, x & mask
+                for key in keys:
+                    left, right = right, left ^ (
+                        ((right ^ key) * _GOLDEN & _M64) >> shift)
+                x = (left << half) | right
+                if x < size:
+                    break
+            result.append(x)
+        return result
+
+
+def unravel(index, sizes):
+    """
+    Convert an index of a product of ranges to indexes of ranges.
+    :param index: Index in range(product of sizes).
+    :param sizes: Sizes of ranges.
+    :return: Tuple of indexes. Example: unravel(5, (2, 3)) == (1, 2)
+    """
+    result = []
+    for size in reversed(sizes):
+        index, i = divmod(index, size)
+        result.append(i)
+    return tuple(reversed(result))
+
+
+class UniqueStream(object):
+    """
+    Stream of distinct combinations of items of sequences
+    (i.e names x numbers x domains) in pseudorandom order.
+    Memory doesn't depend on the number of taken values.
+    """
+
+    def __init__(self, sequences, key=0):
+        """
+        :param sequences: Sequences of distinct items.
+        :param key: Integer, seed of the order.
+        """
+        self.sequences = [tuple(s) for s in sequences]
+        self.sizes = [len(s) for s in self.sequences]
+        size = 1
+        for n in self.sizes:
+            size *= n
+        self.size = size
+        self.position = 0
+        self._permutation = Permutation(size, key) if size else None
+
+    @property
+    def left(self):
+        return self.size - self.position
+
+    def take(self, n):
+        """
+        Take n next combinations.
+        :param n: Quantity of values.
+        :return: List of tuples of items.
+        :raises ValueError: if less than n combinations are left.
+        """
+        if n > self.left:
+            raise ValueError(
+                'Requested {0} unique values, but only {1} of {2} '
+                'are left'.format(n, self.left, self.size))
+
+        sequences = self.sequences
+        start, self.position = self.position, self.position + n
+        if len(sequences) == 1:
+            items = sequences[0]
+            indexes = self._permutation.range(start, start + n)
+            return [(items[i],) for i in indexes]
+
+        result = []
+        sizes = self.sizes
+        for index in self._permutation.range(start, start + n):
+            indexes = unravel(index, sizes)
+            result.append(tuple(s[j] for s, j in zip(sequences, indexes)))
+        return result
@@ -1,14 +1,137 @@
+from collections import namedtuple
 from functools import lru_cache
+from itertools import repeat
 from os.path import (
     join,
     dirname,
     abspath
 )
 
+from .bundle import load_bundle, read_lines, RAW
+from .cache import CACHE
+
 PATH = abspath(join(dirname(__file__), 'data'))
 
+# Records of pipe-delimited data files.
+SCHEMAS = {
+    'countries': namedtuple('Country', 'iso_code name'),
+    'days': namedtuple('Day', 'name abbr'),
+    'months': namedtuple('Month', 'name abbr'),
+    'company_type': namedtuple('CompanyType', 'title abbr'),
+    'nation': namedtuple('Nation', 'male female'),
+    'chemical_elements': namedtuple('ChemicalElement',
+                                    'name symbol atomic_number'),
+}
+
 
 @lru_cache(maxsize=None)
+def _bundle(lang):
+    return load_bundle(PATH, lang)
+
+
+class Weighted(list):
+    """
+    Values of a data file with weights, i.e lines "value|weight"
+    (lines without weight have weight 1). Values are sampled in O(1)
+    with alias tables (Vose's alias method).
+    """
+
+    __slots__ = ('weights', '_values', '_thresholds', '_aliases')
+
+    def __init__(self, values, weights):
+        super().__init__(values)
+        size, total = len(values), sum(weights)
+        if not size or total <= 0 or min(weights) < 0:
+            raise ValueError('weights must be positive')
+        self.weights = tuple(weights)
+
+        scaled = [w * size / total for w in weights]
+        probability = [1.0] * size
+        aliases = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less], aliases[less] = scaled[less], more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        # Leftovers have probability 1 up to rounding errors.
+
+        # Plain list, indexing of list subclasses is slower.
+        self._values = list(values)
+        self._thresholds = [i + p for i, p in enumerate(probability)]
+        self._aliases = [values[i] for i in aliases]
+
+    def sample(self, rnd):
+        """
+        Get a weighted random value.
+        :param rnd: Instance of random.Random.
+        :return: Value.
+        """
+        # Integer part of one random number picks a column,
+        # fractional part picks the value or its alias.
+        u = rnd.random() * len(self._values)
+        i = int(u)
+        if u < self._thresholds[i]:
+            return self._values[i]
+        return self._aliases[i]
+
+    def samples(self, rnd, n):
+        """
+        Get n weighted random values.
+        :param rnd: Instance of random.Random.
+        :param n: Quantity of values.
+        :return: List of values.
+        """
+        random, values = rnd.random, self._values
+        thresholds, aliases = self._thresholds, self._aliases
+        size = len(values)
+        us = [random() * size for _ in repeat(None, n)]
+        return [values[i] if u < thresholds[i] else aliases[i]
+                for u, i in zip(us, map(int, us))]
+
+
+def _weight(line):
+    # Value and weight of a line or None if the line has no weight.
+    value, sep, field = line.rpartition('|')
+    if not sep:
+        return None
+    try:
+        return value.strip(), float(field)
+    except ValueError:
+        return None
+
+
+def weighted(lines):
+    """
+    Parse lines "value|weight" of a data file. Only a last field
+    which is a number is a weight, other lines are values with
+    weight 1, even if they contain '|'.
+    :param lines: List of strings.
+    :return: Weighted or lines if there are no weights.
+    """
+    if not any('|' in line for line in lines):
+        return lines
+
+    pairs = [_weight(line) for line in lines]
+    if not any(pairs):
+        return lines
+    values, weights = zip(*[pair or (line.strip(), 1.0)
+                            for line, pair in zip(lines, pairs)])
+    return Weighted(values, weights)
+
+
+def _read(filename, lang):
+    # Sources of the bundle are checked once, when it's opened.
+    bundle = _bundle(lang)
+    if bundle is not None and filename in bundle:
+        return bundle[filename]
+    # No bundle or files were changed after the bundle had been built:
+    # python -m church.bundle rebuilds it.
+    return read_lines(join(PATH, lang, filename), raw=lang in RAW)
+
+
+@CACHE.cached('pull')
 def pull(filename, lang='en_us'):
     """
     Function for getting data from text files in data/
@@ -16,8 +139,56 @@ def pull(filename, lang='en_us'):
     2. en_us - Folder for United States
     3. ru_ru - Folder for Russian Federation.
     4. fr_fr - Folder for France.
+
+    Data is decoded from the memory-mapped bundle of the locale
+    (see church.bundle) when it matches the text files.
+    Decoded data is kept in church.cache.CACHE, which can be limited
+    in bytes (CACHE.budget or CHURCH_CACHE_BYTES environment variable).
+    Lines of files may have weights: "value|weight", then Weighted is
+    returned (except files listed in SCHEMAS and raw files).
+    :return: List of stripped strings.
+    """
+    lines = _read(filename, lang)
+    if filename in SCHEMAS or lang in RAW:
+        return lines
+    return weighted(lines)
+
+
+class Table(object):
+    """
+    Parsed pipe-delimited data file.
+    Holds the same data twice: as records and as columns, i.e.
+    table.records[i].name == table.columns.name[i].
+    """
+
+    __slots__ = ('records', 'columns')
+
+    def __init__(self, record, rows):
+        self.records = tuple(record._make(row) for row in rows)
+        self.columns = record._make(zip(*self.records)) \
+            if self.records else record._make(() for _ in record._fields)
+
+    def __len__(self):
+        return len(self.records)
+
+
+@CACHE.cached('table')
+def table(filename, lang='en_us'):
+    """
+    Function for getting parsed records of pipe-delimited files in data/
+    Rows that hold a single value (for example, locales without
+    ISO codes or gendered forms) use it for every field.
+    :param filename: Name of file listed in SCHEMAS.
+    :param lang: Locale.
+    :return: Table.
     """
-    with open(join(PATH + '/' + lang, filename), 'r') as f:
-        _result = f.readlines()
+    record = SCHEMAS[filename]
+    size = len(record._fields)
 
-    return _result
+    rows = []
+    for line in pull(filename, lang):
+        cells = [cell.strip() for cell in line.split('|')]
+        if len(cells) == 1:
+            cells *= size
+        rows.append(cells[:size])
+    return Table(record, rows)
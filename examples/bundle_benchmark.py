@@ -0,0 +1,81 @@
+"""
+Compare the memory-mapped bundles with the old readlines() loader.
+
+First call: a fresh interpreter loads every file of a locale.
+Steady state: random elements are picked from already loaded data.
+"""
+import subprocess
+import sys
+import timeit
+from os import listdir
+from os.path import join
+
+from church.bundle import compile_bundle
+from church.utils import PATH, pull
+
+LANG = 'en_us'
+
+FIRST_CALL = '''
+import time
+from os import listdir
+from os.path import join
+{loader}
+start = time.perf_counter()
+for name in {names}:
+    load(name)
+print(time.perf_counter() - start)
+'''
+
+OLD_LOADER = '''
+from church.utils import PATH
+
+def load(name):
+    with open(join(PATH, '{lang}', name), 'r') as f:
+        return f.readlines()
+'''
+
+BUNDLE_LOADER = '''
+from church.utils import PATH, pull
+
+def load(name):
+    return pull(name, '{lang}')
+'''
+
+
+def first_call(loader, names, runs=10):
+    code = FIRST_CALL.format(loader=loader.format(lang=LANG), names=names)
+    results = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', code])
+        results.append(float(out))
+    return min(results)
+
+
+def old_pull(filename, lang=LANG):
+    with open(join(PATH, lang, filename), 'r') as f:
+        return f.readlines()
+
+
+if __name__ == '__main__':
+    compile_bundle(PATH, LANG)
+    files = sorted(listdir(join(PATH, LANG)))
+    some = ['f_names', 'm_names', 'surnames', 'email']
+
+    for names in (files, some):
+        print('First call, {0} files of {1}:'.format(len(names), LANG))
+        for title, loader in (('readlines', OLD_LOADER),
+                              ('bundle', BUNDLE_LOADER)):
+            elapsed = first_call(loader, names) * 1000
+            print('  {0:<10} {1:.2f} ms'.format(title + ':', elapsed))
+
+    old = old_pull('cities')
+    new = pull('cities', LANG)
+    setup = 'from random import choice'
+    number = 1000000
+    print('Steady state, choice() + strip() of a city:')
+    t_old = timeit.timeit('choice(old).strip()', setup=setup, number=number,
+                          globals={'old': old})
+    t_new = timeit.timeit('choice(new)', setup=setup, number=number,
+                          globals={'new': new})
+    print('  readlines: {0:.0f} ns'.format(t_old / number * 1e9))
+    print('  bundle:    {0:.0f} ns'.format(t_new / number * 1e9))
@@ -0,0 +1,59 @@
+"""
+Cost of hits of the data cache in pull() and in scalar methods,
+compared with functools.lru_cache which pull() used before.
+
+Modes of church.cache.CACHE: without a budget a hit is a lookup
+in a dict, hits are counted only with instrumentation or a budget.
+"""
+import timeit
+from functools import lru_cache
+
+from church import church
+from church.cache import CACHE
+from church.utils import pull
+
+LANG = 'en_us'
+NUMBER = 200000
+
+METHODS = (
+    ('Address.city', 'address.city()'),
+    ('Personal.name', 'person.name()'),
+    ('Personal.surname', 'person.surname()'),
+)
+
+
+def ns(statement, namespace):
+    elapsed = min(timeit.repeat(statement, number=NUMBER, repeat=5,
+                                globals=namespace))
+    return elapsed / NUMBER * 1e9
+
+
+def measure(title, get):
+    church.pull = get
+    namespace = {
+        'pull': get,
+        'address': church.Address(LANG),
+        'person': church.Personal(LANG),
+    }
+    exec('address.city(); person.name(); person.surname()', namespace)
+    results = [ns("pull('cities', '{0}')".format(LANG), namespace)]
+    results.extend(ns(statement, namespace) for _, statement in METHODS)
+    print('{0:<20}'.format(title) +
+          ''.join('{0:>18.0f}'.format(r) for r in results))
+
+
+if __name__ == '__main__':
+    print('{0:<20}{1:>18}'.format('ns per call', 'pull') +
+          ''.join('{0:>18}'.format(name) for name, _ in METHODS))
+
+    measure('lru_cache', lru_cache(maxsize=None)(pull.__wrapped__))
+    measure('cache', pull)
+
+    CACHE.count_hits = True
+    measure('cache, count hits', pull)
+    CACHE.count_hits = False
+
+    CACHE.budget = 1 << 30
+    measure('cache, budget', pull)
+    CACHE.budget = None
+    church.pull = pull
@@ -0,0 +1,34 @@
+"""
+Values per second of church.columns compared with scalar methods.
+"""
+import time
+
+from church import Network, Personal
+from church.columns import Columns, numpy
+
+N = 1000000
+
+
+def rate(func, n):
+    start = time.perf_counter()
+    func(n)
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    network = Network()
+    person = Personal()
+    modes = [('scalar', None), ('python', Columns(use_numpy=False))]
+    if numpy is not None:
+        modes.append(('numpy', Columns(use_numpy=True)))
+
+    for method in ('ip_v4', 'ip_v6', 'mac_address', 'credit_card_number'):
+        provider = person if method == 'credit_card_number' else network
+        for mode, columns in modes:
+            if columns is None:
+                def func(n, scalar=getattr(provider, method)):
+                    return [scalar() for _ in range(n)]
+            else:
+                func = getattr(columns, method)
+            print('{0:>18} {1:>7}: {2:>12.0f} values/sec'.format(
+                method, mode, rate(func, N)))
@@ -0,0 +1,38 @@
+"""
+Formatted timestamps per second of church.dates.Formatter
+compared with datetime.strftime.
+"""
+import time
+from datetime import datetime, timezone
+
+from church import Datetime
+from church.dates import Formatter
+
+N = 1000000
+
+
+def rate(func, timestamps):
+    start = time.perf_counter()
+    func(timestamps)
+    return len(timestamps) / (time.perf_counter() - start)
+
+
+def strftime(pattern):
+    def func(timestamps):
+        return [datetime.fromtimestamp(t, timezone.utc).strftime(pattern)
+                for t in timestamps]
+    return func
+
+
+if __name__ == '__main__':
+    dt = Datetime(seed=0)
+    random = dt.timestamps(N)
+    # Sorted timestamps of a week, like logs.
+    week = sorted(dt.timestamps(N, 1704067200, 1704067200 + 7 * 86400))
+    for pattern in ('%Y-%m-%dT%H:%M:%S%z', '%d/%b/%Y:%H:%M:%S %z'):
+        formatter = Formatter(pattern, lang=None)
+        for name, timestamps in (('random', random), ('week', week)):
+            print('{0:>22} {1:>6}: {2:>9.0f} strftime, {3:>9.0f} '
+                  'Formatter'.format(pattern, name,
+                                     rate(strftime(pattern), timestamps),
+                                     rate(formatter.format, timestamps)))
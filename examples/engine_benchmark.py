@@ -0,0 +1,32 @@
+"""
+Rows per second of church.engine depending on the number of workers.
+"""
+import os
+import time
+
+from church import Personal, Address
+from church.engine import generate
+
+ROWS = 400000
+
+
+def user(lang, rnd):
+    person = Personal(lang, seed=rnd)
+    address = Address(lang, seed=rnd)
+
+    def make():
+        return (person.full_name(), person.email(), person.age(),
+                person.telephone(), address.city(), address.address())
+
+    return make
+
+
+if __name__ == '__main__':
+    workers, cpus = 1, os.cpu_count() or 1
+    while workers <= cpus:
+        start = time.perf_counter()
+        generate(user, ROWS, seed=0, workers=workers)
+        elapsed = time.perf_counter() - start
+        print('{0:>3} workers: {1:>10.0f} rows/sec'.format(
+            workers, ROWS / elapsed))
+        workers *= 2
@@ -0,0 +1,27 @@
+"""
+Time to generate a year of events with one event per second
+on average, with seasonality and bursts.
+"""
+import time
+from datetime import datetime
+
+from church import Datetime
+from church.columns import numpy
+from church.events import Seasonality
+
+START, STOP = datetime(2024, 1, 1), datetime(2025, 1, 1)
+
+
+if __name__ == '__main__':
+    seasonality = Seasonality(bursts=0.05)
+    modes = [('numpy', True)] if numpy is not None else []
+    modes.append(('python', False))
+    for mode, use_numpy in modes:
+        for unit in ('s', 'ms'):
+            start = time.perf_counter()
+            events = Datetime(seed=0).events(
+                START, STOP, rate=1.0, seasonality=seasonality, unit=unit,
+                use_numpy=use_numpy)
+            elapsed = time.perf_counter() - start
+            print('{0:>6} {1:>2}: {2} events in {3:.1f} s'.format(
+                mode, unit, len(events), elapsed))
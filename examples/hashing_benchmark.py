@@ -0,0 +1,29 @@
+"""
+Hashed passwords per second of Personal.passwords on pools of threads.
+Key derivation functions release the GIL, so the rate grows with cores.
+"""
+import os
+import time
+
+from church import Personal
+
+COUNT = 200
+
+CASES = [
+    ('pbkdf2_sha256', {'iterations': 100000}),
+    ('scrypt', {'cost': 2 ** 14}),
+]
+
+
+if __name__ == '__main__':
+    cores = os.cpu_count() or 1
+    print('{0} cores'.format(cores))
+    for algorithm, params in CASES:
+        for workers in sorted({1, 2, cores}):
+            person = Personal(seed=0)
+            start = time.perf_counter()
+            person.passwords(COUNT, algorithm=algorithm, workers=workers,
+                             **params)
+            elapsed = time.perf_counter() - start
+            print('{0:>14} {1:>2} threads: {2:>8.1f} hashes/s'.format(
+                algorithm, workers, COUNT / elapsed))
@@ -0,0 +1,62 @@
+"""
+Import time of church measured with python -X importtime.
+Exits with status 1 when the median of any statement is above
+the limit, e.g.:
+
+    python examples/import_benchmark.py --limit 5
+"""
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    'import church',
+    'from church import Personal',
+    'from church.schema import Schema',
+)
+
+
+def import_time(statement):
+    """
+    Import time of a statement in a new interpreter.
+    :param statement: Import statement.
+    :return: Cumulative time of top-level imports in ms.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split('|')
+        if name.strip().startswith('church') and \
+                not name.startswith('  '):
+            total += int(cumulative)
+    return total / 1000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--limit', type=float,
+                        help='max median of every statement in ms')
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    compileall.compile_dir(os.path.join(root, 'church'), quiet=1)
+
+    medians = {}
+    for statement in STATEMENTS:
+        medians[statement] = statistics.median(
+            import_time(statement) for _ in range(args.runs))
+        print('{0:<35} {1:>7.2f} ms'.format(statement, medians[statement]))
+
+    if args.limit is not None:
+        slow = [s for s in STATEMENTS if medians[s] > args.limit]
+        for statement in slow:
+            print('{0} is slower than {1} ms'.format(statement, args.limit))
+        if slow:
+            sys.exit(1)
@@ -0,0 +1,35 @@
+"""
+Rows per second of church.loaders.load_sqlite depending on batch size.
+"""
+import os
+import tempfile
+import time
+
+from church.loaders import load_sqlite
+from church.schema import Schema
+
+ROWS = 200000
+BATCH_SIZES = (1, 100, 1000, 10000, 100000)
+
+schema = Schema([
+    ('username', 'personal.username'),
+    ('email', 'personal.email'),
+    ('name', 'personal.full_name'),
+    ('age', 'personal.age'),
+    ('city', 'address.city'),
+])
+
+
+if __name__ == '__main__':
+    # Records are made up front, only loading is measured.
+    records = schema.rows(ROWS, seed=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        for batch_size in BATCH_SIZES:
+            db = os.path.join(tmp, '{0}.sqlite'.format(batch_size))
+            start = time.perf_counter()
+            load_sqlite(records, db, 'users', names=schema.names,
+                        batch_size=batch_size, indexes=['email'],
+                        fast=True)
+            elapsed = time.perf_counter() - start
+            print('batch {0:>6}: {1:>10.0f} rows/sec'.format(
+                batch_size, ROWS / elapsed))
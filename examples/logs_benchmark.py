@@ -0,0 +1,46 @@
+"""
+Lines per second of church.logs.AccessLog written to os.devnull,
+compared with lines built by hand from providers and strftime.
+"""
+import os
+import time
+from datetime import datetime, timezone
+
+from church import Network, Personal
+from church.columns import numpy
+from church.logs import AccessLog, FORMATS
+
+START = 1704067200
+N = 1000000
+
+
+def by_hand(n):
+    network, person = Network(seed=0), Personal(seed=0)
+    lines = []
+    for i in range(n):
+        when = datetime.fromtimestamp(START + i // 1000, timezone.utc)
+        lines.append('{0} - {1} [{2}] "GET / HTTP/1.1" 200 512 "-" '
+                     '"{3}"\n'.format(network.ip_v4(), person.username(),
+                                      when.strftime('%d/%b/%Y:%H:%M:%S %z'),
+                                      network.user_agent()))
+    return lines
+
+
+if __name__ == '__main__':
+    with open(os.devnull, 'w') as file:
+        start = time.perf_counter()
+        file.write(''.join(by_hand(N // 10)))
+        print('{0:>18}: {1:>9.0f} lines/s'.format(
+            'by hand', N // 10 / (time.perf_counter() - start)))
+
+        modes = [('numpy', True)] if numpy is not None else []
+        modes.append(('python', False))
+        for mode, use_numpy in modes:
+            for fmt in FORMATS:
+                log = AccessLog(fmt, rate=100000.0, use_numpy=use_numpy,
+                                seed=0)
+                start = time.perf_counter()
+                count = log.write(file, START, lines=N)
+                print('{0:>18}: {1:>9.0f} lines/s'.format(
+                    '{0} {1}'.format(fmt, mode),
+                    count / (time.perf_counter() - start)))
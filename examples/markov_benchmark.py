@@ -0,0 +1,30 @@
+"""
+Text output (MB/s) of the Markov chain compared with lorem_ipsum.
+"""
+import time
+
+from church import Text
+
+SIZE = 20 * 1024 * 1024
+
+
+def rate(make):
+    start, size = time.perf_counter(), 0
+    while size < SIZE:
+        size += len(make())
+    return size / (time.perf_counter() - start) / 1024 / 1024
+
+
+if __name__ == '__main__':
+    for lang in ('en_us', 'de_de', 'fr_fr', 'ru_ru'):
+        text = Text(lang, seed=0)
+        stream = text.text_stream(quantity=10)
+        cases = [
+            ('lorem_ipsum', lambda: text.lorem_ipsum(10)),
+            ('paragraph', lambda: text.paragraph(10)),
+            ('text_stream', lambda: next(stream)),
+            ('no mixing', lambda: text.paragraph(10, mix=0)),
+        ]
+        for name, make in cases:
+            print('{0} {1:>12}: {2:>6.1f} MB/s'.format(lang, name,
+                                                       rate(make)))
@@ -0,0 +1,41 @@
+"""
+Profiles per second: Personal.profiles compared with separate calls
+of name, surname, username, email, gender, age, telephone,
+nationality and profession.
+"""
+import time
+
+from church import Personal
+
+COUNT = 100000
+
+
+def separate(person, n):
+    result = []
+    for _ in range(n):
+        gender = person.random.choice('mf')
+        result.append((person.gender(), person.name(gender),
+                       person.surname(gender), person.username(gender),
+                       person.email(gender), person.age(),
+                       person.telephone(), person.nationality(gender),
+                       person.profession()))
+    return result
+
+
+def rate(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return COUNT / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    for lang in ('en_us', 'ru_ru'):
+        person = Personal(lang, seed=0)
+        cases = [
+            ('separate calls', lambda: separate(person, COUNT)),
+            ('profile()', lambda: [person.profile() for _ in range(COUNT)]),
+            ('profiles(n)', lambda: person.profiles(COUNT)),
+        ]
+        for name, func in cases:
+            print('{0} {1:>15}: {2:>9.0f} profiles/s'.format(
+                lang, name, rate(func)))
@@ -0,0 +1,28 @@
+"""
+Weighted sampling with alias tables compared with uniform choice.
+"""
+import timeit
+from random import Random
+
+from church.utils import Weighted, pull
+
+N = 100000
+
+if __name__ == '__main__':
+    rnd = Random(0)
+    cities = list(pull('cities'))
+    # Zipf-like weights.
+    weighted = Weighted(cities, [1 / (i + 1) for i in range(len(cities))])
+    weights = weighted.weights
+
+    cases = [
+        ('uniform choice', lambda: [rnd.choice(cities) for _ in range(N)]),
+        ('weighted sample', lambda: [weighted.sample(rnd) for _ in range(N)]),
+        ('uniform choices', lambda: rnd.choices(cities, k=N)),
+        ('random.choices(weights)',
+         lambda: rnd.choices(cities, weights, k=N)),
+        ('weighted samples', lambda: weighted.samples(rnd, N)),
+    ]
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print('{0:>24}: {1:>10.0f} values/sec'.format(name, N / elapsed))
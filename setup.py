@@ -1,15 +1,34 @@
+from os.path import join
+
+from distutils.command.build_py import build_py
 from distutils.core import setup
 
 from church import __version__
+from church.bundle import compile_all
+
+
+class BuildWithBundles(build_py):
+    """
+    Compile locale data into memory-mapped bundles (see church.bundle).
+    """
+
+    def run(self):
+        build_py.run(self)
+        data = join(self.build_lib, 'church', 'data')
+        if not self.dry_run:
+            compile_all(data)
+
 
 setup(
     name='church',
     version=__version__,
     packages=['church'],
+    cmdclass={'build_py': BuildWithBundles},
     keywords=['fake', 'data', 'testing', 'generate', 'faker', 'church'],
     package_data={
         'church': [
             'data/*/*',
+            'data/*.bundle',
         ]
     },
     url='https://github.com/lk-geimfari/church',
@@ -22,9 +41,7 @@ setup(
     classifiers=[
         "Development Status :: 4 - Beta",
         'Intended Audience :: Developers',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3.7',
         'License :: OSI Approved :: MIT License',
         "Topic :: Software Development :: Testing",
     ],
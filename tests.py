@@ -1,12 +1,50 @@
+import csv
+import inspect
+import io
+import ipaddress
+import json
+import os
 import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
-
+from concurrent.futures import ThreadPoolExecutor
+import church
+from datetime import date, datetime, timedelta, timezone
+from random import Random
+
+from church.blob import BlobWriter
+from church import benchmarks
+from church.bundle import (
+    compile_bundle, load_bundle,
+    is_stale, read_lines
+)
 from church.church import (
     Address, Text, Personal,
     Datetime, Network, File, Science,
-    Development, Food, Hardware
+    Development, Food, Hardware, YEAR
 )
-from church.utils import pull
+from church.cache import CACHE, DataCache, sizeof
+from church.cards import luhn_digit, luhn_valid
+from church.columns import Columns, numpy
+from church.engine import generate, stream
+from church.dates import Formatter
+from church.events import Seasonality
+from church.exporters import to_csv, to_jsonl, to_sql, sql_literal
+from church.hashing import hash_password, hash_passwords
+from church.fuzz import Fuzzer, corpus, CATEGORIES
+from church.loaders import load_sqlite, to_copy, copy_value
+from church.logs import AccessLog
+from church.markov import Chain, chain
+from church.schema import Schema
+from church.subnets import RESERVED_V4, RESERVED_V6, address_space
+from church.translit import romanize
+from church.unique import Permutation, UniqueStream, unravel
+from church.utils import pull, table, weighted, Weighted, SCHEMAS
 
 LANG = 'en_us'
 
@@ -16,6 +54,1075 @@ LANG = 'en_us'
 # LANG = 'fr_fr'
 
 
+class BundleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+        os.mkdir(os.path.join(self.path, 'xx_xx'))
+        self.write('cities', 'Zürich\r\n  Berlin \n\nМосква\n')
+        self.write('empty', '')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        with open(os.path.join(self.path, 'xx_xx', name), 'w',
+                  encoding='utf-8', newline='') as f:
+            f.write(text)
+
+    def test_read_lines(self):
+        result = read_lines(os.path.join(self.path, 'xx_xx', 'cities'))
+        self.assertEqual(result, ['Zürich', 'Berlin', 'Москва'])
+
+    def test_compile_bundle(self):
+        self.assertTrue(is_stale(self.path, 'xx_xx'))
+        compile_bundle(self.path, 'xx_xx')
+        self.assertFalse(is_stale(self.path, 'xx_xx'))
+
+        bundle = load_bundle(self.path, 'xx_xx', build=False)
+        self.assertEqual(bundle['cities'], ['Zürich', 'Berlin', 'Москва'])
+        self.assertEqual(bundle['empty'], [])
+
+        dataset = bundle.dataset('cities')
+        self.assertEqual(len(dataset), 3)
+        self.assertEqual(dataset[-1], 'Москва')
+        self.assertEqual(list(dataset), bundle['cities'])
+
+    def test_staleness(self):
+        compile_bundle(self.path, 'xx_xx')
+        bundle = load_bundle(self.path, 'xx_xx', build=False)
+
+        self.write('cities', 'Paris\n')
+        self.assertTrue(bundle.is_stale(self.path, 'xx_xx', 'cities'))
+        self.assertFalse(bundle.is_stale(self.path, 'xx_xx', 'empty'))
+        self.assertTrue(is_stale(self.path, 'xx_xx'))
+
+        # Stale bundles are not rebuilt at runtime.
+        filename = os.path.join(self.path, 'xx_xx.bundle')
+        mtime = os.stat(filename).st_mtime_ns
+        self.assertIsNone(load_bundle(self.path, 'xx_xx'))
+        self.assertEqual(os.stat(filename).st_mtime_ns, mtime)
+
+        os.remove(os.path.join(self.path, 'xx_xx', 'empty'))
+        bundle = load_bundle(self.path, 'xx_xx', build=True)
+        self.assertEqual(bundle['cities'], ['Paris'])
+        self.assertNotIn('empty', bundle)
+
+    def test_copied_tree(self):
+        # Installers and copies don't keep times of files.
+        compile_bundle(self.path, 'xx_xx')
+        target = os.path.join(self.path, 'copy')
+        shutil.copytree(self.path, target, copy_function=shutil.copyfile)
+        os.utime(os.path.join(target, 'xx_xx', 'cities'), ns=(0, 0))
+        self.assertFalse(is_stale(target, 'xx_xx'))
+
+        bundle = load_bundle(target, 'xx_xx')
+        self.assertIsNotNone(bundle)
+        self.assertEqual(bundle['cities'], ['Zürich', 'Berlin', 'Москва'])
+
+    def test_pull(self):
+        for lang in ('en_us', 'ru_ru', 'de_de', 'fr_fr'):
+            result = pull('cities', lang)
+            self.assertIsInstance(result, list)
+            self.assertTrue(all(x and x == x.strip() for x in result))
+
+
+class TableTestCase(unittest.TestCase):
+    def test_table(self):
+        for filename, record in SCHEMAS.items():
+            result = table(filename, LANG)
+            self.assertEqual(len(result), len(pull(filename, LANG)))
+            self.assertEqual(result.columns._fields, record._fields)
+            for column in result.columns:
+                self.assertEqual(len(column), len(result))
+            self.assertIsInstance(result.records[0], record)
+
+    def test_columns(self):
+        result = table('chemical_elements', LANG)
+        self.assertEqual(result.records[3].symbol, result.columns.symbol[3])
+        self.assertTrue(all(x == x.strip() for x in result.columns.name))
+
+
+class BulkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.providers = [
+            Address(LANG), Text(LANG), Personal(LANG),
+            Datetime(LANG), Network(), File(), Science(LANG),
+            Development(), Food(LANG), Hardware()
+        ]
+
+    def test_batch_methods(self):
+        for provider in self.providers:
+            for method in provider._batch:
+                result = provider.bulk(method, 20)
+                self.assertEqual(len(result), 20)
+                scalar = getattr(provider, method)()
+                self.assertTrue(all(type(x) is type(scalar) for x in result))
+
+    def test_bulk_fallback(self):
+        result = Hardware().bulk('graphics', 10)
+        self.assertEqual(len(result), 10)
+
+        result = Address(LANG).bulk('country', 10, only_iso_code=True)
+        self.assertIn(result[0], table('countries', LANG).columns.iso_code)
+
+    def test_datasets(self):
+        person = Personal(LANG)
+        for name in person.names(100, 'm'):
+            self.assertIn(name, pull('m_names', LANG))
+
+        for city in Address(LANG).cities(100):
+            self.assertIn(city, pull('cities', LANG))
+
+        for movie in person.favorite_movies(100):
+            self.assertIn(movie, pull('favorite_movie', LANG))
+
+    def test_arguments(self):
+        for ext in File().extensions(100, 'source'):
+            self.assertIn(ext, File._extensions['source'])
+        self.assertEqual(File(seed=1).extensions(5, 'nothing'),
+                         File(seed=1).extensions(5))
+
+        for db in Development().databases(100, nosql=True):
+            self.assertIn(db, Development._nosql)
+
+        for url in Personal(LANG).subreddits(100, nsfw=True, full_url=True):
+            self.assertIn(url[len('http://www.reddit.com'):],
+                          pull('nsfw_subreddits', 'en_us'))
+
+        for size in Hardware().ram_sizes(100):
+            self.assertRegex(size, r'^\d+GB$')
+
+    def test_formats(self):
+        for ip in Network().ip_v4s(100):
+            self.assertTrue(re.match(r'^(\d{1,3}\.){3}\d{1,3}$', ip))
+            self.assertTrue(all(int(x) < 256 for x in ip.split('.')))
+
+        for mac in Network().mac_addresses(100):
+            self.assertTrue(mac.startswith('00:16:3e:'))
+            self.assertLess(int(mac[9:11], 16), 0x80)
+
+        for phone in Personal(LANG).telephones(100):
+            self.assertRegex(phone, r'^\+\d-\(\d{3}\)\d{3}-\d{2}-\d{2}$')
+
+        for d in Datetime(LANG).dates(100, sep='/', with_time=True):
+            self.assertRegex(d, r'^\d{2}/\d{2}/\d{4} \d{2}:\d{2}$')
+
+    def test_ranges(self):
+        ages = Personal(LANG).ages(2000, minimum=1, maximum=3)
+        self.assertEqual(set(ages), {1, 2, 3})
+
+        numbers = Address(LANG).street_numbers(2000)
+        self.assertEqual({len(x) for x in numbers}, {1, 2, 3})
+
+        result = Text(LANG).copyrights(100, from_=2000, to_=2001)
+        self.assertTrue(all(x.startswith('© 200') for x in result))
+
+
+class SeedTestCase(unittest.TestCase):
+    classes = [Address, Text, Personal, Datetime, Network,
+               File, Science, Development, Food, Hardware]
+
+    def create(self, cls, seed):
+        if cls in (Network, File, Development, Hardware):
+            return cls(seed=seed)
+        return cls(LANG, seed=seed)
+
+    def generate(self, provider):
+        result = []
+        for name, method in inspect.getmembers(provider, inspect.ismethod):
+            if name.startswith('_') or name == 'bulk':
+                continue
+            params = inspect.signature(method).parameters.values()
+            value = method(*[5 for p in params if p.default is p.empty])
+            if inspect.isgenerator(value):
+                value = [next(value) for _ in range(3)]
+            else:
+                value = [value]
+            # Arrays are compared as lists.
+            value = [v.tolist() if hasattr(v, 'tolist') else v
+                     for v in value]
+            result.append(value)
+        return result
+
+    def test_same_seed(self):
+        for cls in self.classes:
+            first = self.generate(self.create(cls, 42))
+            second = self.generate(self.create(cls, 42))
+            self.assertEqual(first, second, cls.__name__)
+
+    def test_different_seed(self):
+        first = Personal(LANG, seed=1).names(50)
+        second = Personal(LANG, seed=2).names(50)
+        self.assertNotEqual(first, second)
+
+    def test_random_instance(self):
+        rnd = Random(7)
+        person = Personal(LANG, seed=rnd)
+        self.assertIs(person.random, rnd)
+
+        other = Personal(LANG, seed=Random(7))
+        self.assertEqual([person.name() for _ in range(10)],
+                         [other.name() for _ in range(10)])
+
+    def test_isolated(self):
+        person = Personal(LANG, seed=3)
+        expected = Personal(LANG, seed=3).full_names(10)
+        Personal(LANG, seed=3).full_names(10)
+        self.assertEqual(person.full_names(10), expected)
+
+
+def user_recipe(lang, rnd):
+    person = Personal(lang, seed=rnd)
+    return lambda: (person.full_name(), person.age())
+
+
+class EngineTestCase(unittest.TestCase):
+    def test_generate(self):
+        result = generate(user_recipe, 250, LANG, seed=1,
+                          workers=1, shard_size=100)
+        self.assertEqual(len(result), 250)
+        self.assertEqual(len(set(result)), 250)
+
+    def test_workers(self):
+        single = generate(user_recipe, 250, LANG, seed=1,
+                          workers=1, shard_size=100)
+        pool = generate(user_recipe, 250, LANG, seed=1,
+                        workers=2, shard_size=100)
+        self.assertEqual(single, pool)
+
+    def test_stream(self):
+        result = list(stream(user_recipe, 30, LANG, seed=5,
+                             workers=1, shard_size=7))
+        self.assertEqual(result,
+                         generate(user_recipe, 30, LANG, seed=5,
+                                  workers=1, shard_size=7))
+
+        other = generate(user_recipe, 30, LANG, seed=6,
+                         workers=1, shard_size=7)
+        self.assertNotEqual(result, other)
+
+
+class ColumnsTestCase(unittest.TestCase):
+    use_numpy = False
+
+    def setUp(self):
+        self.columns = Columns(seed=3, use_numpy=self.use_numpy)
+
+    def test_ip_v4(self):
+        result = list(self.columns.ip_v4(100))
+        self.assertEqual(len(result), 100)
+        for ip in result:
+            octets = ip.split('.')
+            self.assertEqual(len(octets), 4)
+            self.assertTrue(all(0 <= int(o) <= 255 for o in octets))
+
+        raw = self.columns.ip_v4(100, raw=True)
+        self.assertTrue(all(0 <= int(ip) < 2 ** 32 for ip in raw))
+
+    def test_ip_v6(self):
+        for ip in self.columns.ip_v6(100):
+            groups = ip.split(':')
+            self.assertEqual(groups[0], '2001')
+            self.assertEqual(len(groups), 8)
+            self.assertTrue(all(int(g, 16) <= 0xffff for g in groups))
+
+        for groups in self.columns.ip_v6(100, raw=True):
+            self.assertEqual(len(groups), 8)
+            self.assertEqual(groups[0], 0x2001)
+            self.assertTrue(all(0 <= g <= 0xffff for g in groups))
+
+    def test_mac_address(self):
+        for mac in self.columns.mac_address(100):
+            self.assertTrue(re.match(r'00:16:3e(:[0-9a-f]{2}){3}$', mac))
+            self.assertLessEqual(int(mac[9:11], 16), 0x7f)
+
+        for mac in self.columns.mac_address(10, raw=True):
+            self.assertEqual(int(mac) >> 24, 0x00163e)
+
+    def test_hex_color(self):
+        result = list(self.columns.hex_color(100))
+        for color in result:
+            self.assertTrue(re.match(r'#[0-9A-F]{6}$', color))
+            self.assertEqual(len(set(color)), 7)
+
+        raw = self.columns.hex_color(100, raw=True)
+        self.assertTrue(all(0 <= int(c) < 16 ** 6 for c in raw))
+
+    def test_integers(self):
+        ages = [int(a) for a in self.columns.age(1000, 18, 20)]
+        self.assertEqual(set(ages), {18, 19, 20})
+
+        weights = self.columns.weight(100)
+        self.assertTrue(all(38 <= w <= 90 for w in weights))
+
+        cvvs = self.columns.cvv(100)
+        self.assertTrue(all(100 <= c <= 999 for c in cvvs))
+
+    def test_credit_card_number(self):
+        for number in self.columns.credit_card_number(500, 'amex'):
+            self.assertTrue(re.match(r'3[47]\d\d \d{6} \d{5}$', number))
+            self.assertTrue(luhn_valid(number))
+
+        for number in self.columns.credit_card_number(500, raw=True):
+            self.assertTrue(luhn_valid(str(number)))
+            self.assertEqual(len(str(number)), 16)
+
+    def test_height(self):
+        for height in self.columns.height(100):
+            self.assertTrue(re.match(r'[12]\.[0-9]{2}$', height))
+
+        raw = self.columns.height(100, from_=1.6, to_=1.7, raw=True)
+        self.assertTrue(all(1.6 <= h <= 1.7 for h in raw))
+
+    def test_seed(self):
+        other = Columns(seed=3, use_numpy=self.use_numpy)
+        self.assertEqual(list(self.columns.ip_v4(50)),
+                         list(other.ip_v4(50)))
+        self.assertEqual(list(self.columns.ip_v6(50)),
+                         list(other.ip_v6(50)))
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class NumpyColumnsTestCase(ColumnsTestCase):
+    use_numpy = True
+
+    def test_arrays(self):
+        self.assertIsInstance(self.columns.ip_v4(10), numpy.ndarray)
+        self.assertEqual(self.columns.ip_v6(10, raw=True).shape, (10, 8))
+
+    def test_backends(self):
+        # Raw columns have the same shape and types with both backends.
+        python = Columns(seed=3, use_numpy=False)
+        for method in ('ip_v4', 'ip_v6', 'mac_address', 'hex_color'):
+            arrays = getattr(self.columns, method)(10, raw=True).tolist()
+            lists = getattr(python, method)(10, raw=True)
+            self.assertEqual(numpy.shape(arrays), numpy.shape(lists))
+            self.assertEqual(
+                {type(x) for x in numpy.ravel(arrays).tolist()},
+                {type(x) for x in numpy.ravel(lists).tolist()})
+
+
+class SchemaTestCase(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema([
+            ('name', ('personal.full_name', {'gender': 'female'})),
+            ('email', 'personal.email'),
+            ('city', 'address.city'),
+            ('ip', 'network.ip_v4'),
+        ])
+
+    def test_compile(self):
+        make = self.schema.compile(LANG, seed=1)
+        record = make()
+        self.assertIsInstance(record, tuple)
+        self.assertEqual(len(record), 4)
+        self.assertIn('@', record[1])
+
+        other = self.schema.compile(LANG, seed=1)
+        other()
+        self.assertEqual([make() for _ in range(10)],
+                         [other() for _ in range(10)])
+
+    def test_dict(self):
+        schema = Schema([(name, ('.'.join(spec[:2]), spec[2]))
+                         for name, spec in self.schema.fields.items()],
+                        output='dict')
+        record = schema.one(LANG, seed=2)
+        self.assertEqual(list(record), ['name', 'email', 'city', 'ip'])
+        self.assertEqual(tuple(record.values()), self.schema.one(LANG, 2))
+
+    def test_rows(self):
+        rows = self.schema.rows(50, LANG, seed=3)
+        self.assertEqual(len(rows), 50)
+        self.assertTrue(all(len(row) == 4 for row in rows))
+        self.assertEqual(rows, self.schema.rows(50, LANG, seed=3))
+
+    def test_stream(self):
+        single = list(self.schema.stream(30, LANG, seed=4, workers=1,
+                                         shard_size=10))
+        pool = list(self.schema.stream(30, LANG, seed=4, workers=2,
+                                       shard_size=10))
+        self.assertEqual(len(single), 30)
+        self.assertEqual(single, pool)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, Schema, [('a', 'personal')])
+        self.assertRaises(ValueError, Schema, [('a', 'nobody.name')])
+        self.assertRaises(ValueError, Schema, [('a', 'personal.nothing')])
+        self.assertRaises(ValueError, Schema,
+                          [('a', 'personal.name')], output='list')
+
+
+class ExportersTestCase(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {'name': "O'Neil", 'age': 30, 'city': 'Paris, TX'},
+            {'name': 'Ann', 'age': None, 'city': 'Berlin'},
+            {'name': 'Bob', 'age': 1.5, 'city': '"Quoted"'},
+        ]
+
+    def test_csv(self):
+        file = io.StringIO()
+        count = to_csv(iter(self.records), file, batch_size=2)
+        self.assertEqual(count, 3)
+        rows = list(csv.reader(io.StringIO(file.getvalue())))
+        self.assertEqual(rows[0], ['name', 'age', 'city'])
+        self.assertEqual(rows[1], ["O'Neil", '30', 'Paris, TX'])
+        self.assertEqual(rows[3][2], '"Quoted"')
+
+        file = io.StringIO()
+        to_csv([(1, 2)], file)
+        self.assertEqual(file.getvalue(), '1,2\r\n')
+
+    def test_jsonl(self):
+        file = io.StringIO()
+        count = to_jsonl(iter(self.records), file, batch_size=2)
+        self.assertEqual(count, 3)
+        lines = file.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         self.records)
+
+        file = io.StringIO()
+        to_jsonl([(1, 'a')], file, names=('x', 'y'))
+        self.assertEqual(json.loads(file.getvalue()), {'x': 1, 'y': 'a'})
+
+    def test_sql(self):
+        file = io.StringIO()
+        count = to_sql(iter(self.records), file, 'users', batch_size=2)
+        self.assertEqual(count, 3)
+        self.assertEqual(file.getvalue().count('INSERT INTO'), 2)
+
+        db = sqlite3.connect(':memory:')
+        db.execute('CREATE TABLE users (name, age, city)')
+        db.executescript(file.getvalue())
+        rows = db.execute('SELECT name, age, city FROM users').fetchall()
+        self.assertEqual(rows, [tuple(r.values()) for r in self.records])
+
+    def test_sql_literal(self):
+        self.assertEqual(sql_literal(None), 'NULL')
+        self.assertEqual(sql_literal(True), 'TRUE')
+        self.assertEqual(sql_literal(12), '12')
+        self.assertEqual(sql_literal("it's"), "'it''s'")
+
+    def test_empty(self):
+        file = io.StringIO()
+        self.assertEqual(to_csv([], file), 0)
+        self.assertEqual(to_sql([], file, 'users'), 0)
+        self.assertEqual(file.getvalue(), '')
+
+    def test_stream(self):
+        make = Schema([('name', 'personal.full_name')]).compile(LANG, 1)
+        records = (make() for _ in range(100))
+        file = io.StringIO()
+        self.assertEqual(to_jsonl(records, file, batch_size=7), 100)
+        self.assertEqual(len(file.getvalue().splitlines()), 100)
+
+
+class LoadersTestCase(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema([
+            ('name', 'personal.full_name'),
+            ('email', 'personal.email'),
+            ('age', 'personal.age'),
+        ], output='dict')
+
+    def test_load_sqlite(self):
+        records = self.schema.rows(250, LANG, seed=1)
+        db = sqlite3.connect(':memory:')
+        count = load_sqlite(iter(records), db, 'users', batch_size=100,
+                            indexes=['email', ('name', 'age')])
+        self.assertEqual(count, 250)
+
+        rows = db.execute('SELECT name, email, age FROM users').fetchall()
+        self.assertEqual(rows, [tuple(r.values()) for r in records])
+        indexes = db.execute("SELECT name FROM sqlite_master "
+                             "WHERE type = 'index'").fetchall()
+        self.assertEqual(sorted(indexes),
+                         [('users_email',), ('users_name_age',)])
+
+    def test_load_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'test.sqlite')
+            self.assertEqual(load_sqlite([(1, 'a'), (2, 'b')], path, 't',
+                                         fast=True), 2)
+            self.assertEqual(load_sqlite([(3, 'c')], path, 't'), 1)
+            db = sqlite3.connect(path)
+            rows = db.execute('SELECT c0, c1 FROM t').fetchall()
+            db.close()
+        self.assertEqual(rows, [(1, 'a'), (2, 'b'), (3, 'c')])
+
+    def test_fast_connection(self):
+        # Settings of the caller's connection are restored.
+        with tempfile.TemporaryDirectory() as tmp:
+            db = sqlite3.connect(os.path.join(tmp, 'test.sqlite'))
+            db.execute('PRAGMA journal_mode = WAL')
+            self.assertEqual(load_sqlite([(1, 'a')], db, 't', fast=True), 1)
+            pragmas = [db.execute('PRAGMA {0}'.format(name)).fetchone()[0]
+                       for name in ('synchronous', 'journal_mode')]
+            db.close()
+        self.assertEqual(pragmas, [2, 'wal'])
+
+    def test_open_transaction(self):
+        # Rows join the caller's transaction, which stays open.
+        db = sqlite3.connect(':memory:')
+        db.execute('CREATE TABLE t (c0, c1)')
+        db.execute("INSERT INTO t VALUES (0, 'z')")
+        self.assertTrue(db.in_transaction)
+        self.assertRaises(ValueError, load_sqlite, [(1, 'a')], db, 't',
+                          fast=True)
+        self.assertEqual(load_sqlite([(1, 'a')], db, 't', indexes=['c0']), 1)
+        self.assertTrue(db.in_transaction)
+        db.rollback()
+        self.assertEqual(db.execute('SELECT * FROM t').fetchall(), [])
+
+    def test_empty(self):
+        db = sqlite3.connect(':memory:')
+        self.assertEqual(load_sqlite([], db, 'users'), 0)
+
+    def test_copy_text(self):
+        file = io.StringIO()
+        count = to_copy([('a\tb', None, True), ('back\\slash', 1, False)],
+                        file, batch_size=1)
+        self.assertEqual(count, 2)
+        self.assertEqual(file.getvalue(),
+                         'a\\tb\t\\N\tt\nback\\\\slash\t1\tf\n')
+        self.assertEqual(copy_value('x\ny'), 'x\\ny')
+
+    def test_copy_csv(self):
+        file = io.StringIO()
+        records = self.schema.rows(10, LANG, seed=2)
+        self.assertEqual(to_copy(records, file, format='csv'), 10)
+        self.assertTrue(file.getvalue().startswith('name,email,age\r\n'))
+        self.assertRaises(ValueError, to_copy, records, file, format='xml')
+
+
+class BenchmarksTestCase(unittest.TestCase):
+    def test_discover(self):
+        found = list(benchmarks.discover())
+        keys = {(p, lang, m) for p, lang, m, _ in found}
+        self.assertEqual(len(keys), len(found))
+        self.assertEqual({p for p, _, _, _ in found},
+                         set(benchmarks.PROVIDERS))
+        self.assertEqual({lang for p, lang, _, _ in found if p == 'Text'},
+                         {'en_us', 'ru_ru', 'de_de', 'fr_fr'})
+        self.assertEqual({lang for p, lang, _, _ in found
+                          if p == 'Network'}, {None})
+
+        args = {m: a for p, lang, m, a in found if lang in (None, LANG)}
+        self.assertEqual(args['name'], ())
+        self.assertEqual(args['names'], (benchmarks.BATCH,))
+        self.assertEqual(len(args['events']), 2)
+        self.assertNotIn('bulk', args)
+
+        found = list(benchmarks.discover(['Personal'], ['ru_ru'],
+                                         r'\.(name|surname)$'))
+        self.assertEqual(sorted(m for _, _, m, _ in found),
+                         ['name', 'surname'])
+
+    def test_measure(self):
+        result = benchmarks.measure('Personal', LANG, 'names', (10,),
+                                    duration=0.01)
+        self.assertIsNone(result.error)
+        self.assertGreaterEqual(result.calls, 5)
+        self.assertGreater(result.ops_per_sec, 0)
+        self.assertLessEqual(result.p50_us, result.p99_us)
+        self.assertGreater(result.cold_us, result.p50_us)
+        self.assertGreaterEqual(result.pull_misses, 1)
+        self.assertGreater(result.pull_bytes, 0)
+        self.assertGreater(result.peak_bytes, 0)
+
+        result = benchmarks.measure('Personal', LANG, 'names', ('x',))
+        self.assertEqual(result.calls, 0)
+        self.assertIn('TypeError', result.error)
+
+    def test_compare(self):
+        report = benchmarks.run(['Hardware'], methods=r'\.phone_models?$',
+                                duration=0.01)
+        self.assertEqual(len(report['results']), 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, 'baseline.json')
+            results = os.path.join(directory, 'results.json')
+            benchmarks.save(report, baseline)
+            self.assertEqual(benchmarks.load(baseline), report)
+            self.assertEqual(benchmarks.compare(report, report), [])
+
+            slower = json.loads(json.dumps(report))
+            slower['results'][0]['ops_per_sec'] /= 2
+            slower['results'][0]['p50_us'] *= 1.1
+            result = benchmarks.compare(report, slower)
+            self.assertEqual(len(result), 1)
+            self.assertEqual(result[0].metric, 'ops_per_sec')
+            self.assertEqual(result[0].ratio, 0.5)
+            self.assertEqual(benchmarks.compare(report, slower, 1.5), [])
+
+            benchmarks.save(slower, results)
+            with open(os.devnull, 'w') as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    self.assertEqual(benchmarks.main(
+                        ['compare', baseline, results]), 1)
+                    self.assertEqual(benchmarks.main(
+                        ['compare', baseline, baseline]), 0)
+                finally:
+                    sys.stdout = stdout
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_import(self):
+        code = ('import sys, church; '
+                'print("church.church" in sys.modules); '
+                'church.Personal; '
+                'print("church.church" in sys.modules)')
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         universal_newlines=True)
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_subsystems(self):
+        # Subsystems and NumPy are imported by methods using them.
+        modules = ('numpy', 'church.events', 'church.blob', 'church.cards',
+                   'church.hashing', 'church.markov', 'church.metrics',
+                   'church.subnets', 'church.unique')
+        code = ('import sys; from church import Personal; '
+                'print(*[m in sys.modules for m in {0!r}])'.format(modules))
+        env = dict(os.environ)
+        env.pop('CHURCH_STATS', None)
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         universal_newlines=True, env=env)
+        self.assertEqual(output.split(), ['False'] * len(modules))
+
+    def test_attributes(self):
+        import church
+        self.assertIs(church.Personal, Personal)
+        self.assertIn('Hardware', dir(church))
+        self.assertRaises(AttributeError, getattr, church, 'Nothing')
+
+
+class MetricsTestCase(unittest.TestCase):
+    def tearDown(self):
+        church.instrument(False)
+        church.reset_stats()
+
+    def test_disabled(self):
+        self.assertFalse(church.stats().enabled)
+        self.assertFalse(hasattr(vars(Personal)['name'], '__wrapped__'))
+        church.reset_stats()
+        Personal(LANG).names(10)
+        self.assertEqual(church.stats().methods, {})
+
+    def test_methods(self):
+        person = Personal(LANG, seed=1)
+        church.instrument()
+        church.instrument()
+        church.reset_stats()
+        for _ in range(100):
+            person.name()
+        person.bulk('surname', 5)
+        stats = church.stats()
+        self.assertTrue(stats.enabled)
+
+        name = stats.methods['Personal.name']
+        self.assertEqual(name.calls, 100)
+        self.assertAlmostEqual(name.mean * 100, name.time)
+        self.assertTrue(0 < name.p50 <= name.p90 <= name.p99 <= name.max)
+        self.assertEqual(stats.methods['BaseProvider.bulk'].calls, 1)
+        self.assertEqual(stats.methods['Personal.surnames'].calls, 1)
+        self.assertNotIn('Personal._choice', stats.methods)
+        # Signatures are kept, i.e for church.benchmarks.
+        self.assertIn('gender', inspect.signature(Personal.name).parameters)
+
+        church.instrument(False)
+        person.name()
+        self.assertEqual(church.stats().methods['Personal.name'].calls, 100)
+        self.assertFalse(hasattr(vars(Personal)['name'], '__wrapped__'))
+        church.reset_stats()
+        self.assertEqual(church.stats().methods, {})
+
+    def test_pull(self):
+        CACHE.clear()
+        church.instrument()
+        church.reset_stats()
+        person = Personal(LANG)
+        person.names(10, 'm')
+        person.names(10, 'm')
+        stats = church.stats()
+        names = stats.files[(LANG, 'm_names', 'pull')]
+        self.assertEqual((names.calls, names.hits, names.misses), (2, 1, 1))
+        self.assertGreater(names.loaded, 0)
+        self.assertGreater(names.load_time, 0)
+        self.assertEqual(stats.pull.loaded, sum(
+            s.loaded for s in stats.files.values()))
+
+        church.reset_stats()
+        person.names(10, 'm')
+        stats = church.stats()
+        self.assertEqual(stats.files[(LANG, 'm_names', 'pull')],
+                         (1, 1, 0, 0.0, 0))
+        self.assertEqual(stats.pull.misses, 0)
+
+    def test_environment(self):
+        code = ('import church; church.Personal().name(); '
+                'print(church.stats().methods["Personal.name"].calls)')
+        env = dict(os.environ, CHURCH_STATS='1')
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), '1')
+
+
+class FuzzTestCase(unittest.TestCase):
+    def setUp(self):
+        self.fuzzer = Fuzzer(LANG, seed=1)
+
+    def test_corpus(self):
+        self.assertIs(corpus(), corpus())
+        self.assertEqual(list(corpus()), Text().naughty_strings())
+        for name in CATEGORIES:
+            strings = corpus().category(name)
+            self.assertTrue(strings, name)
+            for string in strings:
+                self.assertIn(name, corpus().categories(string))
+
+        self.assertIn("' OR '1'='1", corpus().category('sql'))
+        self.assertIn('<script>alert(123)</script>',
+                      corpus().category('script'))
+        self.assertRaises(KeyError, corpus().category, 'nothing')
+
+    def test_iter(self):
+        strings = list(corpus().iter('sql', 'script'))
+        self.assertEqual(set(strings), set(corpus().category('sql')) |
+                         set(corpus().category('script')))
+        self.assertEqual(len(list(corpus().iter())), len(corpus()))
+
+    def test_naughty_string(self):
+        fuzzer = Fuzzer(seed=2, categories=['unicode'])
+        for string in fuzzer.naughty_strings(50):
+            self.assertIn(string, corpus().category('unicode'))
+        self.assertIn(fuzzer.naughty_string(), fuzzer.strings)
+
+    def test_mutations(self):
+        result = self.fuzzer.mutations(500)
+        self.assertEqual(len(result), 500)
+        self.assertTrue(all(isinstance(s, str) for s in result))
+        self.assertEqual(result, Fuzzer(LANG, seed=1).mutations(500))
+
+        fuzzer = Fuzzer(seed=3, categories=['sql'], mutations=['prefix'])
+        words = pull('words', LANG)
+        for string in fuzzer.mutations(20):
+            bad, _, word = string.rpartition(' ')
+            self.assertIn(bad, corpus().category('sql'))
+            self.assertIn(word, words)
+
+    def test_stream(self):
+        stream = self.fuzzer.stream(batch_size=7)
+        result = [next(stream) for _ in range(20)]
+        self.assertEqual(len(result), 20)
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = DataCache()
+        self.loads = []
+
+        @self.cache.cached('test')
+        def load(filename, lang='en_us'):
+            self.loads.append((lang, filename))
+            return [filename] * 100
+
+        self.load = load
+        self.size = sizeof(['a'] * 100)
+
+    def test_hits(self):
+        self.cache.count_hits = True
+        self.assertEqual(self.load('a'), ['a'] * 100)
+        self.load('a')
+        self.load('a', 'ru_ru')
+        self.assertEqual(self.loads, [('en_us', 'a'), ('ru_ru', 'a')])
+
+        stats = self.cache.stats()[('en_us', 'a', 'test')]
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(stats.size, self.size)
+        self.assertTrue(stats.resident)
+        self.assertEqual(self.cache.size, self.size * 2)
+
+    def test_untracked(self):
+        # Without a budget and counting hits are lookups in a dict.
+        self.load('a')
+        self.assertIs(self.load('a'), self.load('a'))
+        self.assertEqual(self.cache.stats()[('en_us', 'a', 'test')].hits, 0)
+
+        self.cache.count_hits = True
+        self.load('a')
+        self.assertEqual(self.cache.stats()[('en_us', 'a', 'test')].hits, 1)
+        self.cache.count_hits = False
+        self.cache.budget = self.size
+        self.load('b')
+        self.assertNotIn(('en_us', 'a', 'test'), self.cache)
+        self.cache.budget = None
+        self.assertEqual(self.load('b'), ['b'] * 100)
+        self.assertEqual(self.loads, [('en_us', 'a'), ('en_us', 'b')])
+
+    def test_budget(self):
+        self.cache.budget = self.size * 2
+        self.load('a')
+        self.load('b')
+        self.load('a')
+        self.load('c')
+        self.assertNotIn(('en_us', 'b', 'test'), self.cache)
+        self.assertIn(('en_us', 'a', 'test'), self.cache)
+        self.assertLessEqual(self.cache.size, self.cache.budget)
+
+        self.load('b')
+        stats = self.cache.stats()
+        self.assertEqual(stats[('en_us', 'b', 'test')].misses, 2)
+        self.assertEqual(stats[('en_us', 'a', 'test')].evictions, 1)
+        self.assertFalse(stats[('en_us', 'a', 'test')].resident)
+
+    def test_small_budget(self):
+        self.cache.budget = 1
+        self.assertEqual(self.load('a'), ['a'] * 100)
+        self.assertEqual(len(self.cache), 1)
+        self.load('b')
+        self.assertEqual(len(self.cache), 1)
+
+        self.cache.budget = 0
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_clear(self):
+        self.load('a')
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), {})
+        self.load('a')
+        self.assertEqual(len(self.loads), 2)
+
+    def test_threads(self):
+        @self.cache.cached('slow')
+        def slow(filename, lang='en_us'):
+            # Concurrent misses of the same key.
+            time.sleep(0.001)
+            return [filename] * 100
+
+        self.cache.budget = self.size * 3
+
+        def work(i):
+            for j in range(200):
+                name = str((i + j) % 6)
+                self.assertEqual(slow(name), [name] * 100)
+                self.cache.stats()
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(work, range(8)))
+        resident = sum(s.size for s in self.cache.stats().values())
+        self.assertEqual(self.cache.size, resident)
+        self.assertLessEqual(self.cache.size, self.cache.budget)
+
+    def test_pull(self):
+        pull('words', LANG)
+        stats = CACHE.stats()[(LANG, 'words', 'pull')]
+        self.assertGreater(stats.size, 0)
+        self.assertGreaterEqual(stats.misses, 1)
+        table('countries', LANG)
+        self.assertIn((LANG, 'countries', 'table'), CACHE.stats())
+
+    def test_sizeof(self):
+        string = 'x' * 1000
+        self.assertGreater(sizeof([string]), 1000)
+        # Shared objects are counted once.
+        self.assertLess(sizeof([string, string]), 2000)
+
+
+class UniqueTestCase(unittest.TestCase):
+    def test_permutation(self):
+        for size in (1, 2, 5, 64, 1000, 4099):
+            permutation = Permutation(size, key=size)
+            result = [permutation[i] for i in range(size)]
+            self.assertEqual(sorted(result), list(range(size)))
+            self.assertEqual(permutation.range(0, size), result)
+            self.assertEqual(permutation.range(size, size), [])
+
+        self.assertNotEqual(Permutation(1000, 1).range(0, 1000),
+                            Permutation(1000, 2).range(0, 1000))
+        self.assertRaises(IndexError, Permutation(10).__getitem__, 10)
+        self.assertRaises(ValueError, Permutation, 0)
+
+    def test_unravel(self):
+        self.assertEqual(unravel(5, (2, 3)), (1, 2))
+        self.assertEqual(unravel(0, (4, 5, 6)), (0, 0, 0))
+        self.assertEqual(unravel(119, (4, 5, 6)), (3, 4, 5))
+
+    def test_stream(self):
+        stream = UniqueStream(['ab', 'xyz'], key=7)
+        self.assertEqual(stream.size, 6)
+        result = stream.take(4) + stream.take(2)
+        self.assertEqual(sorted(result), [(a, b) for a in 'ab'
+                                          for b in 'xyz'])
+        self.assertEqual(stream.left, 0)
+        self.assertRaises(ValueError, stream.take, 1)
+        self.assertEqual(stream.take(0), [])
+
+
+class WeightedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rnd = Random(1)
+        self.data = Weighted(['a', 'b', 'c', 'd'], [1, 2, 3, 4])
+
+    def assertFrequencies(self, values):
+        for value, weight in zip(self.data, self.data.weights):
+            self.assertAlmostEqual(values.count(value) / len(values),
+                                   weight / 10, delta=0.01)
+
+    def test_sample(self):
+        self.assertFrequencies([self.data.sample(self.rnd)
+                                for _ in range(100000)])
+
+    def test_samples(self):
+        self.assertFrequencies(self.data.samples(self.rnd, 100000))
+        self.assertEqual(self.data.samples(Random(2), 10),
+                         self.data.samples(Random(2), 10))
+
+    def test_zero_weight(self):
+        data = Weighted(['a', 'b'], [0, 1])
+        self.assertEqual(set(data.samples(self.rnd, 1000)), {'b'})
+        self.assertRaises(ValueError, Weighted, ['a'], [0])
+        self.assertRaises(ValueError, Weighted, ['a', 'b'], [-1, 2])
+
+    def test_weighted(self):
+        lines = ['New York|8.4', 'Springfield', 'Boston | 0.7']
+        data = weighted(lines)
+        self.assertIsInstance(data, Weighted)
+        self.assertEqual(data, ['New York', 'Springfield', 'Boston'])
+        self.assertEqual(data.weights, (8.4, 1.0, 0.7))
+
+        lines = ['New York', 'Boston']
+        self.assertIs(weighted(lines), lines)
+
+        # Only numbers are weights.
+        lines = ['a|b', 'c||d']
+        self.assertIs(weighted(lines), lines)
+        data = weighted(['x | y|2', 'a|b', '|'])
+        self.assertEqual(data, ['x | y', 'a|b', '|'])
+        self.assertEqual(data.weights, (2.0, 1.0, 1.0))
+
+    def test_pull(self):
+        # Pipe-delimited tables are not weights.
+        self.assertNotIsInstance(pull('countries', LANG), Weighted)
+        self.assertIn(Personal(LANG, seed=1).name('m'),
+                      pull('m_names', LANG))
+
+
+class MarkovTestCase(unittest.TestCase):
+    def setUp(self):
+        self.chain = Chain(['A cat sat on the mat.', 'A dog sat down.'],
+                           ['bird'])
+
+    def test_sentence(self):
+        rnd = Random(1)
+        result = {self.chain.sentence(rnd, mix=0) for _ in range(200)}
+        self.assertEqual(result, {
+            'A cat sat on the mat.', 'A cat sat down.',
+            'A dog sat on the mat.', 'A dog sat down.'})
+
+    def test_mix(self):
+        rnd = Random(2)
+        result = self.chain.sentences(rnd, 50, mix=1)
+        self.assertTrue(all('bird' in sentence for sentence in result))
+        self.assertTrue(all(sentence.startswith('A ') for sentence in result))
+
+    def test_chain(self):
+        self.assertIs(chain('text', LANG), chain('text', LANG))
+        rnd = Random(3)
+        for sentence in chain('text', LANG).sentences(rnd, 50):
+            self.assertTrue(sentence)
+            self.assertEqual(sentence, sentence.strip())
+
+    def test_loop(self):
+        # Sentences end even if the chain loops.
+        loop = Chain(['a b a b a b c.'])
+        self.assertTrue(loop.sentence(Random(4)).endswith('.'))
+
+    def test_text(self):
+        text = Text(LANG, seed=5)
+        paragraph = text.paragraph(quantity=3)
+        self.assertGreater(len(paragraph), 10)
+        self.assertEqual(paragraph, Text(LANG, seed=5).paragraph(3))
+
+        self.assertEqual(len(text.paragraphs(4)), 4)
+        stream = text.text_stream(quantity=2)
+        self.assertNotEqual(next(stream), next(stream))
+
+
+class HashingTestCase(unittest.TestCase):
+    def test_digest(self):
+        self.assertEqual(hash_password('password', 'MD5'),
+                         '5f4dcc3b5aa765d61d8327deb882cf99')
+
+    def test_pbkdf2(self):
+        # Same as django.contrib.auth.hashers.PBKDF2PasswordHasher.
+        self.assertEqual(
+            hash_password('lètmein', 'pbkdf2_sha256', 'seasalt',
+                          iterations=260000),
+            'pbkdf2_sha256$260000$seasalt$YlZ2Vggtqdc61YjArZuoApoBh9JNGYoD'
+            'RBUGu6tcJQo=')
+
+    def test_scrypt(self):
+        result = hash_password('password', 'scrypt', 'salt', cost=16,
+                               block_size=1)
+        self.assertTrue(result.startswith('scrypt$16$salt$1$1$'))
+        self.assertRaises(TypeError, hash_password, 'password', 'scrypt',
+                          'salt', iterations=10)
+
+    def test_threads(self):
+        passwords = [str(i) for i in range(50)]
+        salts = ['salt{0}'.format(i) for i in range(50)]
+        expected = [hash_password(p, 'scrypt', s, cost=16)
+                    for p, s in zip(passwords, salts)]
+        self.assertEqual(hash_passwords(passwords, 'scrypt', salts,
+                                        workers=4, cost=16), expected)
+
+
+class BlobTestCase(unittest.TestCase):
+    def setUp(self):
+        self.text = Text('ru_ru', seed=6)
+
+    def test_size(self):
+        for size in (0, 1, 2, 3, 7, 1024, 70001):
+            for chunk_size in (4, 5, 1000):
+                result = self.text.blob(size, chunk_size=chunk_size)
+                self.assertEqual(len(result), size)
+                # Raises if a character is split.
+                result.decode('utf-8')
+
+    def test_file(self):
+        class File(io.BytesIO):
+            chunks = []
+
+            def write(self, data):
+                self.chunks.append(len(data))
+                return super().write(data)
+
+        file = File()
+        self.assertEqual(self.text.blob(10000, file, chunk_size=512), 10000)
+        self.assertEqual(len(file.getvalue()), 10000)
+        self.assertLessEqual(max(File.chunks), 512)
+
+    def test_blobs(self):
+        result = self.text.blobs(5, 300)
+        self.assertEqual([len(b) for b in result], [300] * 5)
+        self.assertEqual(len(set(result)), 5)
+        self.assertEqual(result, Text('ru_ru', seed=6).bulk('blob', 5, 300))
+
+    def test_writer(self):
+        writer = BlobWriter(iter(['\u00e9' * 10] * 10), separator='')
+        file = io.BytesIO()
+        writer.write(file, 5)
+        # The split character is padded, the next document goes on.
+        self.assertEqual(file.getvalue(), '\u00e9\u00e9 '.encode('utf-8'))
+        writer.write(file, 4)
+        self.assertEqual(file.getvalue()[5:], '\u00e9\u00e9'.encode('utf-8'))
+        self.assertRaises(ValueError, writer.write, file, -1)
+
+
 class AddressTestCase(unittest.TestCase):
     def setUp(self):
         self.address = Address(LANG)
@@ -28,11 +1135,11 @@ class AddressTestCase(unittest.TestCase):
         self.assertTrue(re.match(r'[0-9]{1,5}$', result))
 
     def test_street_name(self):
-        result = self.address.street_name() + '\n'
+        result = self.address.street_name()
         self.assertIn(result, pull('street', self.address.lang))
 
     def test_street_suffix(self):
-        result = self.address.street_suffix() + '\n'
+        result = self.address.street_suffix()
         self.assertIn(result, pull('street_suffix', self.address.lang))
 
     def test_address(self):
@@ -40,7 +1147,7 @@ class AddressTestCase(unittest.TestCase):
         self.assertTrue(len(result) > 6)
 
     def test_state(self):
-        result = self.address.state() + '\n'
+        result = self.address.state()
         self.assertIn(result, pull('states', self.address.lang))
 
     def test_postal_code(self):
@@ -51,14 +1158,18 @@ class AddressTestCase(unittest.TestCase):
             self.assertTrue(re.match(r'[0-9]{5}$', result))
 
     def test_country(self):
-        result = self.address.country() + '\n'
-        self.assertTrue(len(result) > 3)
+        result = self.address.country()
+        self.assertTrue(len(result) > 2)
+
+        result2 = self.address.country(only_iso_code=True)
+        self.assertTrue(len(result2) < 3)
 
-        result2 = self.address.country(only_iso_code=True) + '\n'
-        self.assertTrue(len(result2) < 4)
+    def test_country_record(self):
+        result = self.address.country_record()
+        self.assertIn(result, table('countries', self.address.lang).records)
 
     def test_city(self):
-        result = self.address.city() + '\n'
+        result = self.address.city()
         self.assertIn(result, pull('cities', self.address.lang))
 
 
@@ -70,11 +1181,11 @@ class TextTestCase(unittest.TestCase):
         del self.data
 
     def test_sentence(self):
-        result = self.data.sentence() + '\n'
+        result = self.data.sentence()
         self.assertIn(result, pull('text', self.data.lang))
 
     def test_title(self):
-        result = self.data.title() + '\n'
+        result = self.data.title()
         self.assertIn(result, pull('text', self.data.lang))
 
     def test_words(self):
@@ -85,11 +1196,11 @@ class TextTestCase(unittest.TestCase):
         self.assertEqual(len(result), 1)
 
     def test_word(self):
-        result = self.data.word() + '\n'
+        result = self.data.word()
         self.assertIn(result, pull('words', self.data.lang))
 
     def test_swear_word(self):
-        result = self.data.swear_word() + '\n'
+        result = self.data.swear_word()
         self.assertIn(result, pull('swear_words', self.data.lang))
 
     def test_naughty_strings(self):
@@ -97,15 +1208,15 @@ class TextTestCase(unittest.TestCase):
         self.assertTrue(len(result) > 10)
 
     def test_quote_from_movie(self):
-        result = self.data.quote_from_movie() + '\n'
+        result = self.data.quote_from_movie()
         self.assertIn(result, pull('quotes', self.data.lang))
 
     def test_currency_sio(self):
-        result = self.data.currency_iso() + '\n'
+        result = self.data.currency_iso()
         self.assertIn(result, pull('currency', 'en_us'))
 
     def test_color(self):
-        result = self.data.color() + '\n'
+        result = self.data.color()
         self.assertIn(result, pull('colors', self.data.lang))
 
     def test_hex_color(self):
@@ -116,8 +1227,12 @@ class TextTestCase(unittest.TestCase):
         result = self.data.company_type(abbreviated=True)
         self.assertTrue(len(result) < 7)
 
+    def test_company_type_record(self):
+        result = self.data.company_type_record()
+        self.assertIn(result.abbr, table('company_type', LANG).columns.abbr)
+
     def test_company(self):
-        result = self.data.company() + '\n'
+        result = self.data.company()
         self.assertIn(result, pull('company', self.data.lang))
 
     def test_copyright(self):
@@ -129,7 +1244,7 @@ class TextTestCase(unittest.TestCase):
         self.assertFalse(any(char.isdigit() for char in result))
 
     def test_emoji(self):
-        result = self.data.emoji() + '\n'
+        result = self.data.emoji()
         self.assertIn(result, pull('emoji'))
 
 
@@ -145,10 +1260,10 @@ class PersonalTestCase(unittest.TestCase):
         self.assertTrue(result <= 55)
 
     def test_name(self):
-        result = self.person.name() + '\n'
+        result = self.person.name()
         self.assertIn(result, pull('f_names', self.person.lang))
 
-        result = self.person.name('m') + '\n'
+        result = self.person.name('m')
         self.assertIn(result, pull('m_names', self.person.lang))
 
     def test_telephone(self):
@@ -160,13 +1275,13 @@ class PersonalTestCase(unittest.TestCase):
 
     def test_surname(self):
         if self.person.lang == 'ru_ru':
-            result = self.person.surname('f') + '\n'
+            result = self.person.surname('f')
             self.assertIn(result, pull('f_surnames', self.person.lang))
 
-            result = self.person.surname('m') + '\n'
+            result = self.person.surname('m')
             self.assertIn(result, pull('m_surnames', self.person.lang))
         else:
-            result = self.person.surname() + '\n'
+            result = self.person.surname()
             self.assertIn(result, pull('surnames', self.person.lang))
 
     def test_full_name(self):
@@ -181,6 +1296,46 @@ class PersonalTestCase(unittest.TestCase):
         result = self.person.username('f')
         self.assertTrue(re.match(r'^[a-zA-Z0-9_.-]+$', result))
 
+    def test_unique_usernames(self):
+        result = self.person.usernames(5000, unique=True)
+        result.append(self.person.username(unique=True))
+        result += self.person.usernames(5000, unique=True)
+        self.assertEqual(len(set(result)), 10001)
+        for username in result[:100]:
+            self.assertTrue(re.match(r'^[a-z_.-]+[0-9]+$', username))
+
+        other = Personal(LANG, seed=1).usernames(10, 'f', unique=True)
+        self.assertEqual(other,
+                         Personal(LANG, seed=1).usernames(10, 'f',
+                                                          unique=True))
+
+    def test_unique_emails(self):
+        result = self.person.emails(5000, gender='m', unique=True)
+        result.append(self.person.email('m', unique=True))
+        self.assertEqual(len(set(result)), 5001)
+        self.assertTrue(all('@' in email for email in result))
+
+        stream = self.person._unique_stream('email')
+        self.assertRaises(ValueError, self.person.emails,
+                          stream.left + 1, 'm', True)
+
+    def test_unique_genders(self):
+        # Some names are both male and female.
+        person = Personal(LANG, seed=2)
+        shared = set(pull('m_names', LANG)) & set(pull('f_names', LANG))
+        self.assertTrue(shared)
+        stream = person._unique_stream('username')
+        self.assertEqual(stream.size, len({
+            n.replace(' ', '_').lower()
+            for n in pull('m_names', LANG) + pull('f_names', LANG)}) * 9998)
+
+        result = person.usernames(100000, 'm', unique=True)
+        result += person.usernames(100000, 'f', unique=True)
+        self.assertEqual(len(set(result)), 200000)
+        result = person.emails(50000, 'm', unique=True)
+        result += person.emails(50000, 'f', unique=True)
+        self.assertEqual(len(set(result)), 100000)
+
     def test_twitter(self):
         result = self.person.twitter('f')
         self.assertIsNotNone(result)
@@ -223,6 +1378,62 @@ class PersonalTestCase(unittest.TestCase):
         _sha512 = self.person.password(algorithm='sha512')
         self.assertEqual(len(_sha512), 128)
 
+        _pbkdf2 = self.person.password(algorithm='pbkdf2_sha256',
+                                       iterations=10)
+        self.assertTrue(re.match(r'pbkdf2_sha256\$10\$\w{22}\$', _pbkdf2))
+        self.assertRaises(ValueError, self.person.password, algorithm='rot13')
+
+    def test_profile(self):
+        person = Personal('ru_ru', seed=8)
+        result = person.profiles(50, gender='m') + [person.profile('m')]
+        for profile in result:
+            self.assertEqual(profile.gender, 'Муж.')
+            self.assertIn(profile.name, pull('m_names', 'ru_ru'))
+            self.assertIn(profile.surname, pull('m_surnames', 'ru_ru'))
+            self.assertIn(profile.nationality,
+                          table('nation', 'ru_ru').columns.male)
+            self.assertTrue(re.match(r'^[a-z0-9._]+$', profile.username))
+            self.assertTrue(profile.email.startswith(profile.username + '@'))
+            self.assertTrue(16 <= profile.age <= 66)
+            self.assertTrue(profile.telephone.startswith('+7-'))
+
+        result = Personal(LANG, seed=9).profiles(200)
+        self.assertEqual(result, Personal(LANG, seed=9).bulk('profile', 200))
+        self.assertEqual({p.gender for p in result}, {'Male', 'Female'})
+        for profile in result:
+            names = 'f_names' if profile.gender == 'Female' else 'm_names'
+            self.assertIn(profile.name, pull(names, LANG))
+
+    def test_profile_year(self):
+        result = Personal(LANG, seed=3).profiles(100)
+        self.assertEqual(
+            result, Personal(LANG, seed=3, year=YEAR).profiles(100))
+        shifted = Personal(LANG, seed=3, year=YEAR + 10).profiles(100)
+        self.assertEqual([p.age for p in result], [p.age for p in shifted])
+        self.assertNotEqual([p.username for p in result],
+                            [p.username for p in shifted])
+        for profile, other in zip(result, shifted):
+            born = str(YEAR - profile.age)
+            if born in profile.username:
+                self.assertIn(str(YEAR + 10 - profile.age), other.username)
+
+    def test_romanize(self):
+        self.assertEqual(romanize('Пётр Щукин'), 'petrshchukin')
+        self.assertEqual(romanize("Jürgen O'Groß"), 'jurgenogross')
+
+    def test_passwords(self):
+        result = Personal(LANG, seed=1).passwords(
+            20, algorithm='pbkdf2_sha1', pairs=True, workers=3,
+            iterations=10)
+        self.assertEqual(result, Personal(LANG, seed=1).passwords(
+            20, algorithm='pbkdf2_sha1', pairs=True, workers=1,
+            iterations=10))
+        for plain, hashed in result:
+            salt = hashed.split('$')[2]
+            self.assertEqual(hashed, hash_password(
+                plain, 'pbkdf2_sha1', salt, iterations=10))
+        self.assertEqual(len({hashed for _, hashed in result}), 20)
+
     def test_email(self):
         result = self.person.email()
         self.assertTrue(
@@ -266,6 +1477,46 @@ class PersonalTestCase(unittest.TestCase):
         result = self.person.credit_card_number()
         self.assertTrue(re.match(r'[\d]+((-|\s)?[\d]+)+', result))
 
+        for number in self.person.credit_card_numbers(500, 'visa'):
+            self.assertTrue(re.match(r'4\d{3}( \d{4}){3}$', number))
+            self.assertTrue(luhn_valid(number))
+        for number in self.person.credit_card_numbers(500, 'mc'):
+            self.assertTrue(re.match(r'(5[1-5]|2[2-7])\d\d( \d{4}){3}$',
+                                     number))
+        for number in self.person.credit_card_numbers(500, 'mir'):
+            self.assertTrue(number.startswith('220'))
+        self.assertRaises(KeyError, self.person.credit_card_number, 'bogus')
+
+    def test_credit_card(self):
+        for card in self.person.credit_cards(100, 'amex'):
+            self.assertEqual(card.network, 'amex')
+            self.assertEqual(len(card.number.replace(' ', '')), 15)
+            self.assertTrue(luhn_valid(card.number))
+            self.assertTrue(1000 <= card.cvv <= 9999)
+            month, year = card.expiration_date.split('/')
+            self.assertTrue(1 <= int(month) <= 12)
+            self.assertGreater(int(year), YEAR % 100)
+
+    def test_credit_card_year(self):
+        result = Personal(LANG, seed=5).credit_cards(200, 'mc')
+        self.assertEqual(
+            result, Personal(LANG, seed=5).credit_cards(200, 'mc'))
+        years = {c.expiration_date[-2:] for c in result}
+        self.assertEqual(years, {'25', '26', '27', '28', '29'})
+
+        shifted = Personal(LANG, seed=5, year=2098).credit_cards(200, 'mc')
+        self.assertEqual([c.number for c in result],
+                         [c.number for c in shifted])
+        years = {c.expiration_date[-2:] for c in shifted}
+        self.assertEqual(years, {'99', '00', '01', '02', '03'})
+
+    def test_luhn(self):
+        self.assertTrue(luhn_valid('4111 1111 1111 1111'))
+        self.assertTrue(luhn_valid('378282246310005'))
+        self.assertFalse(luhn_valid('4111 1111 1111 1112'))
+        self.assertFalse(luhn_valid('4111 1111 1111 111x'))
+        self.assertEqual(luhn_digit('7992739871'), '3')
+
     def test_expiration_date(self):
         result = self.person.credit_card_expiration_date(from_=16, to_=25)
         year = result.split('/')[1]
@@ -276,11 +1527,11 @@ class PersonalTestCase(unittest.TestCase):
         self.assertTrue((1000 <= result) and (result <= 9999))
 
     def test_gender(self):
-        result = self.person.gender() + '\n'
+        result = self.person.gender()
         self.assertIn(result, pull('gender', self.person.lang))
 
-        result_abbr = self.person.gender(abbreviated=True) + '\n'
-        self.assertEqual(len(result_abbr), 2)
+        result_abbr = self.person.gender(abbreviated=True)
+        self.assertEqual(len(result_abbr), 1)
 
     def test_height(self):
         result = self.person.height(from_=1.60, to_=1.90)
@@ -294,40 +1545,49 @@ class PersonalTestCase(unittest.TestCase):
     def test_sexual_orientation(self):
         result = self.person.sexual_orientation()
         self.assertIn(
-            result + '\n', pull('sexual_orientation', self.person.lang))
+            result, pull('sexual_orientation', self.person.lang))
 
     def test_profession(self):
-        result = self.person.profession() + '\n'
+        result = self.person.profession()
         self.assertIn(result, pull('professions', self.person.lang))
 
     def test_university(self):
-        result = self.person.university() + '\n'
+        result = self.person.university()
         self.assertIn(result, pull('university', self.person.lang))
 
     def test_qualification(self):
-        result = self.person.qualification() + '\n'
+        result = self.person.qualification()
         self.assertIn(result, pull('qualifications', self.person.lang))
 
     def test_language(self):
-        result = self.person.language() + '\n'
+        result = self.person.language()
         self.assertIn(result, pull('languages', self.person.lang))
 
     def test_favorite_movie(self):
-        result = self.person.favorite_movie() + '\n'
+        result = self.person.favorite_movie()
         self.assertIn(result, pull('favorite_movie', self.person.lang))
 
     def test_worldview(self):
-        result = self.person.worldview() + '\n'
+        result = self.person.worldview()
         self.assertIn(result, pull('worldview', self.person.lang))
 
     def test_views_on(self):
-        result = self.person.views_on() + '\n'
+        result = self.person.views_on()
         self.assertIn(result, pull('views_on', self.person.lang))
 
     def test_political_views(self):
-        result = self.person.political_views() + '\n'
+        result = self.person.political_views()
         self.assertIn(result, pull('political_views', self.person.lang))
 
+    def test_nationality(self):
+        nations = table('nation', self.person.lang).columns
+        self.assertIn(self.person.nationality('m'), nations.male)
+        self.assertIn(self.person.nationality('f'), nations.female)
+
+        record = self.person.nationality_record()
+        self.assertEqual(len(record), 2)
+        self.assertRaises(TypeError, self.person.nationality, 1)
+
     def test_avatar(self):
         result = self.person.avatar()
         self.assertTrue(len(result) > 20)
@@ -341,25 +1601,32 @@ class DatetimeTestCase(unittest.TestCase):
         del self.datetime
 
     def test_day_of_week(self):
-        result = self.datetime.day_of_week() + '\n'
-        self.assertGreater(len(result), 4)
+        result = self.datetime.day_of_week()
+        self.assertGreater(len(result), 3)
 
         result_abbr = self.datetime.day_of_week(abbreviated=True)
         self.assertTrue(len(result_abbr) < 6 or '.' in result_abbr)
 
     def test_month(self):
-        result = self.datetime.month() + '\n'
-        self.assertGreater(len(result), 3)
+        result = self.datetime.month()
+        self.assertGreater(len(result), 2)
 
         result_abbr = self.datetime.month(abbreviated=True)
         self.assertLess(len(result_abbr), 6)
 
+    def test_records(self):
+        day = self.datetime.day_of_week_record()
+        self.assertIn(day, table('days', self.datetime.lang).records)
+
+        month = self.datetime.month_record()
+        self.assertIn(month, table('months', self.datetime.lang).records)
+
     def test_year(self):
         result = self.datetime.year(from_=2000, to_=2016)
         self.assertTrue((result >= 2000) and (result <= 2016))
 
     def test_periodicity(self):
-        result = self.datetime.periodicity() + '\n'
+        result = self.datetime.periodicity()
         self.assertIn(result, pull('periodicity', self.datetime.lang))
 
     def test_day_of_month(self):
@@ -367,6 +1634,234 @@ class DatetimeTestCase(unittest.TestCase):
         self.assertTrue((result >= 1) or (result <= 31))
 
 
+class DatesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.timestamps = Datetime(LANG, seed=12).timestamps(500)
+
+    def expected(self, pattern, utc_offset=0):
+        tz = timezone(timedelta(seconds=utc_offset))
+        return [datetime.fromtimestamp(t, tz).strftime(pattern)
+                for t in self.timestamps]
+
+    def test_strftime(self):
+        for pattern in ('%Y-%m-%d %H:%M:%S %z', '%a %b %d %I:%M %p %j %y',
+                        '{%H} %d {%M} %%', '%A, %d %B %Y', '%H:%M:%S'):
+            for utc_offset in (0, 5 * 3600 + 1800, -8 * 3600):
+                result = Formatter(pattern, None, utc_offset).format(
+                    self.timestamps)
+                self.assertEqual(result, self.expected(pattern, utc_offset))
+
+    def test_iso(self):
+        tz = timezone(timedelta(hours=3))
+        self.assertEqual(
+            Formatter('iso', utc_offset=3 * 3600).format(self.timestamps),
+            [datetime.fromtimestamp(t, tz).isoformat()
+             for t in self.timestamps])
+
+        ms = [t * 1000 + 7 for t in self.timestamps]
+        result = Formatter('iso_ms', unit='ms').format(ms)
+        self.assertTrue(all(r.endswith('.007000+00:00') for r in result))
+        self.assertEqual(Formatter('clf', 'de_de')(0),
+                         '01/Jan/1970:00:00:00 +0000')
+
+    def test_locale(self):
+        names = table('months', 'ru_ru').columns.name
+        result = Formatter('%B', 'ru_ru').format(self.timestamps)
+        self.assertTrue(set(result) <= set(names))
+        self.assertRaises(ValueError, Formatter, '%Q')
+
+    def test_datetime(self):
+        dt = Datetime(LANG, seed=13)
+        for value in dt.datetimes(100, date(2020, 1, 1), date(2020, 2, 1),
+                                  utc_offset=3600):
+            self.assertEqual(value.utcoffset(), timedelta(hours=1))
+            self.assertEqual(value.astimezone(timezone.utc).month, 1)
+
+        for value in dt.formatted_datetimes(100, 'date', 0, 86400):
+            self.assertEqual(value, '1970-01-01')
+        self.assertTrue(0 <= dt.timestamp(0, 10, unit='ms') < 10000)
+
+    def test_with_time(self):
+        result = Datetime(LANG, seed=14).dates(200, sep='/', with_time=True)
+        for value in result:
+            self.assertTrue(re.match(r'\d\d/\d\d/20[0-3]\d \d\d:\d\d$',
+                                     value))
+        # Time isn't the month and the day anymore.
+        self.assertTrue(any(v[11:] != v[3:5] + ':' + v[:2]
+                            for v in result))
+
+
+class EventsTestCase(unittest.TestCase):
+    use_numpy = False
+    # Monday, 2024-01-01 00:00 UTC.
+    start = 1704067200
+
+    def setUp(self):
+        self.datetime = Datetime(LANG, seed=11)
+
+    def events(self, *args, **kwargs):
+        kwargs['use_numpy'] = self.use_numpy
+        return list(self.datetime.events(*args, **kwargs))
+
+    def test_poisson(self):
+        result = self.events(self.start, self.start + 10000, rate=2.0)
+        self.assertEqual(result, sorted(result))
+        self.assertTrue(all(self.start <= t < self.start + 10000
+                            for t in result))
+        # Mean is 20000, standard deviation is about 141.
+        self.assertLess(abs(len(result) - 20000), 1000)
+
+    def test_seasonality(self):
+        seasonality = Seasonality(weekly=None)
+        result = self.events(self.start, self.start + 86400, rate=1.0,
+                             seasonality=seasonality)
+        night = sum(1 for t in result if t < self.start + 3600 * 4)
+        day = sum(1 for t in result
+                  if self.start + 3600 * 12 <= t < self.start + 3600 * 16)
+        self.assertGreater(day, night * 4)
+
+        sunday = self.start + 86400 * 6
+        weekend = self.events(sunday, sunday + 86400, rate=1.0,
+                              seasonality=Seasonality(diurnal=None))
+        self.assertLess(len(weekend), 86400 * 0.9)
+
+    def test_bursts(self):
+        seasonality = Seasonality(None, None, bursts=1.0, burst_factor=50,
+                                  burst_duration=60)
+        segments = list(seasonality.segments(Random(1), 1.0, self.start,
+                                             self.start + 7200))
+        self.assertEqual(sum(b - a for a, b, _ in segments), 7200)
+        self.assertEqual(sum(b - a for a, b, rate in segments
+                             if rate == 50), 120)
+
+    def test_units(self):
+        result = self.events(self.start, self.start + 100, unit='ms')
+        self.assertEqual(result, sorted(result))
+        self.assertTrue(all(self.start * 1000 <= t < (self.start + 100) * 1000
+                            for t in result))
+        self.assertRaises(KeyError, self.events, 0, 10, unit='ns')
+
+    def test_datetimes(self):
+        start = datetime(2024, 1, 1)
+        result = self.events(start, start + timedelta(minutes=10),
+                             datetimes=True)
+        self.assertTrue(result)
+        self.assertTrue(all(str(t).startswith('2024-01-01') for t in result))
+
+    def test_stream(self):
+        stream = self.datetime.event_stream(self.start, rate=0.1,
+                                            chunk=3600,
+                                            use_numpy=self.use_numpy)
+        chunks = [list(next(stream)) for _ in range(5)]
+        for i, chunk in enumerate(chunks):
+            first = self.start + 3600 * i
+            self.assertTrue(all(first <= t < first + 3600 for t in chunk))
+        self.assertTrue(all(chunk == sorted(chunk) for chunk in chunks))
+
+    def test_seed(self):
+        first = Datetime(LANG, seed=1).events(0, 1000,
+                                              use_numpy=self.use_numpy)
+        second = Datetime(LANG, seed=1).events(0, 1000,
+                                               use_numpy=self.use_numpy)
+        self.assertEqual(list(first), list(second))
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class NumpyEventsTestCase(EventsTestCase):
+    use_numpy = True
+
+
+class AccessLogTestCase(unittest.TestCase):
+    use_numpy = False
+    start = 1704067200
+    clf = re.compile(r'^([\d.]+) - (\S+) \[(\d\d/\w{3}/\d{4}:[\d:]{8}) '
+                     r'\+0000\] "(\w+) (\S+) HTTP/1.1" (\d{3}) (\d+|-)'
+                     r'(?: "([^"]*)" "([^"]*)")?$')
+
+    def log(self, fmt='combined', **kwargs):
+        kwargs.setdefault('seed', 5)
+        return AccessLog(fmt, use_numpy=self.use_numpy, **kwargs)
+
+    def test_combined(self):
+        lines = self.log(rate=50.0).lines(2000, self.start)
+        self.assertEqual(len(lines), 2000)
+        times = []
+        for line in lines:
+            match = self.clf.match(line)
+            self.assertIsNotNone(match, line)
+            self.assertTrue(line.endswith('\n'))
+            self.assertIn(match.group(9), pull('useragents', 'en_us'))
+            if match.group(6) in ('204', '304'):
+                self.assertEqual(match.group(7), '-')
+            times.append(datetime.strptime(match.group(3),
+                                           '%d/%b/%Y:%H:%M:%S'))
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(times[0].date(), date(2024, 1, 1))
+        # 2000 requests at 50 per second.
+        self.assertLess((times[-1] - times[0]).total_seconds(), 60)
+
+    def test_distributions(self):
+        log = self.log('common', paths={'/a': 1, '/b': 3}, methods={'PUT': 1},
+                       statuses={404: 1}, networks='10.0.0.0/8',
+                       clients=10, users=1.0)
+        lines = log.lines(4000, self.start)
+        matches = [self.clf.match(line) for line in lines]
+        self.assertTrue(all(m.group(8) is None for m in matches))
+        self.assertEqual({m.group(4) for m in matches}, {'PUT'})
+        self.assertEqual({m.group(6) for m in matches}, {'404'})
+        self.assertTrue(all(m.group(1).startswith('10.') for m in matches))
+        self.assertLessEqual(len({m.group(1) for m in matches}), 10)
+        self.assertNotIn('-', {m.group(2) for m in matches})
+        paths = [m.group(5) for m in matches]
+        self.assertGreater(paths.count('/b'), paths.count('/a') * 2)
+        self.assertRaises(KeyError, AccessLog, 'xml')
+
+    def test_json(self):
+        log = self.log('json', unit='ms', utc_offset=3600)
+        records = [json.loads(line) for line in log.lines(500, self.start)]
+        self.assertEqual(set(records[0]), {
+            'remote_addr', 'remote_user', 'time_local', 'request', 'status',
+            'body_bytes_sent', 'http_referer', 'http_user_agent'})
+        times = [datetime.fromisoformat(r['time_local']) for r in records]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(times[0].utcoffset(), timedelta(hours=1))
+        for record in records:
+            self.assertIsInstance(record['status'], int)
+            self.assertIsInstance(record['body_bytes_sent'], int)
+
+    def test_seed(self):
+        self.assertEqual(self.log(seed=Random(7)).lines(100, self.start),
+                         self.log(seed=7).lines(100, self.start))
+
+    def test_genders(self):
+        # Clients have their own genders.
+        log = self.log('common', clients=200, users=1.0)
+        names = {self.clf.match(line).group(2).rstrip('0123456789')
+                 for line in log.lines(2000, self.start)}
+        m_names = {n.lower() for n in pull('m_names', 'en_us')}
+        f_names = {n.lower() for n in pull('f_names', 'en_us')}
+        self.assertTrue(names & (m_names - f_names))
+        self.assertTrue(names & (f_names - m_names))
+
+    def test_write(self):
+        file = io.StringIO()
+        self.assertEqual(self.log().write(file, self.start, lines=1234), 1234)
+        text = file.getvalue()
+        self.assertEqual(text.splitlines(keepends=True),
+                         self.log().lines(1234, self.start))
+
+        file = io.StringIO()
+        count = self.log(rate=10.0).write(file, self.start, self.start + 600)
+        self.assertEqual(count, file.getvalue().count('\n'))
+        self.assertLess(abs(count - 6000), 500)
+        self.assertRaises(ValueError, self.log().write, file)
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class NumpyAccessLogTestCase(AccessLogTestCase):
+    use_numpy = True
+
+
 class NetworkTestCase(unittest.TestCase):
     def setUp(self):
         self.net = Network()
@@ -403,9 +1898,71 @@ class NetworkTestCase(unittest.TestCase):
         self.assertTrue(re.match(mac_pattern, result))
 
     def test_user_agent(self):
-        result = self.net.user_agent() + '\n'
+        result = self.net.user_agent()
         self.assertIn(result, pull('useragents', 'en_us'))
 
+    def test_ip_address(self):
+        blocks = [ipaddress.ip_network(n) for n in RESERVED_V4]
+        result = self.net.ip_addresses(500, exclude=RESERVED_V4, fmt='object')
+        result.append(self.net.ip_address(exclude=RESERVED_V4, fmt='object'))
+        for address in result:
+            self.assertFalse(any(address in block for block in blocks))
+
+        networks = ['10.0.0.0/24', '192.168.0.0/16']
+        blocks = [ipaddress.ip_network(n) for n in networks]
+        excluded = ipaddress.ip_network('192.168.128.0/17')
+        for address in self.net.ip_addresses(500, networks, excluded.exploded):
+            address = ipaddress.ip_address(address)
+            self.assertTrue(any(address in block for block in blocks))
+            self.assertNotIn(address, excluded)
+
+        result = self.net.ip_addresses(
+            100, '2001:db8::/64', fmt='object') + self.net.ip_addresses(
+            100, '::/0', RESERVED_V6, fmt='object')
+        for address in result:
+            self.assertEqual(address.version, 6)
+        self.assertIn(result[0], ipaddress.ip_network('2001:db8::/64'))
+
+    def test_ip_address_formats(self):
+        space = address_space('10.0.0.0/30')
+        self.assertEqual(space.format([167772161], 'str'), ['10.0.0.1'])
+        self.assertEqual(space.format([167772161], 'bytes'),
+                         [bytes([10, 0, 0, 1])])
+        self.assertEqual(space.format([167772161], 'object'),
+                         [ipaddress.ip_address('10.0.0.1')])
+        self.assertEqual(address_space('::/0').format([1]), ['::1'])
+        self.assertRaises(KeyError, space.format, [1], 'hex')
+        self.assertRaises(ValueError, address_space, ('10.0.0.0/8', '::/0'))
+        self.assertRaises(ValueError, address_space, '10.0.0.0/8',
+                          '10.0.0.0/7')
+
+        self.assertEqual(space.size, 4)
+        self.assertEqual(address_space('10.0.0.0/30', hosts=True).size, 2)
+        self.assertEqual(address_space(('10.0.0.0/30', '10.0.0.2/31',
+                                        '10.0.0.4/30')).size, 8)
+
+    def test_unique_ip_address(self):
+        net = Network(seed=3)
+        result = net.ip_addresses(5, '10.0.0.0/29', hosts=True, unique=True)
+        result.append(net.ip_address('10.0.0.0/29', hosts=True, unique=True))
+        self.assertEqual(sorted(result, key=ipaddress.ip_address),
+                         ['10.0.0.{0}'.format(i) for i in range(1, 7)])
+        self.assertRaises(ValueError, net.ip_address, '10.0.0.0/29',
+                          hosts=True, unique=True)
+
+        # The space is not materialized.
+        result = net.ip_addresses(100000, '10.0.0.0/8', unique=True,
+                                  fmt='int')
+        result += net.ip_addresses(100000, '10.0.0.0/8', unique=True,
+                                   fmt='int')
+        self.assertEqual(len(set(result)), 200000)
+        self.assertTrue(all(167772160 <= a < 184549376 for a in result))
+
+        net = Network(seed=4)
+        self.assertEqual(net.ip_addresses(10, '10.0.0.0/8', unique=True),
+                         Network(seed=4).ip_addresses(10, '10.0.0.0/8',
+                                                      unique=True))
+
 
 class FileTestCase(unittest.TestCase):
     def setUp(self):
@@ -434,15 +1991,15 @@ class ScienceTestCase(unittest.TestCase):
         del self.science
 
     def test_math_formula(self):
-        result = self.science.math_formula() + '\n'
+        result = self.science.math_formula()
         self.assertIn(result, pull('math_formula', 'en_us'))
 
     def test_article_on_wiki(self):
-        result = self.science.article_on_wiki() + '\n'
+        result = self.science.article_on_wiki()
         self.assertIn(result, pull('science_wiki', self.science.lang))
 
     def test_scientist(self):
-        result = self.science.scientist() + '\n'
+        result = self.science.scientist()
         self.assertIn(result, pull('scientist', self.science.lang))
 
     def test_chemical_element(self):
@@ -451,6 +2008,11 @@ class ScienceTestCase(unittest.TestCase):
 
         _result = self.science.chemical_element(name_only=False)
         self.assertIsInstance(_result, dict)
+        self.assertEqual(set(_result),
+                         {'name', 'symbol', 'atomic_number'})
+
+        record = self.science.chemical_element_record()
+        self.assertTrue(record.atomic_number.isdigit())
 
 
 class DevelopmentTestCase(unittest.TestCase):
@@ -477,7 +2039,7 @@ class DevelopmentTestCase(unittest.TestCase):
         self.assertIn(result, _license)
 
     def test_programming_language(self):
-        result = self.dev.programming_language() + '\n'
+        result = self.dev.programming_language()
         self.assertIn(result, pull('pro_lang', 'en_us'))
 
     def test_database(self):
@@ -512,10 +2074,10 @@ class DevelopmentTestCase(unittest.TestCase):
         self.assertIn(result, _list)
 
     def test_framework(self):
-        result = self.dev.framework(_type='front') + '\n'
+        result = self.dev.framework(_type='front')
         self.assertIn(result, pull('frontend'))
 
-        _result = self.dev.framework(_type='back') + '\n'
+        _result = self.dev.framework(_type='back')
         self.assertIn(_result, pull('backend'))
 
     def test_stack_of_tech(self):
@@ -523,11 +2085,11 @@ class DevelopmentTestCase(unittest.TestCase):
         self.assertIsInstance(result, dict)
 
     def test_github_repo(self):
-        url = self.dev.github_repo() + '\n'
+        url = self.dev.github_repo()
         self.assertIn(url, pull('github_repos'))
 
     def test_os(self):
-        result = self.dev.os() + '\n'
+        result = self.dev.os()
         self.assertIn(result, pull('os'))
 
 
@@ -539,31 +2101,31 @@ class FoodTestCase(unittest.TestCase):
         del self.food
 
     def test_berry(self):
-        result = self.food.berry() + '\n'
+        result = self.food.berry()
         self.assertIn(result, pull('berries', self.food.lang))
 
     def test_vegetable(self):
-        result = self.food.vegetable() + '\n'
+        result = self.food.vegetable()
         self.assertIn(result, pull('vegetables', self.food.lang))
 
     def test_fruit(self):
-        result = self.food.fruit() + '\n'
+        result = self.food.fruit()
         self.assertIn(result, pull('fruits', self.food.lang))
 
     def test_dish(self):
-        result = self.food.dish() + '\n'
+        result = self.food.dish()
         self.assertIn(result, pull('dishes', self.food.lang))
 
     def test_alcoholic_drink(self):
-        result = self.food.alcoholic_drink() + '\n'
+        result = self.food.alcoholic_drink()
         self.assertIn(result, pull('alcoholic_drinks', self.food.lang))
 
     def test_spices(self):
-        result = self.food.spices() + '\n'
+        result = self.food.spices()
         self.assertIn(result, pull('spices', self.food.lang))
 
     def test_mushroom(self):
-        result = self.food.mushroom() + '\n'
+        result = self.food.mushroom()
         self.assertIn(result, pull('mushrooms', self.food.lang))
 
 
@@ -699,5 +2261,5 @@ class HardwareTestCase(unittest.TestCase):
         self.assertGreater(len(result), 15)
 
     def test_phone_model(self):
-        result = self.hard.phone_model() + '\n'
+        result = self.hard.phone_model()
         self.assertIn(result, pull('phone_models', 'en_us'))